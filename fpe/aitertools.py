@@ -0,0 +1,321 @@
+import asyncio
+from collections import deque
+from inspect import isawaitable
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Deque, Iterable, NoReturn, Optional, Tuple, Union
+
+from fpe.asserts import AssertNonCallable, AssertWrongValue
+from fpe.functions import curry, staticCurry
+
+
+# default number of concurrent calls of amap
+AMAP_LIMIT = 64
+
+AnyIterable = Union[Iterable, AsyncIterable]
+
+
+async def _aiter_sync(iterable: Iterable) -> AsyncIterator:
+    for i in iterable:
+        yield i
+
+
+def aiter_(iterable: AnyIterable) -> AsyncIterator:
+    """Return async iterator of async or ordinary iterable.
+
+    Unlike builtin aiter, ordinary iterables are accepted as well.
+    E.g.
+        async for line in aiter_(lines):
+            ...
+    """
+
+    if hasattr(iterable, "__aiter__"):
+        return iterable.__aiter__()
+
+    return _aiter_sync(iterable)
+
+
+async def _await(value: Any) -> Any:
+    """Return awaited value if it is awaitable, otherwise value as is.
+
+    So that async and ordinary functions may be used interchangeably.
+    """
+
+    if isawaitable(value):
+        return await value
+
+    return value
+
+
+@curry
+async def take(num: int, iterable: AnyIterable) -> Union[AsyncIterator, NoReturn]:
+    """Return first num items of the async iterable.
+
+    Not more than num items are requested from iterable.
+    """
+
+    if num <= 0:
+        return
+
+    async for i in aiter_(iterable):
+        yield i
+        num -= 1
+
+        if not num:
+            return
+
+
+@curry
+async def drop(num: int, iterable: AnyIterable) -> Union[AsyncIterator, NoReturn]:
+    """Skipping first num items of the async iterable and return rest of them."""
+
+    async for i in aiter_(iterable):
+        if num > 0:
+            num -= 1
+            continue
+
+        yield i
+
+
+@curry
+async def takeWhile(predicate: Callable[..., bool], iterable: AnyIterable) -> Union[AsyncIterator, NoReturn]:
+    """The same as itertools.takewhile but async and curried, predicate may be async function."""
+
+    async for i in aiter_(iterable):
+        if not await _await(predicate(i)):
+            return
+
+        yield i
+
+
+@curry
+async def dropWhile(predicate: Callable[..., bool], iterable: AnyIterable) -> Union[AsyncIterator, NoReturn]:
+    """The same as itertools.dropwhile but async and curried, predicate may be async function."""
+
+    dropping = True
+
+    async for i in aiter_(iterable):
+        if dropping and await _await(predicate(i)):
+            continue
+
+        dropping = False
+        yield i
+
+
+@curry
+async def accumulate_(func: Callable, iterable: AnyIterable) -> Union[AsyncIterator, NoReturn]:
+    """Async version of fpe.itertools.accumulate_, func may be async function.
+
+    Literally accumulate(iterable, func)
+    """
+
+    iterator = aiter_(iterable)
+
+    try:
+        total = await iterator.__anext__()
+
+    except StopAsyncIteration:
+        return
+
+    yield total
+
+    async for i in iterator:
+        total = await _await(func(total, i))
+        yield total
+
+
+@staticCurry(3)
+async def zipWith(func: Callable, iterable: AnyIterable, *args: AnyIterable) -> Union[AsyncIterator, NoReturn]:
+    """Async version of fpe.itertools.zipWith, func may be async function.
+
+    zipWith retracts 1st as function that will be applied on items,
+    2nd as first iterable and waiting for other, at least one more, iterables.
+    It stops on the shortest iterable, as map does.
+    """
+
+    iterators = [aiter_(i) for i in (iterable,) + args]
+
+    while True:
+        try:
+            items = [await i.__anext__() for i in iterators]
+
+        except StopAsyncIteration:
+            return
+
+        yield await _await(func(*items))
+
+
+@staticCurry(3)
+async def zipPad(pad: Any, iterable: AnyIterable, *args: AnyIterable) -> Union[AsyncIterator, NoReturn]:
+    """Async version of fpe.itertools.zipPad.
+
+    zipPad retracts pad as padding, iterable as first iterable and
+    waits for more, at least one more, iterables.
+    """
+
+    iterators: Tuple[Optional[AsyncIterator], ...] = tuple(aiter_(i) for i in (iterable,) + args)
+
+    while True:
+        items = []
+        active = []
+
+        for i in iterators:
+            if i is not None:
+                try:
+                    items.append(await i.__anext__())
+                    active.append(i)
+                    continue
+
+                except StopAsyncIteration:
+                    pass
+
+            items.append(pad)
+            active.append(None)
+
+        iterators = tuple(active)
+
+        if not any(i is not None for i in iterators):
+            return
+
+        yield tuple(items)
+
+
+@curry
+async def collect(predicate: Callable[..., bool], func: Callable,
+                  iterable: AnyIterable) -> Union[AsyncIterator, NoReturn]:
+    """Async version of fpe.itertools.collect, predicate and func may be async functions.
+
+    Literally map(func, filter(predicate, iterable))
+    """
+
+    async for i in aiter_(iterable):
+        if await _await(predicate(i)):
+            yield await _await(func(i))
+
+
+class _Partition:
+    """Shared state of both parts of partitioned async iterable.
+
+    Items are requested from source by the part which needs them and items
+    of another part are kept in its buffer, so that source is iterated once.
+    """
+
+    def __init__(self, predicate: Callable[..., bool], iterable: AnyIterable):
+        self.predicate = predicate
+        self.source = aiter_(iterable)
+        # buffers of items which do not and do satisfy predicate
+        self.buffers: Tuple[Deque[Any], Deque[Any]] = (deque(), deque())
+        self.exhausted = False
+        self.lock: Optional[asyncio.Lock] = None
+
+    async def _pull(self, part: bool):
+        # lock is created lazily, so that it belongs to running loop
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+
+        async with self.lock:
+            # other part may have already pulled item for this part
+            if self.buffers[part] or self.exhausted:
+                return
+
+            try:
+                item = await self.source.__anext__()
+
+            except StopAsyncIteration:
+                self.exhausted = True
+                return
+
+            self.buffers[bool(await _await(self.predicate(item)))].append(item)
+
+    async def part(self, part: bool) -> AsyncIterator:
+        buffer = self.buffers[part]
+
+        while True:
+            while buffer:
+                yield buffer.popleft()
+
+            if self.exhausted:
+                return
+
+            await self._pull(part)
+
+
+@curry
+def partition(predicate: Callable[..., bool],
+              iterable: AnyIterable) -> Union[Tuple[AsyncIterator, AsyncIterator], NoReturn]:
+    """Async version of fpe.itertools.partition, predicate may be async function.
+
+    It returns tuple from filtered and rest items async iterators.
+    Source is iterated once and predicate is called once for every item,
+    items are buffered only while another part is behind.
+    """
+
+    # only callable
+    assert callable(predicate), AssertNonCallable()
+
+    state = _Partition(predicate, iterable)
+
+    return state.part(True), state.part(False)
+
+
+async def _amap(func: Callable, iterable: AnyIterable, limit: int, ordered: bool) -> AsyncIterator:
+
+    iterator = aiter_(iterable)
+    pending = deque() if ordered else set()
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(pending) < limit:
+                try:
+                    item = await iterator.__anext__()
+
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+
+                task = asyncio.ensure_future(_await(func(item)))
+
+                if ordered:
+                    pending.append(task)
+
+                else:
+                    pending.add(task)
+
+            if not pending:
+                return
+
+            if ordered:
+                yield await pending.popleft()
+
+            else:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    yield task.result()
+
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+@curry
+def amap(func: Callable, iterable: AnyIterable, limit: int = AMAP_LIMIT,
+         ordered: bool = True) -> Union[AsyncIterator, NoReturn]:
+    """Concurrent async map, func is usually async function.
+
+    Not more than limit calls are awaited at the same time, so that iterable
+    is consumed as results are consumed. Results are yielded in order of items
+    if ordered is True, otherwise as they are completed.
+    E.g.
+        async for page in amap(fetch, urls, limit=10):
+            ...
+
+    Note.
+        Exception of any call is raised by the async iterator, rest of calls are cancelled.
+    """
+
+    # only callable
+    assert callable(func), AssertNonCallable()
+    # only positive limit
+    assert isinstance(limit, int) and limit > 0, AssertWrongValue(str(limit), "positive int")
+
+    return _amap(func, iterable, limit, ordered)
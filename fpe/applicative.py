@@ -3,7 +3,7 @@ from typing import Any, Callable
 
 from fpe.asserts import AssertNonCallable, AssertWrongArgumentType
 
-from fpe.functions import enrichFunction, curry
+from fpe.functions import enrichFunction, curry, staticCurry
 
 from fpe.functor import AbstractFunctor
 
@@ -56,6 +56,26 @@ class AbstractApplicative(AbstractFunctor):
         """
         pass
 
+    @classmethod
+    def liftA(cls, func: Callable, instance: "AbstractApplicative",
+              *instances: "AbstractApplicative") -> "AbstractApplicative":
+        """Lift a function of any number of arguments to actions.
+
+        Generalization of liftA, liftA2, liftA3 and so on.
+        Defined as liftA f x y z ... = f <$> x <*> y <*> z ...
+        It should be redefined if there is more efficient way.
+        """
+
+        if not instances:
+            return instance | func
+
+        result = instance | staticCurry(len(instances) + 1)(func)
+
+        for i in instances:
+            result = result % i
+
+        return result
+
 
 @curry
 def apply(pured_func: AbstractApplicative, instance: AbstractApplicative) -> AbstractApplicative:
@@ -69,3 +89,21 @@ def apply(pured_func: AbstractApplicative, instance: AbstractApplicative) -> Abs
     assert isinstance(instance, AbstractApplicative), AssertWrongArgumentType("AbstractApplicative")
 
     return pured_func % instance
+
+
+def liftA(func: Callable, instance: AbstractApplicative, *instances: AbstractApplicative) -> AbstractApplicative:
+    """Common lift function of any number of arguments to actions.
+
+    Thus liftA(f, x, y, z) == f <$> x <*> y <*> z
+    E.g.
+        liftA(max, Right(1), Right(42), Right(3)) == Right(42)
+        liftA(max, Just(1), Nothing(), Just(3)) == Nothing()
+    """
+
+    # only callable
+    assert callable(func), AssertNonCallable()
+    # only Applicative
+    assert all(isinstance(i, AbstractApplicative) for i in (instance,) + instances), AssertWrongArgumentType(
+        "AbstractApplicative")
+
+    return type(instance).liftA(func, instance, *instances)
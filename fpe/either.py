@@ -3,6 +3,7 @@ from typing import Any, Callable, Collection, Generator, NoReturn, Tuple, Union
 
 from fpe.asserts import AssertNonCallable, AssertWrongArgumentType
 from fpe.functions import curry, enrichFunction
+from fpe.functor import LazyFunctor
 from fpe.monad import AbstractMonad
 from fpe.semigroup import AbstractSemigroup
 
@@ -69,7 +70,30 @@ class Either(AbstractMonad, AbstractSemigroup):
         # only Either
         assert isinstance(either1, Either) and isinstance(either2, Either), AssertWrongArgumentType("Either")
 
-        return (either1 | func) % either2
+        return Either.liftA(func, either1, either2)
+
+    @staticmethod
+    def liftA(func: Callable, *eithers: Eithers) -> Eithers:
+        """Implementation of liftA of any number of arguments from ApplicativeFunctor.
+
+        It applies function to all Either embraced values at once, without
+        any intermediate Either or curried function. The first Left is
+        returned if there is any.
+        E.g.
+            liftA(max, Right(1), Right(42), Right(3)) == Right(42)
+            liftA(max, Right(1), Left("ZeroDivision"), Right(3)) == Left("ZeroDivision")
+        """
+
+        # only callable
+        assert callable(func), AssertNonCallable()
+        # at least one Either
+        assert eithers and all(isinstance(i, Either) for i in eithers), AssertWrongArgumentType("Either")
+
+        for either in eithers:
+            if not either._railway:
+                return either
+
+        return Right(func(*[i._value for i in eithers]))
 
     @property
     def value(self) -> NoReturn:
@@ -91,6 +115,15 @@ class Either(AbstractMonad, AbstractSemigroup):
     def __repr__(self):
         return "{}: {}".format(self.__class__.__name__, self._value)
 
+    def lazy(self) -> Eithers:
+        """Return Either which defers fmap calls until its value is needed.
+
+        Left does not apply any function, so it is returned as is.
+        See LazyRight for details.
+        """
+
+        return self
+
 
 class Left(Either):
     """Left class for representation failed computation.
@@ -98,6 +131,8 @@ class Left(Either):
     Borrowed from Left :: a -> Either a b
     """
 
+    _railway = False
+
     def __init__(self, value: Any):
         self._value = value
 
@@ -124,6 +159,8 @@ class Right(Either):
     Borrowed from Right :: b -> Either a b
     """
 
+    _railway = True
+
     def __init__(self, value: Any):
         self._value = value
 
@@ -157,6 +194,25 @@ class Right(Either):
 
         return self
 
+    def lazy(self) -> "LazyRight":
+        """Return LazyRight which defers fmap calls until its value is needed.
+
+        E.g.
+            Right(42).lazy() | neg | abs | str == Right("42")
+        """
+
+        return LazyRight(self._value)
+
+
+class LazyRight(LazyFunctor, Right):
+    """Right class which defers and fuses fmap calls, see fpe.functor.LazyFunctor.
+
+    E.g.
+        Right(x).lazy() | f | g | h == Right(h(g(f(x))))
+    """
+
+    _strict = Right
+
 
 @enrichFunction
 def lefts(seq: Union[EitherCollection, EitherGenerator]) -> Tuple[Left, ...]:
@@ -1,13 +1,94 @@
-from typing import NoReturn, Union
+import asyncio
+from inspect import isawaitable, iscoroutine
+from typing import (Any, Awaitable, Callable, Dict, Iterable, Iterator, List, NoReturn, Optional, Tuple,
+                    Type, Union)
 
 from fpe.either import Left, Right, Eithers
-from fpe.asserts import AssertNonCallable
-from fpe.functions import enrichFunction
+from fpe.asserts import AssertNonCallable, AssertWrongValue
+from fpe.functions import Function, curry, enrichFunction, id_
 
 
 FATAL_EXCEPTIONS = (AssertionError, EOFError, GeneratorExit, ImportError, KeyboardInterrupt,
                     MemoryError, NameError, ReferenceError, RuntimeError, SyntaxError, SystemError, SystemExit)
 
+# cancellation has to be propagated by coroutines, but
+# CancelledError is Exception heir before python 3.8
+ASYNC_FATAL_EXCEPTIONS = FATAL_EXCEPTIONS + (asyncio.CancelledError,)
+
+
+class ExceptionSummary:
+    """Lightweight representation of caught exception.
+
+    It keeps exception type, message and origin of exception, which is
+    tuple of file name, line number and function name of the frame where
+    exception was raised, or None if exception was not raised yet.
+    Summary does not refer to exception and its traceback, so that frames
+    and their locals may be freed.
+    """
+
+    __slots__ = ("type", "message", "origin")
+
+    def __init__(self, type_: Type[BaseException], message: str, origin: Optional[Tuple[str, int, str]]):
+        self.type = type_
+        self.message = message
+        self.origin = origin
+
+    def __eq__(self, other) -> bool:
+
+        if type(self) is not type(other):
+            return False
+
+        return (self.type, self.message, self.origin) == (other.type, other.message, other.origin)
+
+    def __ne__(self, other) -> bool:
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return "{}: {}('{}') at {}".format(self.__class__.__name__, self.type.__name__, self.message, self.origin)
+
+
+@enrichFunction
+def stripTraceback(exc: BaseException) -> BaseException:
+    """Drop traceback of given exception and all its chained exceptions.
+
+    Exception is changed in place and returned. Frames and their locals
+    are not referenced by exception anymore.
+    """
+
+    chain = [exc]
+    seen = set()
+
+    while chain:
+        current = chain.pop()
+
+        if current is None or id(current) in seen:
+            continue
+
+        seen.add(id(current))
+        current.__traceback__ = None
+        chain.extend((current.__cause__, current.__context__))
+
+    return exc
+
+
+@enrichFunction
+def summariseException(exc: BaseException) -> ExceptionSummary:
+    """Return ExceptionSummary of given exception.
+
+    Origin is taken from the innermost frame of exception traceback.
+    """
+
+    tb = exc.__traceback__
+    origin = None
+
+    if tb is not None:
+        while tb.tb_next is not None:
+            tb = tb.tb_next
+
+        origin = (tb.tb_frame.f_code.co_filename, tb.tb_lineno, tb.tb_frame.f_code.co_name)
+
+    return ExceptionSummary(type(exc), str(exc), origin)
+
 
 @enrichFunction
 def try_(func_or_obj, *args, **kwargs) -> Union[Eithers, NoReturn]:
@@ -34,6 +115,8 @@ def try_(func_or_obj, *args, **kwargs) -> Union[Eithers, NoReturn]:
     Note.
         Functions handles only Exception heirs and only part of them.
         See `FATAL_EXCEPTIONS` for checking non-handled exception types.
+        Caught exception keeps its traceback, so all frames and their
+        locals are kept alive while Left exists, see tryWith.
     """
 
     assert callable(func_or_obj) or (
@@ -50,3 +133,292 @@ def try_(func_or_obj, *args, **kwargs) -> Union[Eithers, NoReturn]:
 
     except Exception as exc:
         return Left(exc)
+
+
+@enrichFunction
+def tryWith(capture: Callable[[Exception], Any], func_or_obj, *args, **kwargs) -> Union[Eithers, NoReturn]:
+    """The same as try_, but caught exception is processed by capture function.
+
+    Left contains result of capture function, e.g.
+        tryWith(stripTraceback, div, 42, 0)  # Left(ZeroDivisionError('...')) without traceback
+        tryWith(summariseException, div, 42, 0)  # Left(ExceptionSummary(...))
+        tryWith(id_, div, 42, 0) == try_(div, 42, 0)
+    """
+
+    # only callable
+    assert callable(capture), AssertNonCallable()
+    assert callable(func_or_obj) or (
+            not callable(func_or_obj) and not (bool(args) or bool(kwargs))), AssertNonCallable()
+
+    if not callable(func_or_obj):
+        return Right(func_or_obj)
+
+    try:
+        return Right(func_or_obj(*args, **kwargs))
+
+    except FATAL_EXCEPTIONS:
+        raise
+
+    except Exception as exc:
+        return Left(capture(exc))
+
+
+class SafeFunction(Function):
+    """Function wrapper for safely handling 'non-fatal' exceptions.
+
+    Thus
+        SafeFunction(f)(x) == try_(f, x)
+        SafeFunction(f, capture)(x) == tryWith(capture, f, x)
+
+    Wrapped function and capture function are checked once, when
+    wrapper is created, not on every call as try_ does.
+    """
+
+    def __init__(self, func: Callable, capture: Callable[[Exception], Any] = id_):
+        # only callable
+        assert callable(func) and callable(capture), AssertNonCallable()
+
+        self._func: Callable = func
+        self._capture: Callable[[Exception], Any] = capture
+        self._copy_meta()
+
+    @property
+    def capture(self) -> Callable[[Exception], Any]:
+        return self._capture
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Union[Eithers, NoReturn]:
+
+        try:
+            return Right(self._func(*args, **kwargs))
+
+        except FATAL_EXCEPTIONS:
+            raise
+
+        except Exception as exc:
+            return Left(self._capture(exc))
+
+
+def safe(func: Callable) -> SafeFunction:
+    """Decorator for safely handling 'non-fatal' exceptions of function.
+
+    Decorated function returns Right with result or Left with caught exception.
+    Thus safe(f)(x) == try_(f, x)
+    """
+
+    return SafeFunction(func)
+
+
+@curry
+def safeWith(capture: Callable[[Exception], Any], func: Callable) -> SafeFunction:
+    """Decorator for safely handling 'non-fatal' exceptions with capture function.
+
+    Thus safeWith(capture)(f)(x) == tryWith(capture, f, x)
+    E.g.
+        @safeWith(stripTraceback)
+        def parse(line):
+            ...
+    """
+
+    return SafeFunction(func, capture)
+
+
+def _try_map(capture: Callable[[Exception], Any], func: Callable,
+             iterable: Iterable) -> Iterator[Eithers]:
+    # `try` is set once per run of items which func succeeds on, and once more after every caught exception,
+    # flag tells exceptions of func from ones of iterable and of consumer, which are not handled
+
+    iterator = iter(iterable)
+
+    while True:
+        calling = False
+
+        try:
+            for item in iterator:
+                calling = True
+                value = func(item)
+                calling = False
+
+                yield Right(value)
+
+            return
+
+        except FATAL_EXCEPTIONS:
+            raise
+
+        except Exception as exc:
+            if not calling:
+                raise
+
+            failed = Left(capture(exc))
+
+        yield failed
+
+
+@curry
+def tryMap(func: Callable, iterable: Iterable) -> Union[Iterator[Eithers], NoReturn]:
+    """Lazy map which safely handles 'non-fatal' exceptions of func.
+
+    Thus tryMap(f, iterable) == map(safe(f), iterable)
+    Items are processed one by one, as they are consumed, but `try` is set
+    once per run of successful items, not once per item.
+    Exceptions raised by iterable itself are not handled.
+    """
+
+    # only callable
+    assert callable(func), AssertNonCallable()
+
+    return _try_map(id_, func, iterable)
+
+
+@curry
+def tryMapWith(capture: Callable[[Exception], Any], func: Callable,
+               iterable: Iterable) -> Union[Iterator[Eithers], NoReturn]:
+    """The same as tryMap, but caught exceptions are processed by capture function.
+
+    Thus tryMapWith(capture, f, iterable) == map(safeWith(capture, f), iterable)
+    E.g.
+        tryMapWith(summariseException, int, lines)
+    """
+
+    # only callable
+    assert callable(func) and callable(capture), AssertNonCallable()
+
+    return _try_map(capture, func, iterable)
+
+
+async def _atry(capture: Callable[[Exception], Any], func_or_obj, args: Tuple[Any, ...],
+                kwargs: Dict[str, Any]) -> Union[Eithers, NoReturn]:
+
+    try:
+        result = func_or_obj(*args, **kwargs) if callable(func_or_obj) else func_or_obj
+
+        if isawaitable(result):
+            result = await result
+
+        return Right(result)
+
+    except ASYNC_FATAL_EXCEPTIONS:
+        raise
+
+    except Exception as exc:
+        return Left(capture(exc))
+
+
+@enrichFunction
+def atry_(func_or_obj, *args, **kwargs) -> Awaitable[Eithers]:
+    """Coroutine for safely handling 'non-fatal' exceptions of asynchronous calls.
+
+    The same as try_, but result of call is awaited if it is awaitable,
+    e.g. coroutine function is called and its coroutine is awaited.
+    If first argument is awaitable itself, then it is awaited.
+    E.g.
+        async def div(a, b):
+            return a//b
+
+        await atry_(div, 42, 2)  # Right(21)
+        await atry_(div, 42, 0)  # Left(ZeroDivisionError('...'))
+        await atry_(div(42, 0))  # Left(ZeroDivisionError('...'))
+
+    Note.
+        Functions handles only Exception heirs and only part of them.
+        See `ASYNC_FATAL_EXCEPTIONS` for checking non-handled exception types,
+        e.g. asyncio.CancelledError is always propagated.
+    """
+
+    assert callable(func_or_obj) or (
+            not callable(func_or_obj) and not (bool(args) or bool(kwargs))), AssertNonCallable()
+
+    return _atry(id_, func_or_obj, args, kwargs)
+
+
+@enrichFunction
+def atryWith(capture: Callable[[Exception], Any], func_or_obj, *args, **kwargs) -> Awaitable[Eithers]:
+    """The same as atry_, but caught exception is processed by capture function.
+
+    Thus await atryWith(capture, f, x) == tryWith(capture, f, x) for synchronous f
+    """
+
+    # only callable
+    assert callable(capture), AssertNonCallable()
+    assert callable(func_or_obj) or (
+            not callable(func_or_obj) and not (bool(args) or bool(kwargs))), AssertNonCallable()
+
+    return _atry(capture, func_or_obj, args, kwargs)
+
+
+class AsyncSafeFunction(SafeFunction):
+    """Coroutine function wrapper for safely handling 'non-fatal' exceptions.
+
+    Thus
+        await AsyncSafeFunction(f)(x) == await atry_(f, x)
+        await AsyncSafeFunction(f, capture)(x) == await atryWith(capture, f, x)
+    """
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Union[Eithers, NoReturn]:
+        return await _atry(self._capture, self._func, args, kwargs)
+
+
+def asafe(func: Callable) -> AsyncSafeFunction:
+    """Decorator for safely handling 'non-fatal' exceptions of coroutine function.
+
+    Decorated function returns coroutine of Right with result or Left with caught exception.
+    Thus await asafe(f)(x) == await atry_(f, x)
+    """
+
+    return AsyncSafeFunction(func)
+
+
+@curry
+def asafeWith(capture: Callable[[Exception], Any], func: Callable) -> AsyncSafeFunction:
+    """Decorator for safely handling 'non-fatal' exceptions of coroutine function with capture function.
+
+    Thus await asafeWith(capture)(f)(x) == await atryWith(capture, f, x)
+    """
+
+    return AsyncSafeFunction(func, capture)
+
+
+@enrichFunction
+async def agatherEither(awaitables: Iterable[Awaitable], limit: Optional[int] = None) -> List[Eithers]:
+    """Await all given awaitables concurrently and return their results as Either.
+
+    Results are in order of given awaitables, every result is the same as
+    atry_(awaitable) returns. Not more than limit awaitables are awaited
+    at the same time, all of them are awaited at once if limit is None.
+    E.g.
+        await agatherEither((fetch(url) for url in urls), limit=10)  # [Right(...), Left(...), ...]
+
+    Note.
+        Exceptions from ASYNC_FATAL_EXCEPTIONS are propagated, rest of
+        awaitables are cancelled in this case.
+    """
+
+    # only positive limit
+    assert limit is None or (isinstance(limit, int) and limit > 0), AssertWrongValue(str(limit), "positive int")
+
+    awaitables = list(awaitables)
+    results: List[Optional[Eithers]] = [None] * len(awaitables)
+    pending = iter(enumerate(awaitables))
+
+    async def worker():
+        for index, awaitable in pending:
+            results[index] = await _atry(id_, awaitable, (), {})
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(min(limit or len(awaitables), len(awaitables)))]
+
+    try:
+        await asyncio.gather(*workers)
+
+    finally:
+        for task in workers:
+            task.cancel()
+
+        # cancellation is finished, so that tasks are not destroyed while they are pending
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        # prevent warnings about never awaited coroutines
+        for _, awaitable in pending:
+            if iscoroutine(awaitable):
+                awaitable.close()
+
+    return results
@@ -1,7 +1,10 @@
+import copyreg
 import inspect
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
 from functools import reduce
+from importlib import import_module
+from types import FunctionType
 from typing import Any, Callable, Dict, Tuple, Union
 
 from fpe.asserts import (AssertCurringError, AssertFunctionCompositionError,
@@ -115,6 +118,53 @@ def is_curried(func: Callable) -> bool:
     return getattr(func, "is_curried", False)
 
 
+def _global_function(module: str, qualname: str) -> Callable:
+    """Return function which is wrapped by module level Function object, e.g. decorated with curry."""
+
+    obj = import_module(module)
+
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+
+    return obj.func if isinstance(obj, Function) else obj
+
+
+class _FunctionReference:
+    """Picklable reference to function which is hidden by its decorator.
+
+    Decorated function can not be pickled by itself, due module attribute
+    with its name is Function object, so that reference is pickled instead
+    and it is unpickled as original function.
+    """
+
+    __slots__ = ("module", "qualname")
+
+    def __init__(self, module: str, qualname: str):
+        self.module = module
+        self.qualname = qualname
+
+    def __reduce__(self):
+        return _global_function, (self.module, self.qualname)
+
+
+def _pickle_reference(value: Any) -> Any:
+    """Return reference for function which is wrapped by module level Function object, otherwise value as is"""
+
+    if isinstance(value, tuple):
+        return tuple(_pickle_reference(i) for i in value)
+
+    if not isinstance(value, FunctionType) or "<" in value.__qualname__:
+        return value
+
+    try:
+        original = _global_function(value.__module__, value.__qualname__)
+
+    except (ImportError, AttributeError):
+        return value
+
+    return _FunctionReference(value.__module__, value.__qualname__) if original is value else value
+
+
 class Function(metaclass=ABCMeta):
     """Abstract class for representation advanced function features
 
@@ -226,6 +276,14 @@ class Function(metaclass=ABCMeta):
 
         return self._compose(self, other)
 
+    def __reduce__(self):
+        """Pickling support, so that Function objects may be sent to process pool.
+
+        Functions which are decorated on module level, e.g. with curry, are pickled by reference.
+        """
+
+        return copyreg.__newobj__, (type(self),), {k: _pickle_reference(v) for k, v in self.__dict__.items()}
+
     def _copy_meta(self, defaults=("Unknown", None, None, None)):
         # assign some meta
         self.__name__ = "Wrapped: <{}>".format(
@@ -617,6 +675,38 @@ def enrichFunction(func):
     return enriched
 
 
+class MonotonePredicate(FunctionEnrichment):
+    """Predicate which is marked as monotone one, see monotone."""
+
+    @property
+    def is_monotone(self) -> bool:
+        return True
+
+
+def is_monotone(func: Callable) -> bool:
+    # checking if function is marked as monotone predicate
+
+    # only callable
+    assert callable(func), AssertNonCallable()
+
+    return getattr(func, "is_monotone", False)
+
+
+def monotone(predicate: Callable[..., bool]) -> MonotonePredicate:
+    """Mark predicate as monotone one.
+
+    Monotone predicate changes its value at most once along sorted sequence,
+    e.g. lambda x: x < 42 for ascending sequence, so that functions like
+    takeWhile may find the boundary by bisection instead of calling
+    predicate on every item. It is not checked, so predicate which is not
+    monotone gives wrong result.
+    E.g.
+        takeWhile(monotone(lambda x: x < 42), sorted_list)
+    """
+
+    return MonotonePredicate(predicate)
+
+
 @enrichFunction
 def id_(value: Any) -> Any:
     """The id function.
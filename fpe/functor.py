@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from typing import Callable
+from typing import Any, Callable, Tuple
 
 from fpe.asserts import AssertNonCallable, AssertWrongArgumentType
 from fpe.functions import curry, enrichFunction
@@ -33,6 +33,61 @@ class AbstractFunctor(metaclass=ABCMeta):
         return self.__or__(func)
 
 
+class LazyFunctor:
+    """Mixin which defers and fuses fmap calls of strict functor class.
+
+    Every `|` only records given function, all recorded functions are
+    applied once, as single composition, when value is needed, e.g.
+    force(), equality or any method which reads `_value`. Computed value
+    is memoized. Subclass has to precede strict class in bases and set
+    `_strict` to it, e.g. class LazyJust(LazyFunctor, Just): _strict = Just.
+    Fusion is valid due fmap law:
+        fmap (f . g)  ==  fmap f . fmap g
+    """
+
+    _strict: type
+
+    def __init__(self, value: Any, funcs: Tuple[Callable, ...] = ()):
+        self._origin = value
+        self._funcs = funcs
+
+    @property
+    def _value(self) -> Any:
+
+        if self._funcs:
+            value = self._origin
+
+            for func in self._funcs:
+                value = func(value)
+
+            self._origin = value
+            self._funcs = ()
+
+        return self._origin
+
+    def __or__(self, func: Callable) -> "LazyFunctor":
+
+        # only callable
+        assert callable(func), AssertNonCallable()
+
+        return self.__class__(self._origin, self._funcs + (func,))
+
+    def __eq__(self, other) -> bool:
+
+        if isinstance(other, LazyFunctor):
+            other = other.force()
+
+        return self.force() == other
+
+    def lazy(self) -> "LazyFunctor":
+        return self
+
+    def force(self) -> AbstractFunctor:
+        """Apply all recorded functions and return value of strict class."""
+
+        return self._strict(self._value)
+
+
 @curry
 def fmap(func: Callable, instance: AbstractFunctor) -> AbstractFunctor:
     """Common fmap function."""
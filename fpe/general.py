@@ -1,6 +1,7 @@
 """Module provides only some imports from other components of package.
 It makes access to often used components more easy."""
 
+from fpe.applicative import liftA
 from fpe.base import even, flip, odd
 from fpe.builtins import (getattr_, hasattr_, isinstance_, issubclass_, iter_,
                           next_, setattr_)
@@ -11,4 +12,5 @@ from fpe.functions import (compose, curry, enrichFunction, id_, pipe,
 from fpe.itertools import (collect, drop, dropWhile, map_, partition, take,
                            takeWhile, zip_, zipPad, zipWith, zipWithPad)
 from fpe.maybe import Just, Maybe, Nothing, isJust, isNothing
+from fpe.monad import kleisli
 from fpe.seqtools import count, elem, first, foldl, foldl_
@@ -0,0 +1,236 @@
+import sys
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping, Sequence
+from functools import partial
+from operator import eq
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from fpe.asserts import AssertWrongArgumentType
+from fpe.misc.arrays import is_ndarray
+
+
+class Indexed(Sequence):
+    """Sequence wrapper which answers membership, count and index queries by hash index.
+
+    Index of item positions is built lazily, at the first query, and then it is
+    updated incrementally, so that items which are appended to sequence later
+    are indexed at the next query. Iterables which are not sequences are
+    materialized to tuple once. Indexed is accepted by elem, count and first
+    of fpe.seqtools, first uses index for equality predicates, see equality_operand.
+    E.g.
+        rules = Indexed(rules_list)
+        elem(rule, rules)  # O(1)
+        count(rule, rules)  # O(1)
+        rules_list.append(new_rule)
+        elem(new_rule, rules)  # True, new_rule is indexed incrementally
+
+    Note.
+        Sequence may only be appended to, items which are replaced or removed
+        in place are not noticed, except sequence becomes shorter, then index is rebuilt.
+        Unhashable items are not indexed, they are compared one by one.
+    """
+
+    def __init__(self, iterable: Iterable):
+
+        # values of mapping have to be passed explicitly, since `in` checks keys of mapping
+        assert not isinstance(iterable, Mapping), AssertWrongArgumentType("not Mapping, e.g. mapping.values()")
+
+        self._sequence = iterable if isinstance(iterable, Sequence) else tuple(iterable)
+        self._positions: Dict[Any, List[int]] = {}
+        self._unhashable: List[int] = []
+        self._indexed = 0
+
+    @property
+    def sequence(self) -> Sequence:
+        return self._sequence
+
+    def _update(self):
+        """Index items which are appended after the last query."""
+
+        size = len(self._sequence)
+
+        if size < self._indexed:
+            self._positions.clear()
+            self._unhashable.clear()
+            self._indexed = 0
+
+        positions = self._positions
+        sequence = self._sequence
+
+        for position in range(self._indexed, size):
+            item = sequence[position]
+
+            try:
+                found = positions.get(item)
+
+            except TypeError:
+                self._unhashable.append(position)
+                continue
+
+            if found is None:
+                positions[item] = [position]
+
+            else:
+                found.append(position)
+
+        self._indexed = size
+
+    def _found(self, item: Any) -> Optional[List[int]]:
+        """Return sorted positions of item, or None if item is not hashable."""
+
+        self._update()
+
+        try:
+            found = self._positions.get(item, [])
+
+        except TypeError:
+            return None
+
+        if not self._unhashable:
+            return found
+
+        return sorted(found + [i for i in self._unhashable if self._sequence[i] == item])
+
+    def __contains__(self, item: Any) -> bool:
+        found = self._found(item)
+
+        return item in self._sequence if found is None else bool(found)
+
+    def count(self, item: Any) -> int:
+        found = self._found(item)
+
+        return self._sequence.count(item) if found is None else len(found)
+
+    def index(self, item: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        found = self._found(item)
+
+        if found is None:
+            return super().index(item, start, stop)
+
+        # negative bounds are counted from the end, as list.index does
+        start, stop, _ = slice(start, stop).indices(len(self))
+        num = bisect_left(found, start)
+
+        if num < len(found) and found[num] < stop:
+            return found[num]
+
+        raise ValueError("{!r} is not in sequence".format(item))
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        return self._sequence[index]
+
+    def __len__(self) -> int:
+        return len(self._sequence)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._sequence)
+
+    def __reversed__(self) -> Iterator:
+        return reversed(self._sequence)
+
+    def __repr__(self):
+        return "{}: {!r}".format(self.__class__.__name__, self._sequence)
+
+
+class SortedView(Sequence):
+    """Marker of sorted sequence, membership, count and index queries are answered by bisection.
+
+    Sequence is not copied or checked, it has to be sorted in ascending order
+    and it should not be changed while view is used. numpy arrays are searched
+    by numpy.searchsorted. SortedView is accepted by elem, count and first of
+    fpe.seqtools, first uses bisection for equality and monotone predicates.
+    E.g.
+        timestamps = SortedView(series_index)
+        elem(ts, timestamps)  # O(log n)
+        first(monotone(lambda t: t >= start), timestamps)  # O(log n)
+    """
+
+    def __init__(self, sequence: Sequence):
+
+        # only sequence with O(1) len and getting item
+        assert isinstance(sequence, Sequence) or is_ndarray(sequence), AssertWrongArgumentType("Sequence")
+
+        self._sequence = sequence
+
+    @property
+    def sequence(self) -> Sequence:
+        return self._sequence
+
+    def _bounds(self, item: Any, low: int = 0, high: Optional[int] = None) -> Tuple[int, int]:
+        """Return positions of the first item which is not less than item and the first one which is greater.
+
+        Item which is not comparable with items is not found, as `in` of list does not find it.
+        """
+
+        sequence = self._sequence
+        high = len(sequence) if high is None else high
+
+        try:
+            if is_ndarray(sequence) and sequence.ndim == 1:
+                part = sequence[low:high]
+                searchsorted = sys.modules["numpy"].searchsorted
+
+                return low + int(searchsorted(part, item, "left")), low + int(searchsorted(part, item, "right"))
+
+            return bisect_left(sequence, item, low, high), bisect_right(sequence, item, low, high)
+
+        except TypeError:
+            return low, low
+
+    def __contains__(self, item: Any) -> bool:
+        low, high = self._bounds(item)
+
+        return low < high
+
+    def count(self, item: Any) -> int:
+        low, high = self._bounds(item)
+
+        return high - low
+
+    def index(self, item: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        # negative bounds are counted from the end, as list.index does
+        start, stop, _ = slice(start, stop).indices(len(self))
+
+        if start < stop:
+            low, high = self._bounds(item, start, stop)
+
+            if low < high:
+                return low
+
+        raise ValueError("{!r} is not in sequence".format(item))
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        return self._sequence[index]
+
+    def __len__(self) -> int:
+        return len(self._sequence)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._sequence)
+
+    def __reversed__(self) -> Iterator:
+        return reversed(self._sequence)
+
+    def __repr__(self):
+        return "{}: {!r}".format(self.__class__.__name__, self._sequence)
+
+
+def equality_operand(predicate: Callable[..., bool]) -> Optional[Tuple[Any]]:
+    """Return tuple of item which predicate compares with for equality, otherwise None.
+
+    Recognized predicates are partial(operator.eq, item) and curried operator.eq with single argument.
+    """
+
+    if isinstance(predicate, partial):
+        if predicate.func is eq and len(predicate.args) == 1 and not predicate.keywords:
+            return predicate.args
+
+        return None
+
+    if getattr(predicate, "is_curried", False) and getattr(predicate, "func", None) is eq:
+        args = predicate.args
+
+        if len(args) == 1 and not getattr(predicate, "kwargs", None):
+            return args
+
+    return None
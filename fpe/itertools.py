@@ -1,39 +1,102 @@
-from itertools import accumulate, dropwhile, islice, takewhile, zip_longest, filterfalse
-from typing import Any, Callable, Iterable, NoReturn, Union, Tuple
-
-from fpe.base import flip
+import os
+from collections import deque
+from concurrent.futures import Executor
+from itertools import dropwhile, islice, takewhile, tee, zip_longest
+from time import perf_counter
+from typing import Any, Callable, Deque, Iterable, Iterator, List, NoReturn, Optional, Union, Tuple
+
+from fpe.asserts import AssertNonCallable, AssertWrongValue
 from fpe.builtins import map_, zip_
-from fpe.functions import curry, staticCurry
+from fpe.exceptions import tryMapWith
+from fpe.functions import curry, enrichFunction, is_monotone, staticCurry
+from fpe.misc.arrays import as_sliceable, first_false, iter_slice
+from fpe.misc.dispatch import scan
+from fpe.misc.pools import executor_pool, submit_chunks
+
+
+# adaptive chunks of pmap are grown or shrunk to take about this time, seconds
+PMAP_CHUNK_TIME = 0.02
+PMAP_MAX_CHUNK = 65536
+
+
+@curry
+def takeWhile(predicate: Callable[..., bool], iterable: Iterable) -> Union[Iterable, NoReturn]:
+    """The same as itertools.takewhile but curried.
+
+    If predicate is marked as monotone and iterable is sequence, then
+    the slice is returned, its end is found by bisection, see fpe.functions.monotone.
+    """
+
+    sequence = as_sliceable(iterable) if is_monotone(predicate) else None
+
+    if sequence is not None:
+        return sequence[:first_false(predicate, sequence)]
+
+    return takewhile(predicate, iterable)
+
 
+@curry
+def dropWhile(predicate: Callable[..., bool], iterable: Iterable) -> Union[Iterable, NoReturn]:
+    """The same as itertools.dropwhile but curried.
+
+    If predicate is marked as monotone and iterable is sequence, then
+    the slice is returned, its start is found by bisection, see fpe.functions.monotone.
+    """
 
-dropWhile = staticCurry(2)(dropwhile)
-dropWhile.__doc__ = "The same as itertools.dropwhile but curried."
+    sequence = as_sliceable(iterable) if is_monotone(predicate) else None
 
-takeWhile = staticCurry(2)(takewhile)
-takeWhile.__doc__ = "The same as itertools.takewhile but curried."
+    if sequence is not None:
+        return sequence[first_false(predicate, sequence):]
+
+    return dropwhile(predicate, iterable)
 
 
 @curry
 def take(num: int, iterable: Iterable) -> Union[Iterable, NoReturn]:
-    """Return first num items of the iterable."""
+    """Return iterator of first num items of the iterable.
+
+    Items of sequences, bytes and numpy arrays are not copied, see fpe.misc.arrays.iter_slice.
+    """
+
+    sequence = as_sliceable(iterable)
+
+    if sequence is not None and num >= 0:
+        return iter_slice(sequence, 0, num)
 
     return islice(iterable, num)
 
 
 @curry
 def drop(num: int, iterable: Iterable) -> Union[Iterable, NoReturn]:
-    """Skipping first num items of the iterable and return rest of them."""
+    """Skipping first num items of the iterable and return iterator of rest of them.
+
+    Skipped items of sequences are not iterated and rest of them are not copied, see take.
+    """
+
+    sequence = as_sliceable(iterable)
+
+    if sequence is not None and num >= 0:
+        return iter_slice(sequence, num)
 
     return islice(iterable, num, None)
 
 
-accumulate_ = staticCurry(2)(flip(accumulate))
-accumulate_.__doc__ = """Curried version of itertools.accumulate.
+@curry
+def accumulate_(func: Callable, iterable: Iterable) -> Union[Iterator, Any, NoReturn]:
+    """Curried version of itertools.accumulate.
+
+    accumulate_ retracts 1st as function that will be applied on items
+    and waiting for iterable.
+    Numpy array is accumulated by ufunc of known function, e.g. operator.add,
+    and array is returned, see fpe.misc.dispatch.
+    Literally accumulate(iterable, func)
+    """
+
+    # only callable
+    assert callable(func), AssertNonCallable()
+
+    return scan(func, iterable)
 
-accumulate_ retracts 1st as function that will be applied on items
-and waiting for iterable.
-Literally accumulate(iterable, func)
-"""
 
 zipWith = staticCurry(3)(map)
 zipWith.__doc__ = """Curried builtin map for at least 2 iterables.
@@ -86,15 +149,461 @@ def collect(predicate: Callable[..., bool], func: Callable,
     return map(func, filter(predicate, iterable))
 
 
-@curry
-def partition(predicate: Callable[..., bool],
-              iterable: Iterable) -> Union[Tuple[Iterable, Iterable], NoReturn]:
-    """Combined filter and itertools.filterfalse function.
+def _partition_part(predicate: Callable[..., bool], source: Iterator, buffer: Deque[Any], other: Deque[Any],
+                    limit: Optional[int], part: bool) -> Iterator:
+    """One part of partitioned iterator.
+
+    Items of another part are put to its buffer, the part drains own buffer
+    before it requests source again, so that order of items is kept.
+    """
+
+    while buffer:
+        yield buffer.popleft()
+
+    for item in source:
+        if bool(predicate(item)) is part:
+            yield item
+
+            # another part could pull items for this one meanwhile
+            while buffer:
+                yield buffer.popleft()
+
+        else:
+            other.append(item)
 
-    It returns tuple from filtered and rest items.
-    Literally (filter(predicate, iterable), filterfalse(predicate, iterable))
+            if limit is not None and len(other) > limit:
+                raise BufferError("partition buffer exceeds limit {}".format(limit))
+
+    while buffer:
+        yield buffer.popleft()
+
+
+@curry
+def partition(predicate: Callable[..., bool], iterable: Iterable, limit: Optional[int] = None,
+              eager: bool = False) -> Union[Tuple[Iterable, Iterable], NoReturn]:
+    """Split iterable to tuple of items which satisfy predicate and rest items.
+
+    Iterable is iterated once and predicate is called once for every item,
+    so that one-shot iterators are split correctly. Parts are lazy, items
+    which are pulled from source by one part are buffered for another one,
+    BufferError is raised if buffer gets more than limit items, there is not
+    any limit if it is None. If eager is True, then tuple of lists is returned.
+    Parts are equal to (filter(predicate, iterable), filterfalse(predicate, iterable)) for collections.
+    E.g.
+        evens, odds = partition(even, records, limit=1024)
+        partition(even, range(5), eager=True) == ([0, 2, 4], [1, 3])
 
     Borrowed from partition :: (a -> Bool) -> [a] -> ([a], [a])
     """
 
-    return filter(predicate, iterable), filterfalse(predicate, iterable)
+    # only callable
+    assert callable(predicate), AssertNonCallable()
+    # only non negative limit
+    assert limit is None or (isinstance(limit, int) and limit >= 0), AssertWrongValue(
+        str(limit), "non negative int")
+
+    if eager:
+        parts: Tuple[List[Any], List[Any]] = ([], [])
+
+        for i in iterable:
+            parts[not predicate(i)].append(i)
+
+        return parts
+
+    source = iter(iterable)
+    trues: Deque[Any] = deque()
+    falses: Deque[Any] = deque()
+
+    return (_partition_part(predicate, source, trues, falses, limit, True),
+            _partition_part(predicate, source, falses, trues, limit, False))
+
+
+@curry
+def chunked(num: int, iterable: Iterable) -> Union[Iterator, NoReturn]:
+    """Split iterable into chunks of num items, the last chunk may be shorter.
+
+    Sequences are split into slices, e.g. list, tuple, str, range, array
+    and numpy array (slices are views), bytes are split into memoryview
+    slices which do not copy data, other iterables into tuples.
+    E.g.
+        list(chunked(2, [1, 2, 3, 4, 5])) == [[1, 2], [3, 4], [5]]
+        list(chunked(2, iter([1, 2, 3]))) == [(1, 2), (3,)]
+    """
+
+    # only positive int
+    assert isinstance(num, int) and num > 0, AssertWrongValue(str(num), "positive int")
+
+    sequence = as_sliceable(iterable)
+
+    if sequence is not None:
+        return (sequence[i:i + num] for i in range(0, len(sequence), num))
+
+    iterator = iter(iterable)
+
+    return iter(lambda: tuple(islice(iterator, num)), ())
+
+
+def _windowed(num: int, step: int, iterable: Iterable) -> Iterator[Tuple[Any, ...]]:
+
+    iterator = iter(iterable)
+    window = deque(islice(iterator, num), maxlen=num)
+
+    if len(window) < num:
+        return
+
+    yield tuple(window)
+
+    while True:
+        items = tuple(islice(iterator, step))
+
+        if len(items) < step:
+            return
+
+        window.extend(items)
+
+        yield tuple(window)
+
+
+@curry
+def windowed(num: int, step: int, iterable: Iterable) -> Union[Iterator, NoReturn]:
+    """Sliding windows of num items, every next window starts step items later.
+
+    Only full windows are returned, so there are not any windows if iterable
+    is shorter than num. Sequences are returned as slices, see chunked,
+    other iterables as tuples.
+    E.g.
+        list(windowed(3, 1, [1, 2, 3, 4])) == [[1, 2, 3], [2, 3, 4]]
+        list(windowed(2, 3, iter(range(8)))) == [(0, 1), (3, 4), (6, 7)]
+    """
+
+    # only positive int
+    assert isinstance(num, int) and num > 0, AssertWrongValue(str(num), "positive int")
+    assert isinstance(step, int) and step > 0, AssertWrongValue(str(step), "positive int")
+
+    sequence = as_sliceable(iterable)
+
+    if sequence is not None:
+        return (sequence[i:i + num] for i in range(0, len(sequence) - num + 1, step))
+
+    return _windowed(num, step, iterable)
+
+
+def _sliding_sum(num: int, iterable: Iterable) -> Iterator:
+
+    window: Deque[Any] = deque(maxlen=num)
+    total = 0
+
+    for position, item in enumerate(iterable, 1):
+        if len(window) == num:
+            total -= window[0]
+
+        window.append(item)
+
+        if position % num:
+            total += item
+            # window is full since num-th item
+            if position > num:
+                yield total
+
+        else:
+            # total is recomputed once per num items, so that float errors are not accumulated
+            total = sum(window)
+            yield total
+
+
+@curry
+def slidingSum(num: int, iterable: Iterable) -> Union[Iterator, NoReturn]:
+    """Sums of sliding windows of num items, the same as map(sum, windowed(num, 1, iterable)).
+
+    It takes O(1) amortized time per item and keeps num items only, so that iterable may be infinite.
+    E.g.
+        list(slidingSum(2, [1, 2, 3, 4])) == [3, 5, 7]
+    """
+
+    # only positive int
+    assert isinstance(num, int) and num > 0, AssertWrongValue(str(num), "positive int")
+
+    return _sliding_sum(num, iterable)
+
+
+@curry
+def slidingMean(num: int, iterable: Iterable) -> Union[Iterator, NoReturn]:
+    """Means of sliding windows of num items, see slidingSum.
+
+    E.g.
+        list(slidingMean(2, [1, 2, 3, 4])) == [1.5, 2.5, 3.5]
+    """
+
+    # only positive int
+    assert isinstance(num, int) and num > 0, AssertWrongValue(str(num), "positive int")
+
+    return (i / num for i in _sliding_sum(num, iterable))
+
+
+def _sliding_extreme(num: int, iterable: Iterable, replaces: Callable[[Any, Any], bool]) -> Iterator:
+    """Extremes of sliding windows by monotonic deque.
+
+    Deque keeps positions and items which may become extremes of the next windows,
+    an item removes items which it replaces, so that the extreme is the first one.
+    """
+
+    candidates: Deque[Tuple[int, Any]] = deque()
+
+    for position, item in enumerate(iterable):
+        while candidates and replaces(item, candidates[-1][1]):
+            candidates.pop()
+
+        candidates.append((position, item))
+
+        if candidates[0][0] <= position - num:
+            candidates.popleft()
+
+        if position >= num - 1:
+            yield candidates[0][1]
+
+
+@curry
+def slidingMin(num: int, iterable: Iterable) -> Union[Iterator, NoReturn]:
+    """Minimums of sliding windows of num items, the same as map(min, windowed(num, 1, iterable)).
+
+    It takes O(1) amortized time per item and keeps at most num items.
+    E.g.
+        list(slidingMin(2, [3, 1, 2, 4])) == [1, 1, 2]
+    """
+
+    # only positive int
+    assert isinstance(num, int) and num > 0, AssertWrongValue(str(num), "positive int")
+
+    return _sliding_extreme(num, iterable, lambda new, old: new < old)
+
+
+@curry
+def slidingMax(num: int, iterable: Iterable) -> Union[Iterator, NoReturn]:
+    """Maximums of sliding windows of num items, see slidingMin.
+
+    E.g.
+        list(slidingMax(2, [3, 1, 2, 4])) == [3, 2, 4]
+    """
+
+    # only positive int
+    assert isinstance(num, int) and num > 0, AssertWrongValue(str(num), "positive int")
+
+    return _sliding_extreme(num, iterable, lambda new, old: new > old)
+
+
+def _sliding_fold(semigroup: Callable, num: int, iterable: Iterable) -> Iterator:
+    """Semigroup folds of sliding windows by queue of two stacks.
+
+    Front stack keeps folds of its items from every item to the newest one,
+    so that the top is fold of all of them and the oldest item is removed by pop.
+    Back stack keeps new items and their fold. When the oldest item has to be
+    removed and front is empty, back items are moved to front, thus every item
+    takes part in O(1) operations `&`.
+    """
+
+    front: List[Any] = []
+    back: List[Any] = []
+    back_fold = None
+
+    for item in map(semigroup, iterable):
+        back_fold = item if not back else back_fold & item
+        back.append(item)
+
+        if len(front) + len(back) > num:
+            if not front:
+                for i in reversed(back):
+                    front.append(i if not front else i & front[-1])
+
+                back.clear()
+
+            front.pop()
+
+        if len(front) + len(back) == num:
+            if front and back:
+                yield front[-1] & back_fold
+
+            else:
+                yield front[-1] if front else back_fold
+
+
+@curry
+def slidingFold(semigroup: Callable, num: int, iterable: Iterable) -> Union[Iterator, NoReturn]:
+    """Folds by `&` of sliding windows of num items, items are turned to semigroups by semigroup.
+
+    It takes O(1) amortized number of `&` per item and keeps O(num) semigroups,
+    semigroup is a class, e.g. Sum or Max, or any function which returns AbstractSemigroup.
+    E.g.
+        list(slidingFold(Max, 2, [3, 1, 2])) == [Max(3), Max(2)]
+        list(slidingFold(id_, 2, [Sum(1), Sum(2), Sum(3)])) == [Sum(3), Sum(5)]
+    """
+
+    # only callable
+    assert callable(semigroup), AssertNonCallable()
+    # only positive int
+    assert isinstance(num, int) and num > 0, AssertWrongValue(str(num), "positive int")
+
+    return _sliding_fold(semigroup, num, iterable)
+
+
+def _take_last(num: int, iterable: Iterable) -> Iterator:
+    yield from deque(iterable, maxlen=num)
+
+
+@curry
+def takeLast(num: int, iterable: Iterable) -> Union[Iterable, NoReturn]:
+    """The last num items of iterable, only num items are kept while iterable is consumed.
+
+    Items of sequences before the last num ones are not iterated, see take.
+    E.g.
+        list(takeLast(2, iter([1, 2, 3]))) == [2, 3]
+    """
+
+    # only not negative int
+    assert isinstance(num, int) and num >= 0, AssertWrongValue(str(num), "not negative int")
+
+    sequence = as_sliceable(iterable)
+
+    if sequence is not None:
+        return iter_slice(sequence, max(len(sequence) - num, 0))
+
+    return _take_last(num, iterable)
+
+
+def _drop_last(num: int, iterable: Iterable) -> Iterator:
+
+    iterator = iter(iterable)
+
+    if not num:
+        yield from iterator
+        return
+
+    window = deque(islice(iterator, num), maxlen=num)
+
+    for item in iterator:
+        yield window[0]
+        window.append(item)
+
+
+@curry
+def dropLast(num: int, iterable: Iterable) -> Union[Iterable, NoReturn]:
+    """Items of iterable except the last num ones, items are yielded lazily, num items behind.
+
+    Items of sequences are not kept behind, see take.
+    E.g.
+        list(dropLast(2, iter([1, 2, 3]))) == [1]
+    """
+
+    # only not negative int
+    assert isinstance(num, int) and num >= 0, AssertWrongValue(str(num), "not negative int")
+
+    sequence = as_sliceable(iterable)
+
+    if sequence is not None:
+        return iter_slice(sequence, 0, max(len(sequence) - num, 0))
+
+    return _drop_last(num, iterable)
+
+
+def _batched_by(size_func: Callable[[Any], int], limit: int, iterable: Iterable) -> Iterator[Tuple[Any, ...]]:
+
+    batch: List[Any] = []
+    total = 0
+
+    for item in iterable:
+        size = size_func(item)
+
+        if batch and total + size > limit:
+            yield tuple(batch)
+            batch = []
+            total = 0
+
+        batch.append(item)
+        total += size
+
+    if batch:
+        yield tuple(batch)
+
+
+@curry
+def batchedBy(size_func: Callable[[Any], int], limit: int, iterable: Iterable) -> Union[Iterator, NoReturn]:
+    """Split iterable into tuples of consecutive items which total size is not more than limit.
+
+    Size of every item is calculated by size_func, an item which size is more
+    than limit makes batch of its own.
+    E.g.
+        list(batchedBy(len, 5, ["ab", "cd", "efg", "hijklm"])) == [("ab", "cd"), ("efg",), ("hijklm",)]
+    """
+
+    # only callable
+    assert callable(size_func), AssertNonCallable()
+
+    return _batched_by(size_func, limit, iterable)
+
+
+@enrichFunction
+def pairwise(iterable: Iterable) -> Iterator[Tuple[Any, Any]]:
+    """Return successive overlapping pairs of items.
+
+    Thus pairwise([1, 2, 3]) == ((1, 2), (2, 3))
+    """
+
+    first, second = tee(iterable)
+    next(second, None)
+
+    return zip(first, second)
+
+
+def _apply_chunk(func: Callable, capture: Optional[Callable[[Exception], Any]],
+                 chunk: Tuple[Any, ...]) -> Tuple[List[Any], float]:
+    # top level function, so it may be sent to process pool
+    start = perf_counter()
+    results = list(map(func, chunk) if capture is None else tryMapWith(capture, func, chunk))
+
+    return results, perf_counter() - start
+
+
+def _pmap(func: Callable, iterable: Iterable, workers: Optional[int], chunksize: Optional[int], ordered: bool,
+          executor: Union[str, Executor], capture: Optional[Callable[[Exception], Any]]) -> Iterator[Any]:
+
+    with executor_pool(executor, workers) as pool:
+        results = submit_chunks(pool, _apply_chunk, (func, capture), iterable, 2 * (workers or os.cpu_count() or 1),
+                                chunksize, ordered, PMAP_CHUNK_TIME, PMAP_MAX_CHUNK)
+
+        try:
+            for chunk in results:
+                yield from chunk
+
+        finally:
+            results.close()
+
+
+@curry
+def pmap(func: Callable, iterable: Iterable, workers: Optional[int] = None, chunksize: Optional[int] = None,
+         ordered: bool = True, executor: Union[str, Executor] = "process",
+         capture: Optional[Callable[[Exception], Any]] = None) -> Union[Iterator, NoReturn]:
+    """Parallel map, func is applied to chunks of items in "process" or "thread" pool.
+
+    Results are yielded lazily, in order of items if ordered is True, otherwise
+    chunk by chunk as they are completed. Not more than 2 * workers chunks are
+    in flight, so that iterable is consumed as results are consumed.
+    If chunksize is None, then it is adapted to take about PMAP_CHUNK_TIME,
+    it starts from 1 item, so that slow functions are spread over workers.
+    Exceptions are raised if capture is None, otherwise results are Right or
+    Left with captured exception, see fpe.exceptions.tryMapWith.
+    E.g.
+        list(pmap(heavy, items, workers=4))
+        list(pmap(int, lines, capture=id_, executor="thread")) == [Right(1), Left(ValueError(...)), ...]
+
+    Note.
+        Process pool demands func, items and results are picklable,
+        curried functions and compositions of module level functions are.
+    """
+
+    # only callable
+    assert callable(func), AssertNonCallable()
+    assert capture is None or callable(capture), AssertNonCallable()
+    # only positive int
+    assert chunksize is None or (isinstance(chunksize, int) and chunksize > 0), AssertWrongValue(
+        str(chunksize), "positive int")
+
+    return _pmap(func, iterable, workers, chunksize, ordered, executor, capture)
@@ -0,0 +1,286 @@
+from itertools import chain, islice, zip_longest
+from typing import Any, Callable, Iterable, Iterator, NoReturn, Optional, Union
+
+from fpe.asserts import AssertNonCallable, AssertWrongArgumentType
+from fpe.functions import curry, enrichFunction
+from fpe.monad import AbstractMonad
+from fpe.semigroup import AbstractSemigroup
+
+
+class LazyList(AbstractMonad, AbstractSemigroup):
+    """Memoised lazy list, representation of Haskell list.
+
+    LazyList is a chain of cons cells, every cell is computed only once,
+    when its item is requested, so that list may be infinite and may be
+    iterated many times, by many consumers, without recomputing of source.
+    E.g.
+        numbers = LazyList(expensive_stream())
+        numbers[:10]  # forces first 10 items only
+        sum(numbers[:10]) + sum(numbers[:10])  # expensive_stream is iterated once
+        naturals = iterate_(lambda x: x + 1, 0)
+        naturals | (lambda x: x * 2)  # infinite list of even numbers
+
+    Iterator of LazyList holds the current cell only, thus cells which are
+    not reachable from any variable are garbage collected while iteration.
+
+    Borrowed from data [] a = [] | a : [a]
+
+    Note.
+        len, reversed, comparison and negative indices force the whole list,
+        so they never return for infinite lists.
+        LazyList is not thread safe.
+    """
+
+    def __init__(self, iterable: Iterable = ()):
+        # not evaluated cell has source, evaluated one has tail or it is an empty list
+        self._source: Optional[Iterator] = iter(iterable)
+        self._head: Any = None
+        self._tail: Optional[LazyList] = None
+
+    @classmethod
+    def _cell(cls, head: Any, tail: "LazyList") -> "LazyList":
+        cell = cls()
+        cell._source = None
+        cell._head = head
+        cell._tail = tail
+
+        return cell
+
+    def _force(self) -> bool:
+        """Evaluate cell if it is not evaluated yet, return True if cell is not empty list."""
+
+        source = self._source
+
+        if source is not None:
+            try:
+                self._head = next(source)
+                self._tail = LazyList(source)
+
+            except StopIteration:
+                pass
+
+            self._source = None
+
+        return self._tail is not None
+
+    def _drop(self, num: int) -> "LazyList":
+        cell = self
+
+        for _ in range(num):
+            if not cell._force():
+                break
+
+            cell = cell._tail
+
+        return cell
+
+    @property
+    def head(self) -> Union[Any, NoReturn]:
+        """The first item, IndexError is raised for empty list."""
+
+        if not self._force():
+            raise IndexError("head of empty LazyList")
+
+        return self._head
+
+    @property
+    def tail(self) -> Union["LazyList", NoReturn]:
+        """The list without the first item, IndexError is raised for empty list."""
+
+        if not self._force():
+            raise IndexError("tail of empty LazyList")
+
+        return self._tail
+
+    @property
+    def forced(self) -> int:
+        """Number of items which are already computed, nothing is forced."""
+
+        num = 0
+        cell = self
+
+        while cell._source is None and cell._tail is not None:
+            num += 1
+            cell = cell._tail
+
+        return num
+
+    def __iter__(self) -> Iterator:
+        return _iterate(self)
+
+    def __bool__(self) -> bool:
+        return self._force()
+
+    def __len__(self) -> int:
+        num = 0
+
+        for _ in _iterate(self):
+            num += 1
+
+        return num
+
+    def __reversed__(self) -> Iterator:
+        return reversed(list(_iterate(self)))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Any, "LazyList", NoReturn]:
+        """Return item by index or lazy slice.
+
+        Slice with not negative start and stop is lazy, slice like [n:]
+        shares cells with the list, so that it is not computed twice.
+        """
+
+        if isinstance(index, slice):
+            start, stop, step = index.start or 0, index.stop, index.step or 1
+
+            if start < 0 or (stop is not None and stop < 0) or step < 0:
+                return LazyList(list(_iterate(self))[index])
+
+            if stop is None and step == 1:
+                return self._drop(start)
+
+            return LazyList(islice(_iterate(self), start, stop, step))
+
+        # only int
+        assert isinstance(index, int), AssertWrongArgumentType("int or slice")
+
+        if index < 0:
+            return list(_iterate(self))[index]
+
+        cell = self._drop(index)
+
+        if not cell._force():
+            raise IndexError("LazyList index out of range")
+
+        return cell._head
+
+    def __eq__(self, other) -> bool:
+
+        if not isinstance(other, LazyList):
+            return False
+
+        sentinel = object()
+
+        # lists are compared item by item, so that comparison stops on the first difference
+        return all(x == y for x, y in zip_longest(_iterate(self), _iterate(other), fillvalue=sentinel))
+
+    def __ne__(self, other) -> bool:
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        # only computed items are shown
+        cell = self
+        items = []
+
+        while cell._source is None and cell._tail is not None:
+            items.append(repr(cell._head))
+            cell = cell._tail
+
+        if cell._source is not None:
+            items.append("...")
+
+        return "{}: [{}]".format(self.__class__.__name__, ", ".join(items))
+
+    @staticmethod
+    @enrichFunction
+    def pure(value: Any) -> "LazyList":
+        """Implementation of pure from ApplicativeFunctor.
+
+        Return list of single value.
+        """
+
+        return LazyList((value,))
+
+    @staticmethod
+    @curry
+    def liftA2(func: Callable, lazylist1: "LazyList", lazylist2: "LazyList") -> "LazyList":
+        """Implementation of lift2 from ApplicativeFunctor.
+
+        It applies binary function to every pair of items.
+        E.g.
+            liftA2(plus, LazyList([1, 2]), LazyList([10, 20])) == LazyList([11, 21, 12, 22])
+        """
+
+        # only callable
+        assert callable(func), AssertNonCallable()
+        # only LazyList
+        assert isinstance(lazylist1, LazyList) and isinstance(lazylist2, LazyList), AssertWrongArgumentType(
+            "LazyList")
+
+        return LazyList(func(x, y) for x in _iterate(lazylist1) for y in _iterate(lazylist2))
+
+    def __or__(self, func: Callable) -> "LazyList":
+        """Implementation of fmap from Functor.
+
+        Function is applied lazily to every item.
+        """
+
+        # only callable
+        assert callable(func), AssertNonCallable()
+
+        return LazyList(map(func, _iterate(self)))
+
+    def __mod__(self, lazylist: "LazyList") -> "LazyList":
+        """Implementation of <*> from ApplicativeFunctor.
+
+        Every function of the list is applied to every item of given list.
+        """
+
+        # only LazyList
+        assert isinstance(lazylist, LazyList), AssertWrongArgumentType("LazyList")
+
+        return LazyList(f(x) for f in _iterate(self) for x in _iterate(lazylist))
+
+    def __rshift__(self, func: Callable) -> "LazyList":
+        """Implementation of >>= from Monad.
+
+        Function is applied lazily to every item and returned iterables are concatenated.
+        """
+
+        # only callable
+        assert callable(func), AssertNonCallable()
+
+        return LazyList(chain.from_iterable(map(func, _iterate(self))))
+
+    def __and__(self, lazylist: "LazyList") -> "LazyList":
+        """Implementation of <> from Semigroup, lists are concatenated lazily."""
+
+        # only LazyList
+        assert isinstance(lazylist, LazyList), AssertWrongArgumentType("LazyList")
+
+        return LazyList(chain(_iterate(self), _iterate(lazylist)))
+
+
+def _iterate(cell: LazyList) -> Iterator:
+    # module level generator, so that it does not refer to the first cell after iteration is started
+    while cell._force():
+        yield cell._head
+        cell = cell._tail
+
+
+@curry
+def cons(item: Any, iterable: Iterable) -> LazyList:
+    """Prepend item to list, given LazyList is shared, not copied.
+
+    Borrowed from (:) :: a -> [a] -> [a]
+    """
+
+    return LazyList._cell(item, iterable if isinstance(iterable, LazyList) else LazyList(iterable))
+
+
+@curry
+def iterate_(func: Callable, value: Any) -> LazyList:
+    """Infinite list of repeated applications of func to value.
+
+    Thus iterate_(f, x) == LazyList([x, f(x), f(f(x)), ...])
+    Borrowed from iterate :: (a -> a) -> a -> [a]
+    """
+
+    # only callable
+    assert callable(func), AssertNonCallable()
+
+    def generate(value):
+        while True:
+            yield value
+            value = func(value)
+
+    return LazyList(generate(value))
@@ -2,6 +2,7 @@ from typing import Any, Callable, Collection, Generator, NoReturn, Union
 
 from fpe.asserts import AssertNonCallable, AssertWrongArgumentType
 from fpe.functions import curry, enrichFunction
+from fpe.functor import LazyFunctor
 from fpe.monad import AbstractMonad
 from fpe.semigroup import AbstractSemigroup
 
@@ -68,7 +69,30 @@ class Maybe(AbstractMonad, AbstractSemigroup):
         # only Maybe
         assert isinstance(maybe1, Maybe) and isinstance(maybe2, Maybe), AssertWrongArgumentType("Maybe")
 
-        return (maybe1 | func) % maybe2
+        return Maybe.liftA(func, maybe1, maybe2)
+
+    @staticmethod
+    def liftA(func: Callable, *maybes: Maybies) -> Maybies:
+        """Implementation of liftA of any number of arguments from ApplicativeFunctor.
+
+        It applies function to all Maybe embraced values at once, without
+        any intermediate Maybe or curried function. The first Nothing is
+        returned if there is any.
+        E.g.
+            liftA(max, Just(1), Just(42), Just(3)) == Just(42)
+            liftA(max, Just(1), Nothing(), Just(3)) == Nothing()
+        """
+
+        # only callable
+        assert callable(func), AssertNonCallable()
+        # at least one Maybe
+        assert maybes and all(isinstance(i, Maybe) for i in maybes), AssertWrongArgumentType("Maybe")
+
+        for maybe in maybes:
+            if not maybe._railway:
+                return maybe
+
+        return Just(func(*[i._value for i in maybes]))
 
     @property
     def value(self) -> NoReturn:
@@ -97,6 +121,15 @@ class Maybe(AbstractMonad, AbstractSemigroup):
 
         return "Just: {}".format(self._value)
 
+    def lazy(self) -> Maybies:
+        """Return Maybe which defers fmap calls until its value is needed.
+
+        Nothing does not apply any function, so it is returned as is.
+        See LazyJust for details.
+        """
+
+        return self
+
 
 class Nothing(Maybe):
     """Nothing class for representation failed computation.
@@ -112,6 +145,8 @@ class Nothing(Maybe):
     Borrowed from Nothing :: Maybe a
     """
 
+    _railway = False
+
     def __or__(self, _: Callable) -> "Nothing":
         return self
 
@@ -135,6 +170,8 @@ class Just(Maybe):
     Borrowed from Just :: a -> Maybe a
     """
 
+    _railway = True
+
     def __init__(self, value: Any):
         self._value = value
 
@@ -170,6 +207,25 @@ class Just(Maybe):
 
         return Just(self._value & maybe._value)
 
+    def lazy(self) -> "LazyJust":
+        """Return LazyJust which defers fmap calls until its value is needed.
+
+        E.g.
+            Just(42).lazy() | neg | abs | str == Just("42")
+        """
+
+        return LazyJust(self._value)
+
+
+class LazyJust(LazyFunctor, Just):
+    """Just class which defers and fuses fmap calls, see fpe.functor.LazyFunctor.
+
+    E.g.
+        Just(x).lazy() | f | g | h == Just(h(g(f(x))))
+    """
+
+    _strict = Just
+
 
 @enrichFunction
 def isNothing(maybe: Maybies) -> bool:
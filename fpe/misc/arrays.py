@@ -0,0 +1,82 @@
+import sys
+from array import array
+from typing import Any, Callable, Iterator, Optional
+
+
+# builtin sequences which support O(1) len and slicing
+SLICEABLE = (list, tuple, str, range, bytearray, array, memoryview)
+
+
+def ndarray_type() -> Optional[type]:
+    """
+    Return numpy.ndarray type if numpy is imported, otherwise None.
+
+    numpy is optional dependency and it is never imported by package itself,
+    if numpy is not imported by anybody, then there are not any numpy arrays.
+    """
+
+    return getattr(sys.modules.get("numpy"), "ndarray", None)
+
+
+def is_ndarray(obj: Any) -> bool:
+    ndarray = ndarray_type()
+
+    return ndarray is not None and isinstance(obj, ndarray)
+
+
+def as_sliceable(obj: Any) -> Optional[Any]:
+    """
+    Return given object as sequence which supports O(1) len and slicing, otherwise None.
+
+    bytes are returned as memoryview, so that their slices do not copy data,
+    numpy arrays are returned as is, their slices are views as well.
+    """
+
+    if isinstance(obj, bytes):
+        return memoryview(obj)
+
+    if isinstance(obj, SLICEABLE) or is_ndarray(obj):
+        return obj
+
+    return None
+
+
+def iter_slice(sequence: Any, start: int, stop: Optional[int] = None) -> Iterator:
+    """Return iterator of sequence[start:stop], where sequence is returned by as_sliceable.
+
+    Items are not copied and items before start are not iterated, numpy arrays
+    and memoryviews are iterated by their views, other sequences by indexes.
+    Bounds are not negative.
+    """
+
+    if is_ndarray(sequence) or isinstance(sequence, memoryview):
+        return iter(sequence[start:stop])
+
+    size = len(sequence)
+    stop = size if stop is None else min(stop, size)
+
+    return map(sequence.__getitem__, range(min(start, stop), stop))
+
+
+def first_false(predicate: Callable[..., bool], sequence: Any) -> int:
+    """Return index of the first item which does not satisfy monotone predicate.
+
+    Predicate changes its value at most once, so that if the first item
+    satisfies it, then items do it up to some boundary which is found by bisection.
+    """
+
+    if not len(sequence) or not predicate(sequence[0]):
+        return 0
+
+    low, high = 1, len(sequence)
+
+    while low < high:
+        middle = (low + high) // 2
+
+        if predicate(sequence[middle]):
+            low = middle + 1
+
+        else:
+            high = middle
+
+    return low
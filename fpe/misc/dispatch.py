@@ -0,0 +1,226 @@
+import math
+import sys
+from functools import reduce
+from itertools import accumulate, chain
+from operator import add, and_, mul, or_, xor
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+from fpe.asserts import AssertNonCallable
+from fpe.misc.arrays import is_ndarray
+
+_NO_INIT = object()
+
+
+def _sum(init: Any, iterable: Iterable) -> Any:
+    # sum refuses to concatenate strings, they are folded as is
+    if isinstance(init, (str, bytes, bytearray)):
+        return reduce(add, iterable, init)
+
+    # floats are summed with correct rounding, thus items have to be real numbers
+    if isinstance(init, float):
+        return math.fsum(chain((init,), iterable))
+
+    return sum(iterable, init)
+
+
+def _prod(init: Any, iterable: Iterable) -> Any:
+    if hasattr(math, "prod"):
+        return math.prod(iterable, start=init)
+
+    return reduce(mul, iterable, init)
+
+
+def _max(init: Any, iterable: Iterable) -> Any:
+    # builtin max keeps the first of equal items, as left fold does
+    return max(chain((init,), iterable))
+
+
+def _min(init: Any, iterable: Iterable) -> Any:
+    return min(chain((init,), iterable))
+
+
+# fold functions, fold(init, iterable), which are equal to functools.reduce(func, iterable, init)
+# for given func, but they iterate in C, except sums of floats, they are more precise than left fold,
+# e.g. they are compensated by sum since python 3.12 and by math.fsum for float initial
+FOLDS: Dict[Callable, Callable[[Any, Iterable], Any]] = {add: _sum, mul: _prod, max: _max, min: _min}
+
+# numpy ufuncs, or their names, which are equal to given binary functions for numpy arrays
+UFUNCS: Dict[Callable, Any] = {add: "add", mul: "multiply", max: "maximum", min: "minimum",
+                               and_: "bitwise_and", or_: "bitwise_or", xor: "bitwise_xor"}
+
+_INTEGRAL = ("bool", "int8", "int16", "int32", "int64", "uint8", "uint16", "uint32", "uint64")
+# names of dtypes of arrays, which ufunc of given function reduces as left fold does,
+# e.g. add of smaller ints is upcast, maximum of floats propagates NaN,
+# floats are summed pairwise, so that sum is more precise than left fold, but it may differ in the last digits,
+# functions which are not here are dispatched for any dtype
+UFUNC_DTYPES: Dict[Callable, Tuple[str, ...]] = {add: ("int64", "float64", "complex128"), mul: ("int64",),
+                                                 max: _INTEGRAL, min: _INTEGRAL,
+                                                 and_: _INTEGRAL, or_: _INTEGRAL, xor: _INTEGRAL}
+# functions whose fold with ufunc is the same only for initial which is not promoted with items
+_ARITHMETIC = (add, mul)
+# python types of initial which are not promoted with items of dtype kind
+_KIND_INITS = {"f": (int, float), "c": (int, float, complex)}
+
+
+def register(func: Callable, fold: Optional[Callable[[Any, Iterable], Any]] = None, ufunc: Any = None,
+             dtypes: Optional[Tuple[str, ...]] = None):
+    """
+    Register fast implementations of folds with binary function func.
+
+    fold(init, iterable) has to be equal to functools.reduce(func, iterable, init),
+    ufunc is numpy ufunc or its name, its reduce and accumulate are used for numpy arrays
+    of dtypes with given names, or for arrays of any dtype if dtypes is None.
+    E.g.
+        register(gcd, ufunc="gcd", dtypes=("int64",))
+        register(concat, fold=lambda init, lists: init + list(chain.from_iterable(lists)))
+        register(mul, ufunc="multiply")  # opt in to float products of numpy
+    """
+
+    # only callable
+    assert callable(func) and (fold is None or callable(fold)), AssertNonCallable()
+
+    if fold is not None:
+        FOLDS[func] = fold
+
+    if ufunc is not None:
+        UFUNCS[func] = ufunc
+
+        if dtypes is None:
+            UFUNC_DTYPES.pop(func, None)
+
+        else:
+            UFUNC_DTYPES[func] = dtypes
+
+
+def _ufunc(func: Callable, iterable: Any, init: Any = _NO_INIT) -> Optional[Any]:
+    """Return numpy ufunc for func if iterable is not empty numpy array and ufunc folds it exactly."""
+
+    if not is_ndarray(iterable) or not iterable.ndim or not len(iterable):
+        return None
+
+    dtypes = UFUNC_DTYPES.get(func)
+
+    if dtypes is not None:
+        if iterable.dtype.name not in dtypes:
+            return None
+
+        if func in _ARITHMETIC and init is not _NO_INIT and not _same_init(init, iterable.dtype):
+            return None
+
+    ufunc = UFUNCS.get(func)
+
+    if isinstance(ufunc, str):
+        ufunc = getattr(sys.modules["numpy"], ufunc, None)
+
+    return ufunc
+
+
+def _same_init(init: Any, dtype: Any) -> bool:
+    """Check that init is not promoted with items of dtype, e.g. it is python int of dtype range."""
+
+    if getattr(init, "dtype", None) == dtype:
+        return True
+
+    if dtype.kind in "iu":
+        info = sys.modules["numpy"].iinfo(dtype)
+
+        return isinstance(init, int) and info.min <= init <= info.max
+
+    return isinstance(init, _KIND_INITS.get(dtype.kind, ()))
+
+
+def fold(func: Callable, init: Any, iterable: Iterable, reduce_: Callable = reduce) -> Any:
+    """
+    Left fold of iterable, the same as functools.reduce(func, iterable, init).
+
+    Numpy arrays are reduced with ufunc, along the first axis, as iteration does, if result is the same,
+    see UFUNC_DTYPES, and known functions are folded with builtins, otherwise reduce_ is used.
+    """
+
+    ufunc = _ufunc(func, iterable, init)
+
+    if ufunc is not None:
+        return func(init, ufunc.reduce(iterable))
+
+    fast = FOLDS.get(func)
+
+    if fast is not None:
+        return fast(init, iterable)
+
+    return reduce_(func, iterable, init)
+
+
+def fold1(func: Callable, iterable: Iterable, reduce_: Callable = reduce) -> Any:
+    """Left fold of iterable with the first item as initial, the same as functools.reduce(func, iterable)."""
+
+    ufunc = _ufunc(func, iterable)
+
+    if ufunc is not None:
+        return ufunc.reduce(iterable)
+
+    fast = FOLDS.get(func)
+
+    if fast is None:
+        return reduce_(func, iterable)
+
+    iterator = iter(iterable)
+
+    for first in iterator:
+        return fast(first, iterator)
+
+    # the same error as reduce raises
+    return reduce(func, ())
+
+
+def scan(func: Callable, iterable: Iterable) -> Union[Iterable, Any]:
+    """
+    Running fold of iterable, the same as itertools.accumulate(iterable, func).
+
+    Numpy arrays are accumulated with ufunc and array is returned.
+    """
+
+    ufunc = _ufunc(func, iterable)
+
+    if ufunc is not None:
+        return ufunc.accumulate(iterable)
+
+    return accumulate(iterable, func)
+
+
+def reversed_(iterable: Any) -> Iterable:
+    """Reversed sequence, numpy arrays are reversed as views, so that they may be vectorized further."""
+
+    if is_ndarray(iterable):
+        return iterable[::-1]
+
+    return reversed(iterable)
+
+
+def _scalar_array(item: Any, iterable: Any) -> bool:
+    """Check that iterable is one dimensional numpy array and item is scalar, so that item is compared elementwise."""
+
+    return is_ndarray(iterable) and iterable.ndim == 1 and sys.modules["numpy"].isscalar(item)
+
+
+def count_equal(item: Any, iterable: Any) -> Optional[int]:
+    """Return number of items of one dimensional numpy array which are equal to scalar item, otherwise None."""
+
+    if not _scalar_array(item, iterable):
+        return None
+
+    return int(sys.modules["numpy"].count_nonzero(iterable == item))
+
+
+def first_equal(item: Any, iterable: Any) -> Optional[int]:
+    """
+    Return position of the first item of one dimensional numpy array which is equal to scalar item,
+    or -1 if there is not such item, otherwise None, e.g. for not numpy arrays or sequence item.
+    """
+
+    if not _scalar_array(item, iterable):
+        return None
+
+    mask = iterable == item
+    position = int(mask.argmax()) if len(mask) else 0
+
+    return position if len(mask) and mask[position] else -1
@@ -0,0 +1,121 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple, Union
+
+from fpe.asserts import AssertWrongArgumentType, AssertWrongValue
+
+
+EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+
+@contextmanager
+def executor_pool(executor: Union[str, Executor], workers: Optional[int] = None) -> Iterator[Executor]:
+    """
+    Context manager which provides executor by its kind or given executor as is.
+
+    Kind is one of EXECUTORS keys, e.g. "thread" or "process", such executor
+    is created with given number of workers and it is shut down on exit.
+    Given Executor object is not shut down, its owner is responsible for that.
+    """
+
+    if isinstance(executor, Executor):
+        yield executor
+        return
+
+    # only known executors
+    assert executor in EXECUTORS, AssertWrongValue(str(executor), "one of {}".format(tuple(EXECUTORS)))
+    # only positive workers
+    assert workers is None or (isinstance(workers, int) and workers > 0), AssertWrongValue(
+        str(workers), "positive int")
+
+    pool = EXECUTORS[executor](max_workers=workers)
+
+    try:
+        yield pool
+
+    finally:
+        pool.shutdown(wait=True)
+
+
+def submit_bounded(pool: Executor, func: Callable, arguments: Iterable[Tuple[Any, ...]],
+                   window: int, ordered: bool = True) -> Iterator[Any]:
+    """
+    Generator which submits func to pool for every tuple of arguments and yields results.
+
+    Not more than window calls are submitted but not yielded at the same time,
+    so that arguments are consumed lazily, as results are consumed.
+    Results are yielded in order of arguments if ordered is True, otherwise
+    as they are completed. Exceptions of func are raised by the generator.
+    Submitted calls which were not started yet are cancelled when generator
+    is closed or raises exception.
+    """
+
+    # only positive int
+    assert isinstance(window, int) and window > 0, AssertWrongArgumentType("positive int")
+
+    pending = deque() if ordered else set()
+
+    try:
+        for args in arguments:
+            if ordered:
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+
+                pending.append(pool.submit(func, *args))
+
+            else:
+                while len(pending) >= window:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        yield future.result()
+
+                pending.add(pool.submit(func, *args))
+
+        while pending:
+            if ordered:
+                yield pending.popleft().result()
+
+            else:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    yield future.result()
+
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def submit_chunks(pool: Executor, worker: Callable, args: Tuple[Any, ...], iterable: Iterable, window: int,
+                  chunksize: Optional[int] = None, ordered: bool = True, chunk_time: float = 0.02,
+                  max_chunk: int = 65536) -> Iterator[Any]:
+    """
+    Generator which submits worker(*args, chunk) to pool for chunks of items and yields its results.
+
+    Worker returns pair of result and seconds it took, if chunksize is None,
+    then chunks start from 1 item and they are grown or shrunk to take about
+    chunk_time, so that slow work is spread over workers and fast one is not
+    dominated by pool overhead. Chunks are submitted by submit_bounded.
+    """
+
+    iterator = iter(iterable)
+    size = [chunksize or 1]
+    chunks = iter(lambda: args + (tuple(islice(iterator, size[0])),), args + ((),))
+    results = submit_bounded(pool, worker, chunks, window, ordered)
+
+    try:
+        for result, elapsed in results:
+            if chunksize is None:
+                if elapsed < chunk_time / 2:
+                    size[0] = min(size[0] * 2, max_chunk)
+
+                elif elapsed > chunk_time * 2:
+                    size[0] = max(size[0] // 2, 1)
+
+            yield result
+
+    finally:
+        results.close()
@@ -7,6 +7,7 @@ from fpe.functions import compose, id_
 from fpe.functor import AbstractFunctor, fmap
 from fpe.misc.checks import get_common_parents
 from fpe.monad import AbstractMonad
+from fpe.monoid import AbstractMonoid
 from fpe.semigroup import AbstractSemigroup
 
 
@@ -34,6 +35,43 @@ def associative_operation_simple_satisfy_check(x: AbstractSemigroup,
     return True
 
 
+def monoid_simple_satisfy_check(x: AbstractMonoid, y: AbstractMonoid, z: AbstractMonoid) -> bool:
+    """
+    Very simple mempty and mconcat satisfy checker
+
+    Function provides very generic checking for following laws:
+        (x <> y) <> z == x <> (y <> z)
+        x <> mempty = x
+        mempty <> x = x
+        mconcat = foldr (<>) mempty
+
+    Satisfying is checked by simple equals, e.g. x & cls.mempty() == x.
+    It raises assert AssertCheckingFailed in case test failure.
+    """
+
+    # only Monoid
+    assert all(isinstance(i, AbstractMonoid) for i in (x, y, z)), AssertWrongArgumentType("AbstractMonoid")
+
+    cls = type(x)
+
+    # associative law checking
+    associative_operation_simple_satisfy_check(x, y, z)
+
+    # x <> mempty = x
+    assert x & cls.mempty() == x, AssertCheckingFailed("law <x <> mempty = x> failed")
+
+    # mempty <> x = x
+    assert cls.mempty() & x == x, AssertCheckingFailed("law <mempty <> x = x> failed")
+
+    # mconcat = foldr (<>) mempty
+    assert cls.mconcat([x, y, z]) == x & (y & (z & cls.mempty())), AssertCheckingFailed(
+        "law <mconcat = foldr (<>) mempty> failed")
+    assert cls.mconcat([]) == cls.mempty(), AssertCheckingFailed(
+        "law <mconcat = foldr (<>) mempty> failed for empty list")
+
+    return True
+
+
 def fmap_simple_satisfy_check(instance: AbstractFunctor, func1: Callable, func2: Callable) -> bool:
     """
     Very simple fmap satisfy checker
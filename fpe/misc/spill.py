@@ -0,0 +1,64 @@
+import pickle
+from io import SEEK_END
+from itertools import islice
+from tempfile import TemporaryFile
+from typing import Any, Iterable, Iterator, Optional
+
+
+# number of items which are pickled at once
+SPILL_BATCH = 1024
+
+
+class SpillFile:
+    """
+    Temporary file of pickled items, items may be appended and read many times.
+
+    Items are pickled by batches, so that there is not a pickle call per item
+    and pickle memo does not grow with file. File is removed when it is closed.
+    """
+
+    def __init__(self, items: Iterable[Any] = (), directory: Optional[str] = None):
+        self._file = TemporaryFile(dir=directory)
+        self.size = 0
+        self.write(items)
+
+    def write(self, items: Iterable[Any]):
+        """Append items to the end of file."""
+
+        self._file.seek(0, SEEK_END)
+        iterator = iter(items)
+
+        for batch in iter(lambda: list(islice(iterator, SPILL_BATCH)), []):
+            pickle.dump(batch, self._file, pickle.HIGHEST_PROTOCOL)
+            self.size += len(batch)
+
+        self._file.flush()
+
+    def __iter__(self) -> Iterator[Any]:
+        # every iterator keeps own position, so that file may be read by several of them
+        position = 0
+
+        while True:
+            self._file.seek(position)
+
+            try:
+                batch = pickle.load(self._file)
+
+            except EOFError:
+                return
+
+            position = self._file.tell()
+
+            yield from batch
+
+    def __len__(self) -> int:
+        return self.size
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self) -> "SpillFile":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
@@ -1,14 +1,20 @@
 from abc import abstractmethod
-from typing import Callable
+from typing import Any, Callable, Optional, Tuple
 
-from fpe.asserts import AssertWrongArgumentType, AssertNonCallable
+from fpe.asserts import AssertWrongArgumentType, AssertNonCallable, AssertFunctionCompositionError
 
 from fpe.applicative import AbstractApplicative
-from fpe.functions import enrichFunction, curry
+from fpe.functions import Function, enrichFunction, curry
 
 
 class AbstractMonad(AbstractApplicative):
 
+    # railway tag, it allows KleisliComposition to avoid `>>` calls:
+    #   True is for succeeded computation, its `_value` is passed to next function, e.g. Right, Just
+    #   False is for failed computation, it stops composition, e.g. Left, Nothing
+    #   None is for any other monad, it is composed by `>>`
+    _railway: Optional[bool] = None
+
     @abstractmethod
     def __rshift__(self, func: Callable) -> "AbstractMonad":
         """
@@ -43,3 +49,97 @@ def bind(func: Callable, instance: AbstractMonad) -> AbstractMonad:
     assert isinstance(instance, AbstractMonad), AssertWrongArgumentType("AbstractMonad")
 
     return instance >> func
+
+
+class KleisliComposition(Function):
+    """Kleisli composition representation class
+
+    Thus KleisliComposition(f, g, h)(x) == f(x) >> g >> h
+
+    Borrowed from (>=>) :: Monad m => (a -> m b) -> (b -> m c) -> a -> m c
+
+    Composition works as railway. Every function is called with value
+    of previous result directly, if result is succeeded computation
+    (e.g. Right, Just), and composition stops on first failed one
+    (e.g. Left, Nothing), which is returned as is. Results are not
+    re-wrapped, see AbstractMonad._railway. Other monads are composed by `>>`.
+
+    Note.
+        Composition must satisfy the following laws:
+            pure >=> f = f
+            f >=> pure = f
+            (f >=> g) >=> h = f >=> (g >=> h)
+
+        Current implementation satisfies these laws if `>>` of monads does.
+    """
+
+    def __init__(self, *funcs: Callable):
+
+        # only callable
+        assert all(callable(i) for i in funcs), AssertNonCallable()
+
+        self._func: Tuple[Callable, ...] = tuple(
+            j for i in funcs for j in (i.func if isinstance(i, KleisliComposition) else (i,)))
+
+        # at least 1 function in composition
+        assert self._func, AssertFunctionCompositionError(
+            "composition must contain at least 1 function, but current contains 0")
+
+        self._first: Callable = self._func[0]
+        self._rest: Tuple[Callable, ...] = self._func[1:]
+
+    def __call__(self, value: Any) -> AbstractMonad:
+        result = self._first(value)
+
+        for f in self._rest:
+            railway = getattr(result, "_railway", None)
+
+            if railway:
+                result = f(result._value)
+
+            elif railway is None:
+                result = result >> f
+
+            else:
+                return result
+
+        return result
+
+    def __rshift__(self, other: Callable) -> "KleisliComposition":
+        """Kleisli composition method: (f >> g)(x) == f(x) >>= g for left argument
+
+        Borrowed from (>=>) :: Monad m => (a -> m b) -> (b -> m c) -> a -> m c
+        """
+
+        return KleisliComposition(self, other)
+
+    def __rrshift__(self, other: Callable) -> "KleisliComposition":
+        """Kleisli composition method: (f >> g)(x) == f(x) >>= g for right argument
+
+        Useful when left argument is not Function obj, but callable and right is KleisliComposition obj.
+        Borrowed from (>=>) :: Monad m => (a -> m b) -> (b -> m c) -> a -> m c
+        """
+
+        return KleisliComposition(other, self)
+
+    def __repr__(self):
+        return "{}, retracted: functions <{}>".format(self.__class__.__name__, self._func)
+
+
+def kleisli(*funcs: Callable) -> KleisliComposition:
+    """Compose monadic functions from left to right.
+
+    Thus kleisli(f, g, h)(x) == f(x) >> g >> h
+    The same as f >=> g >=> h. Result may be extended with `>>`, e.g.
+    kleisli(f, g) >> h == kleisli(f, g, h)
+    E.g.
+        positive = lambda x: Right(x) if x > 0 else Left("negative")
+        even = lambda x: Right(x) if not x % 2 else Left("odd")
+
+        kleisli(positive, even)(42) == Right(42)
+        kleisli(positive, even)(-42) == Left("negative")
+
+    Borrowed from (>=>) :: Monad m => (a -> m b) -> (b -> m c) -> a -> m c
+    """
+
+    return KleisliComposition(*funcs)
@@ -0,0 +1,373 @@
+import math
+import sys
+from abc import abstractmethod
+from functools import reduce
+from itertools import chain
+from operator import add, mul
+from typing import Any, Dict, Iterable, List
+
+from fpe.asserts import AssertWrongArgumentType
+from fpe.functions import curry
+from fpe.maybe import Maybe, Nothing
+from fpe.semigroup import AbstractSemigroup, sconcat
+
+
+class AbstractMonoid(AbstractSemigroup):
+    """An abstract class which represents a Monoid conception."""
+
+    @classmethod
+    @abstractmethod
+    def mempty(cls) -> "AbstractMonoid":
+        """Identity of associative operation.
+
+        Borrowed from mempty :: a
+        Note.
+            mempty must satisfy the identity laws:
+                x <> mempty = x
+                mempty <> x = x
+
+            This is not possible to satisfy these laws in some automatically way,
+            implementation should be performed manually.
+        """
+        pass
+
+    @classmethod
+    def mconcat(cls, monoids: Iterable["AbstractMonoid"]) -> "AbstractMonoid":
+        """Fold iterable of monoids with associative operation.
+
+        Borrowed from mconcat :: [a] -> a
+        Defined as sconcat (mempty :| xs), see fpe.semigroup.sconcat.
+        It should be redefined if there is more efficient bulk way,
+        e.g. building result by single allocation.
+        """
+
+        return sconcat(chain((cls.mempty(),), monoids))
+
+
+@curry
+def mconcat(monoid: type, monoids: Iterable[AbstractMonoid]) -> AbstractMonoid:
+    """Common mconcat function.
+
+    Monoid class is required due result of empty iterable is its mempty.
+    E.g.
+        mconcat(Sum, [Sum(1), Sum(2), Sum(39)]) == Sum(42)
+        mconcat(Sum, []) == Sum(0)
+    """
+
+    # only Monoid
+    assert isinstance(monoid, type) and issubclass(monoid, AbstractMonoid), AssertWrongArgumentType(
+        "AbstractMonoid")
+
+    return monoid.mconcat(monoids)
+
+
+class MonoidValue(AbstractMonoid):
+    """An abstract class for monoids which embrace some value."""
+
+    def __init__(self, value: Any):
+        self._value = value
+
+    @property
+    def value(self) -> Any:
+        return self._value
+
+    def __eq__(self, other) -> bool:
+
+        if type(self) is not type(other):
+            return False
+
+        return self._value == other._value
+
+    def __ne__(self, other) -> bool:
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return "{}: {}".format(self.__class__.__name__, self._value)
+
+
+class Sum(MonoidValue):
+    """Monoid of numbers under addition.
+
+    Bulk mconcat uses builtin sum, floats are added one by one as `&` does them,
+    since sum compensates float rounding since python 3.12.
+    Borrowed from newtype Sum a = Sum { getSum :: a }
+    """
+
+    @classmethod
+    def mempty(cls) -> "Sum":
+        return cls(0)
+
+    @classmethod
+    def mconcat(cls, monoids: Iterable["Sum"]) -> "Sum":
+        values = [i._value for i in monoids]
+
+        if sys.version_info >= (3, 12):
+            types = set(map(type, values))
+
+            if float in types or complex in types:
+                return cls(reduce(add, values, 0))
+
+        return cls(sum(values, 0))
+
+    def __and__(self, other: "Sum") -> "Sum":
+
+        # only Sum
+        assert isinstance(other, Sum), AssertWrongArgumentType("Sum")
+
+        return self.__class__(self._value + other._value)
+
+
+class Product(MonoidValue):
+    """Monoid of numbers under multiplication.
+
+    Borrowed from newtype Product a = Product { getProduct :: a }
+    """
+
+    @classmethod
+    def mempty(cls) -> "Product":
+        return cls(1)
+
+    @classmethod
+    def mconcat(cls, monoids: Iterable["Product"]) -> "Product":
+        values = [i._value for i in monoids]
+
+        if hasattr(math, "prod"):
+            return cls(math.prod(values))
+
+        return cls(reduce(mul, values, 1))
+
+    def __and__(self, other: "Product") -> "Product":
+
+        # only Product
+        assert isinstance(other, Product), AssertWrongArgumentType("Product")
+
+        return self.__class__(self._value * other._value)
+
+
+class Bound:
+    """Value which is greater than any other value, or less than any other one if it is negative.
+
+    It is identity of Min and Max, so that they are monoids of any ordered values, e.g. strings.
+    """
+
+    __slots__ = ("negative",)
+
+    def __init__(self, negative: bool):
+        self.negative = negative
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Bound) and other.negative == self.negative
+
+    def __hash__(self) -> int:
+        return hash((Bound, self.negative))
+
+    def __lt__(self, other: Any) -> bool:
+        return self.negative and self != other
+
+    def __le__(self, other: Any) -> bool:
+        return self.negative or self == other
+
+    def __gt__(self, other: Any) -> bool:
+        return not self.negative and self != other
+
+    def __ge__(self, other: Any) -> bool:
+        return not self.negative or self == other
+
+    def __repr__(self):
+        return "-Bound" if self.negative else "Bound"
+
+
+TOP = Bound(False)
+BOTTOM = Bound(True)
+
+
+class Min(MonoidValue):
+    """Monoid of ordered values under minimum.
+
+    Identity is TOP, which is greater than any value.
+    Borrowed from newtype Min a = Min { getMin :: a }
+    """
+
+    @classmethod
+    def mempty(cls) -> "Min":
+        return cls(TOP)
+
+    @classmethod
+    def mconcat(cls, monoids: Iterable["Min"]) -> "Min":
+        return cls(min((i._value for i in monoids), default=TOP))
+
+    def __and__(self, other: "Min") -> "Min":
+
+        # only Min
+        assert isinstance(other, Min), AssertWrongArgumentType("Min")
+
+        return self if self._value <= other._value else other
+
+
+class Max(MonoidValue):
+    """Monoid of ordered values under maximum.
+
+    Identity is BOTTOM, which is less than any value.
+    Borrowed from newtype Max a = Max { getMax :: a }
+    """
+
+    @classmethod
+    def mempty(cls) -> "Max":
+        return cls(BOTTOM)
+
+    @classmethod
+    def mconcat(cls, monoids: Iterable["Max"]) -> "Max":
+        return cls(max((i._value for i in monoids), default=BOTTOM))
+
+    def __and__(self, other: "Max") -> "Max":
+
+        # only Max
+        assert isinstance(other, Max), AssertWrongArgumentType("Max")
+
+        return self if self._value >= other._value else other
+
+
+class First(MonoidValue):
+    """Monoid of Maybe values which keeps the leftmost Just.
+
+    Value is embraced by Just if it is not Maybe already,
+    thus First(42) == First(Just(42)), and mempty is First(Nothing).
+    Bulk mconcat stops on the first Just.
+    Borrowed from newtype First a = First { getFirst :: Maybe a }
+    """
+
+    def __init__(self, value: Any):
+        super().__init__(Maybe.pure(value))
+
+    @classmethod
+    def mempty(cls) -> "First":
+        return cls(Nothing())
+
+    @classmethod
+    def mconcat(cls, monoids: Iterable["First"]) -> "First":
+
+        for i in monoids:
+            if i._value._railway:
+                return i
+
+        return cls.mempty()
+
+    def __and__(self, other: "First") -> "First":
+
+        # only First
+        assert isinstance(other, First), AssertWrongArgumentType("First")
+
+        return self if self._value._railway else other
+
+
+class Last(MonoidValue):
+    """Monoid of Maybe values which keeps the rightmost Just.
+
+    Value is embraced by Just if it is not Maybe already,
+    thus Last(42) == Last(Just(42)), and mempty is Last(Nothing).
+    Borrowed from newtype Last a = Last { getLast :: Maybe a }
+    """
+
+    def __init__(self, value: Any):
+        super().__init__(Maybe.pure(value))
+
+    @classmethod
+    def mempty(cls) -> "Last":
+        return cls(Nothing())
+
+    @classmethod
+    def mconcat(cls, monoids: Iterable["Last"]) -> "Last":
+        result = None
+
+        for i in monoids:
+            if i._value._railway:
+                result = i
+
+        return cls.mempty() if result is None else result
+
+    def __and__(self, other: "Last") -> "Last":
+
+        # only Last
+        assert isinstance(other, Last), AssertWrongArgumentType("Last")
+
+        return other if other._value._railway else self
+
+
+class StrConcat(MonoidValue):
+    """Monoid of strings under concatenation.
+
+    Bulk mconcat uses str.join, so that result is built at once.
+    """
+
+    @classmethod
+    def mempty(cls) -> "StrConcat":
+        return cls("")
+
+    @classmethod
+    def mconcat(cls, monoids: Iterable["StrConcat"]) -> "StrConcat":
+        return cls("".join([i._value for i in monoids]))
+
+    def __and__(self, other: "StrConcat") -> "StrConcat":
+
+        # only StrConcat
+        assert isinstance(other, StrConcat), AssertWrongArgumentType("StrConcat")
+
+        return self.__class__(self._value + other._value)
+
+
+class ListConcat(MonoidValue):
+    """Monoid of lists under concatenation.
+
+    Bulk mconcat extends single list, so that items are not copied repeatedly.
+    """
+
+    @classmethod
+    def mempty(cls) -> "ListConcat":
+        return cls([])
+
+    @classmethod
+    def mconcat(cls, monoids: Iterable["ListConcat"]) -> "ListConcat":
+        result: List[Any] = []
+
+        for i in monoids:
+            result.extend(i._value)
+
+        return cls(result)
+
+    def __and__(self, other: "ListConcat") -> "ListConcat":
+
+        # only ListConcat
+        assert isinstance(other, ListConcat), AssertWrongArgumentType("ListConcat")
+
+        return self.__class__(list(chain(self._value, other._value)))
+
+
+class DictMerge(MonoidValue):
+    """Monoid of dicts under merging, the rightmost value wins for the same key.
+
+    Thus DictMerge(x) & DictMerge(y) == DictMerge({**x, **y})
+    Bulk mconcat updates single dict, so that items are not copied repeatedly.
+    """
+
+    @classmethod
+    def mempty(cls) -> "DictMerge":
+        return cls({})
+
+    @classmethod
+    def mconcat(cls, monoids: Iterable["DictMerge"]) -> "DictMerge":
+        result: Dict[Any, Any] = {}
+
+        for i in monoids:
+            result.update(i._value)
+
+        return cls(result)
+
+    def __and__(self, other: "DictMerge") -> "DictMerge":
+
+        # only DictMerge
+        assert isinstance(other, DictMerge), AssertWrongArgumentType("DictMerge")
+
+        result = dict(self._value)
+        result.update(other._value)
+
+        return self.__class__(result)
@@ -1,4 +1,12 @@
+import os
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import Executor
+from itertools import islice
+from typing import Iterable, List, Optional, Tuple, Union
+
+from fpe.asserts import AssertEmptyValue, AssertWrongValue
+from fpe.functions import enrichFunction
+from fpe.misc.pools import executor_pool, submit_bounded
 
 
 class AbstractSemigroup(metaclass=ABCMeta):
@@ -17,3 +25,76 @@ class AbstractSemigroup(metaclass=ABCMeta):
             implementation should be performed manually.
         """
         pass
+
+
+def _tree_reduce(semigroups: Iterable[AbstractSemigroup]) -> AbstractSemigroup:
+    """Reduce semigroups with `&` as balanced binary tree.
+
+    Items are combined as soon as there are two subtrees of the same height,
+    like binary counter does, so that only O(log n) partial results are kept
+    and every item takes part in O(log n) operations. Order of items is kept,
+    thus the result is equal to left fold due associative law.
+    """
+
+    stack: List[Tuple[int, AbstractSemigroup]] = []
+
+    for item in semigroups:
+        height = 0
+
+        while stack and stack[-1][0] == height:
+            item = stack.pop()[1] & item
+            height += 1
+
+        stack.append((height, item))
+
+    # at least one item
+    assert stack, AssertEmptyValue()
+
+    result = stack.pop()[1]
+
+    while stack:
+        result = stack.pop()[1] & result
+
+    return result
+
+
+def _tree_reduce_chunk(chunk: Tuple[AbstractSemigroup, ...]) -> AbstractSemigroup:
+    # top level function, so it may be sent to process pool
+    return _tree_reduce(chunk)
+
+
+@enrichFunction
+def sconcat(semigroups: Iterable[AbstractSemigroup], workers: Optional[int] = None,
+            executor: Union[str, Executor] = "thread", chunksize: int = 1024) -> AbstractSemigroup:
+    """Reduce non empty iterable of semigroups with associative operation.
+
+    Thus sconcat([x, y, z]) == x & y & z
+
+    Associativity allows to combine items in any grouping, so that items
+    are combined as balanced tree, which keeps intermediate results of
+    e.g. concatenations small. If workers number is given or executor is
+    Executor object, then chunks of chunksize items are reduced in pool,
+    "thread" or "process" one, and partial results are combined in the
+    current thread. Not more than 2 * workers chunks are in flight.
+    Order of items is kept, so operation does not have to be commutative.
+    E.g.
+        sconcat(Just(histogram) for histogram in shards)
+        sconcat(shards, workers=8, executor="process")
+
+    Borrowed from sconcat :: NonEmpty a -> a
+
+    Note.
+        Process pool demands semigroups are picklable.
+    """
+
+    # only positive chunksize
+    assert isinstance(chunksize, int) and chunksize > 0, AssertWrongValue(str(chunksize), "positive int")
+
+    if workers is None and not isinstance(executor, Executor):
+        return _tree_reduce(semigroups)
+
+    iterator = iter(semigroups)
+    chunks = iter(lambda: (tuple(islice(iterator, chunksize)),), ((),))
+
+    with executor_pool(executor, workers) as pool:
+        return _tree_reduce(submit_bounded(pool, _tree_reduce_chunk, chunks, 2 * (workers or os.cpu_count() or 1)))
@@ -1,9 +1,40 @@
-from typing import Any, NoReturn, Union, Callable, Iterable, Container, Collection, Reversible
+import os
+from typing import (Any, Dict, Iterator, List, NoReturn, Optional, Tuple, Union, Callable, Iterable, Container,
+                    Collection, Reversible)
 from collections.abc import Sequence, Mapping
+from concurrent.futures import Executor, ThreadPoolExecutor
 from functools import reduce
-
-from fpe.functions import curry
-from fpe.maybe import Just, Nothing, Maybe
+from itertools import chain
+from operator import add, or_
+from threading import Event, local
+from time import perf_counter
+
+from fpe.asserts import AssertNonCallable, AssertWrongArgumentType, AssertWrongValue
+from fpe.functions import curry, is_monotone
+from fpe.indexed import Indexed, SortedView, equality_operand
+from fpe.itertools import PMAP_CHUNK_TIME, PMAP_MAX_CHUNK
+from fpe.misc.arrays import as_sliceable, first_false
+from fpe.maybe import Just, Nothing, Maybe, isJust, isNothing
+from fpe.misc.dispatch import count_equal, first_equal, fold, fold1, reversed_
+from fpe.misc.pools import executor_pool, submit_chunks
+from fpe.misc.spill import SpillFile
+from fpe.semigroup import AbstractSemigroup
+
+
+# number of keys which are aggregated in memory by groupReduce, countBy and distinct
+AGGREGATE_BUDGET = 1000000
+# number of files which spilled state is hash partitioned to
+SPILL_PARTITIONS = 16
+# partitions are not split deeper, e.g. keys with equal hashes can not be split at all
+SPILL_MAX_LEVEL = 8
+
+# number of nested thunks of foldrLazy which are evaluated on the same stack
+FOLDR_DEPTH = 100
+# number of thunks of foldrLazy which are being evaluated on stack of current thread
+_FOLDR_STACK = local()
+
+# absence of accumulator
+_MISSING = object()
 
 
 @curry
@@ -16,17 +47,77 @@ def elem(item: Any, sequence: Container) -> Union[bool, NoReturn]:
     return item in sequence
 
 
+def _reflexive(item: Any) -> bool:
+    """Check that item is equal to itself, so that identity check of index and hash lookups does not change result."""
+
+    try:
+        return bool(item == item)
+
+    # e.g. ambiguous truth value of numpy array
+    except Exception:
+        return False
+
+
+def _first_search(predicate: Callable[..., bool], iterable: Iterable) -> Optional[Maybe]:
+    """Search of first which does not call predicate per item, None if there is not such one for arguments."""
+
+    operand = equality_operand(predicate)
+
+    # items which are not equal to themselves, e.g. NaN, are compared by predicate
+    if operand is not None and _reflexive(operand[0]):
+        item = operand[0]
+
+        if isinstance(iterable, (Indexed, SortedView, list, tuple)):
+            try:
+                position = iterable.index(item)
+
+            except ValueError:
+                position = -1
+
+        elif isinstance(iterable, str) and isinstance(item, str) and len(item) == 1 or (
+                isinstance(iterable, (bytes, bytearray)) and isinstance(item, int)):
+            # single item, not substring
+            position = iterable.find(item)
+
+        else:
+            position = first_equal(item, iterable)
+
+        if position is not None:
+            return Nothing() if position < 0 else Just(iterable[position])
+
+    if is_monotone(predicate):
+        sequence = as_sliceable(iterable.sequence if isinstance(iterable, (Indexed, SortedView)) else iterable)
+
+        if sequence is not None:
+            position = first_false(lambda i: not predicate(i), sequence)
+
+            return Just(sequence[position]) if position < len(sequence) else Nothing()
+
+    return None
+
+
 @curry
 def first(predicate: Callable[..., bool], iterable: Iterable) -> Union[Maybe, NoReturn]:
     """Getting first element of iterable.
 
     Functions returns Just with first found item, otherwise Nothing.
 
+    Predicate is not called per item if it is equality one, e.g. partial(operator.eq, item),
+    and iterable is Indexed, SortedView, list, tuple, str, bytes or numpy array,
+    then items are compared as list.index does, unless item is not equal to itself, e.g. NaN,
+    or if predicate is marked as monotone and iterable is sequence, then bisection is used,
+    see fpe.indexed and fpe.functions.monotone.
+
     Note.
         Be careful in case of using this function with iterators,
         function exhausts them.
     """
 
+    found = _first_search(predicate, iterable)
+
+    if found is not None:
+        return found
+
     try:
         return Just(next(filter(predicate, iterable)))
 
@@ -36,6 +127,89 @@ def first(predicate: Callable[..., bool], iterable: Iterable) -> Union[Maybe, No
     return Nothing()
 
 
+def _find_chunk(predicate: Callable[..., bool], negate: bool, stop: Optional[Event],
+                chunk: Tuple[Any, ...]) -> Tuple[Optional[Tuple[Any]], float]:
+    # top level function, so it may be sent to process pool
+    start = perf_counter()
+
+    for item in chunk:
+        if stop is not None and stop.is_set():
+            break
+
+        if bool(predicate(item)) is not negate:
+            return (item,), perf_counter() - start
+
+    return None, perf_counter() - start
+
+
+def _pfind(predicate: Callable[..., bool], negate: bool, iterable: Iterable, workers: Optional[int],
+           chunksize: Optional[int], ordered: bool, executor: Union[str, Executor]) -> Maybe:
+    """Return Just of item for which predicate is not negate, otherwise Nothing."""
+
+    # only callable
+    assert callable(predicate), AssertNonCallable()
+    # only positive int
+    assert chunksize is None or (isinstance(chunksize, int) and chunksize > 0), AssertWrongValue(
+        str(chunksize), "positive int")
+
+    with executor_pool(executor, workers) as pool:
+        # threads stop between items as soon as answer is found, processes finish their chunks
+        stop = Event() if isinstance(pool, ThreadPoolExecutor) else None
+        window = 2 * (workers or os.cpu_count() or 1)
+        results = submit_chunks(pool, _find_chunk, (predicate, negate, stop), iterable, window, chunksize, ordered,
+                                PMAP_CHUNK_TIME, PMAP_MAX_CHUNK)
+
+        try:
+            for found in results:
+                if found is not None:
+                    return Just(found[0])
+
+            return Nothing()
+
+        finally:
+            if stop is not None:
+                stop.set()
+
+            # chunks which are not started yet are cancelled
+            results.close()
+
+
+@curry
+def pfirst(predicate: Callable[..., bool], iterable: Iterable, workers: Optional[int] = None,
+           chunksize: Optional[int] = None, ordered: bool = True,
+           executor: Union[str, Executor] = "process") -> Union[Maybe, NoReturn]:
+    """Parallel first, predicate is evaluated over chunks of items in "process" or "thread" pool.
+
+    It returns Just with the first found item in order of iterable if ordered is True,
+    otherwise Just with any found item, which is found first, or Nothing.
+    Remaining work is cancelled as soon as result is determined, chunks are
+    submitted and adapted as pmap does, see fpe.itertools.pmap.
+    E.g.
+        pfirst(is_fraud, candidates, workers=8, executor="thread")
+
+    Note.
+        Process pool demands predicate and items are picklable.
+    """
+
+    return _pfind(predicate, False, iterable, workers, chunksize, ordered, executor)
+
+
+@curry
+def pany(predicate: Callable[..., bool], iterable: Iterable, workers: Optional[int] = None,
+         chunksize: Optional[int] = None, executor: Union[str, Executor] = "process") -> Union[bool, NoReturn]:
+    """Parallel any(map(predicate, iterable)), it stops at any found item, see pfirst."""
+
+    return isJust(_pfind(predicate, False, iterable, workers, chunksize, False, executor))
+
+
+@curry
+def pall(predicate: Callable[..., bool], iterable: Iterable, workers: Optional[int] = None,
+         chunksize: Optional[int] = None, executor: Union[str, Executor] = "process") -> Union[bool, NoReturn]:
+    """Parallel all(map(predicate, iterable)), it stops at any item which does not satisfy predicate, see pfirst."""
+
+    return isNothing(_pfind(predicate, True, iterable, workers, chunksize, False, executor))
+
+
 @curry
 def count(item: Any, sequence: Collection) -> Union[int, NoReturn]:
     """Getting number of given element in sequence.
@@ -48,8 +222,14 @@ def count(item: Any, sequence: Collection) -> Union[int, NoReturn]:
             count(1, mapping)  # 2, not 0
             # the same as
             count(1, mapping.values())  # 2
+        One dimensional numpy array is counted by numpy.count_nonzero.
     """
 
+    vectorized = count_equal(item, sequence)
+
+    if vectorized is not None:
+        return vectorized
+
     if isinstance(sequence, Mapping):
         sequence = sequence.values()
 
@@ -64,6 +244,58 @@ def count(item: Any, sequence: Collection) -> Union[int, NoReturn]:
     return count
 
 
+class Reduced:
+    """Accumulator which stops fold, see reduced."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Reduced) and self.value == other.value
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self.value)
+
+
+def reduced(value: Any) -> Reduced:
+    """Wrap accumulator, so that fold which gets it from function stops and returns value.
+
+    It is respected by foldl, foldl_, foldr, foldr_, scanl and scanl_.
+    E.g.
+        foldl(lambda acc, x: reduced(acc) if acc > 10 else acc + x, 0, count())  # 15
+
+    Borrowed from Clojure reduced.
+    """
+
+    return Reduced(value)
+
+
+def _reduce(func: Callable, iterable: Iterable, init: Any = _MISSING) -> Any:
+    """functools.reduce which stops at Reduced accumulator."""
+
+    iterator = iter(iterable)
+
+    if init is _MISSING:
+        for init in iterator:
+            break
+
+        else:
+            # the same error as reduce raises
+            return reduce(func, ())
+
+    acc = init
+
+    for item in iterator:
+        acc = func(acc, item)
+
+        if acc.__class__ is Reduced:
+            return acc.value
+
+    return acc
+
+
 @curry
 def foldl(func: Callable, init: Any, iterable: Iterable) -> Union[Any, NoReturn]:
     """Curried version of functools.reduce with defined initial.
@@ -75,9 +307,12 @@ def foldl(func: Callable, init: Any, iterable: Iterable) -> Union[Any, NoReturn]
         reduce(lambda acc, x: acc + x, [], 0) == 0
 
     Literally reduce(func, iterable, init)
+    Function may return reduced(value) to stop fold, then value is returned.
+    Known functions, e.g. operator.add or max, are folded by builtins or numpy ufuncs,
+    see fpe.misc.dispatch, float sums are more precise than left fold then.
     """
 
-    return reduce(func, iterable, init)
+    return fold(func, init, iterable, _reduce)
 
 
 @curry
@@ -91,9 +326,12 @@ def foldl_(func: Callable, iterable: Iterable) -> Union[Any, NoReturn]:
         reduce(lambda acc, x: acc + x, [])  # raise TypeError
 
     Literally reduce(func, iterable)
+    Function may return reduced(value) to stop fold, then value is returned.
+    Known functions, e.g. operator.add or max, are folded by builtins or numpy ufuncs,
+    see fpe.misc.dispatch.
     """
 
-    return reduce(func, iterable)
+    return fold1(func, iterable, _reduce)
 
 
 @curry
@@ -107,9 +345,12 @@ def foldr(func: Callable, init: Any, iterable: Reversible) -> Union[Any, NoRetur
         reduce(lambda acc, x: acc + x, [], 0) == 0
 
     Literally reduce(func, reversed(iterable), init)
+    Function may return reduced(value) to stop fold, then value is returned.
+    Known functions, e.g. operator.add or max, are folded by builtins or numpy ufuncs,
+    see fpe.misc.dispatch.
     """
 
-    return reduce(func, reversed(iterable), init)
+    return fold(func, init, reversed_(iterable), _reduce)
 
 
 @curry
@@ -123,6 +364,332 @@ def foldr_(func: Callable, iterable: Reversible) -> Union[Any, NoReturn]:
         reduce(lambda acc, x: acc + x, [])  # raise TypeError
 
     Literally reduce(func, reversed(iterable))
+    Function may return reduced(value) to stop fold, then value is returned.
+    Known functions, e.g. operator.add or max, are folded by builtins or numpy ufuncs,
+    see fpe.misc.dispatch.
+    """
+
+    return fold1(func, reversed_(iterable), _reduce)
+
+
+@curry
+def foldlWhile(predicate: Callable[..., bool], func: Callable, init: Any, iterable: Iterable) -> Union[Any, NoReturn]:
+    """Left fold which stops before the first accumulator that does not satisfy predicate.
+
+    It returns the last accumulator which satisfies predicate, or init,
+    items after the one that breaks predicate are not consumed.
+    E.g.
+        foldlWhile(lambda acc: acc <= 10, add, 0, count())  # 10 == 0 + 1 + 2 + 3 + 4
+    """
+
+    # only callable
+    assert callable(predicate) and callable(func), AssertNonCallable()
+
+    acc = init
+
+    for item in iterable:
+        value = func(acc, item)
+
+        if value.__class__ is Reduced:
+            value = value.value
+
+            return value if predicate(value) else acc
+
+        if not predicate(value):
+            break
+
+        acc = value
+
+    return acc
+
+
+def _scanl(func: Callable, iterable: Iterable, init: Any) -> Iterator:
+
+    iterator = iter(iterable)
+
+    if init is _MISSING:
+        for init in iterator:
+            break
+
+        else:
+            return
+
+    acc = init
+    yield acc
+
+    for item in iterator:
+        acc = func(acc, item)
+
+        if acc.__class__ is Reduced:
+            yield acc.value
+            return
+
+        yield acc
+
+
+@curry
+def scanl(func: Callable, init: Any, iterable: Iterable) -> Union[Iterator, NoReturn]:
+    """Lazy left fold which yields init and every intermediate accumulator.
+
+    Function may return reduced(value) to stop scan after value.
+    E.g.
+        list(scanl(add, 0, [1, 2, 3])) == [0, 1, 3, 6]
+
+    Borrowed from scanl :: (b -> a -> b) -> b -> [a] -> [b]
+    """
+
+    # only callable
+    assert callable(func), AssertNonCallable()
+
+    return _scanl(func, iterable, init)
+
+
+@curry
+def scanl_(func: Callable, iterable: Iterable) -> Union[Iterator, NoReturn]:
+    """Lazy left fold with the 1st item as initial, see scanl.
+
+    E.g.
+        list(scanl_(add, [1, 2, 3])) == [1, 3, 6]
+
+    Borrowed from scanl1 :: (a -> a -> a) -> [a] -> [a]
     """
 
-    return reduce(func, reversed(iterable))
+    # only callable
+    assert callable(func), AssertNonCallable()
+
+    return _scanl(func, iterable, _MISSING)
+
+
+def _on_new_stack(func: Callable[[], Any]) -> Any:
+    """Call func in a helper thread, so that its frames are on a new stack, and wait for its result."""
+
+    with ThreadPoolExecutor(1) as pool:
+        return pool.submit(func).result()
+
+
+def _foldr_lazy(func: Callable[[Any, Callable[[], Any]], Any], init: Any, iterable: Iterable) -> Any:
+
+    iterator = iter(iterable)
+
+    def step() -> Any:
+        item = next(iterator, _MISSING)
+
+        return init if item is _MISSING else func(item, rest())
+
+    def rest() -> Callable[[], Any]:
+        # the rest of fold is kept by its thunk only, so that it is freed with thunk
+        value: List[Any] = []
+
+        def thunk() -> Any:
+            if value:
+                return value[0]
+
+            depth = getattr(_FOLDR_STACK, "depth", 0)
+
+            if depth >= FOLDR_DEPTH:
+                value.append(_on_new_stack(step))
+
+                return value[0]
+
+            _FOLDR_STACK.depth = depth + 1
+
+            try:
+                value.append(step())
+
+            finally:
+                _FOLDR_STACK.depth = depth
+
+            return value[0]
+
+        return thunk
+
+    return step()
+
+
+@curry
+def foldrLazy(func: Callable[[Any, Callable[[], Any]], Any], init: Any, iterable: Iterable) -> Union[Any, NoReturn]:
+    """Lazy right fold of any iterable, function gets item and the rest of fold as thunk.
+
+    Items are consumed only as far as thunks are called, so that fold may stop
+    early and iterable may be infinite. Thunk evaluates the rest of fold once, it may be called many times,
+    also after fold has returned, e.g. when func builds lazy structure.
+    E.g.
+        foldrLazy(lambda x, acc: x > 0 or acc(), False, count())  # True, only 0 and 1 are consumed
+        foldrLazy(lambda x, acc: [x] + acc(), [], [1, 2, 3]) == [1, 2, 3]
+        node = foldrLazy(lambda x, acc: (x, acc), None, count())
+        node[1]()[1]()[0] == 2
+
+    Func is called once for every consumed item, and the rest of fold is kept by its thunk only.
+    Thunks which are nested deeper than FOLDR_DEPTH are evaluated on the new stack of helper thread,
+    so that deep folds do not exceed recursion limit, e.g. strict fold of n items uses n / FOLDR_DEPTH threads,
+    foldr is preferable for such folds.
+
+    Borrowed from foldr :: (a -> b -> b) -> b -> [a] -> b
+    """
+
+    # only callable
+    assert callable(func), AssertNonCallable()
+
+    return _foldr_lazy(func, init, iterable)
+
+
+def _spill(state: Dict[Any, Any], partitions: Optional[List[SpillFile]], directory: Optional[str],
+           level: int) -> List[SpillFile]:
+    """Append state to hash partitioned files, they are created at the first spill."""
+
+    if partitions is None:
+        partitions = [SpillFile((), directory) for _ in range(SPILL_PARTITIONS)]
+
+    parts: List[List[Tuple[Any, Any]]] = [[] for _ in range(SPILL_PARTITIONS)]
+
+    for pair in state.items():
+        # level salts hash, so that partition is split by another hash when it is aggregated
+        parts[hash((level, pair[0])) % SPILL_PARTITIONS].append(pair)
+
+    for partition, part in zip(partitions, parts):
+        partition.write(part)
+
+    return partitions
+
+
+def _aggregate(pairs: Iterable[Tuple[Any, Any]], step: Callable[[Any, Any], Any], combine: Callable[[Any, Any], Any],
+               budget: int, directory: Optional[str], level: int = 0) -> Iterator[Tuple[Any, Any]]:
+    """Aggregate values by keys, where state is spilled to disk if it has more than budget keys.
+
+    Values are aggregated by step, where accumulator is _MISSING for a new key,
+    partial accumulators of spilled partitions are aggregated by combine
+    for every partition separately, recursively if partition is still too large.
+    """
+
+    state: Dict[Any, Any] = {}
+    partitions: Optional[List[SpillFile]] = None
+
+    try:
+        for key, value in pairs:
+            state[key] = step(state.get(key, _MISSING), value)
+
+            if len(state) > budget and level < SPILL_MAX_LEVEL:
+                partitions = _spill(state, partitions, directory, level)
+                state = {}
+
+        if partitions is None:
+            yield from state.items()
+            return
+
+        partitions = _spill(state, partitions, directory, level)
+        state = {}
+
+        def merge(acc: Any, value: Any) -> Any:
+            return value if acc is _MISSING else combine(acc, value)
+
+        for partition in partitions:
+            yield from _aggregate(partition, merge, combine, budget, directory, level + 1)
+
+    finally:
+        for partition in partitions or ():
+            partition.close()
+
+
+def _combine_semigroups(acc: Any, value: Any) -> Any:
+
+    # only semigroups, e.g. ints would be combined by bitwise and
+    assert isinstance(acc, AbstractSemigroup), AssertWrongArgumentType("AbstractSemigroup accumulator or combine")
+
+    return acc & value
+
+
+@curry
+def groupReduce(key: Callable, reducer: Callable, init: Any, iterable: Iterable,
+                budget: int = AGGREGATE_BUDGET, combine: Optional[Callable[[Any, Any], Any]] = None,
+                directory: Optional[str] = None) -> Union[Iterator[Tuple[Any, Any]], NoReturn]:
+    """Fold items of every key separately and return iterator of key and accumulator pairs.
+
+    Items are folded with reducer, like foldl does, starting from init for every key.
+    Memory is bounded by budget of keys, when there are more keys, accumulators
+    are hash partitioned to temporary files, in given directory or in the default one,
+    then partial accumulators of the same key are combined by combine, by default accumulators
+    have to be AbstractSemigroup and they are combined by `&`, otherwise AssertionError is raised,
+    e.g. combine=operator.add has to be given for int accumulators.
+    Thus combine(reduce(reducer, xs, init), reduce(reducer, ys, init))
+    has to be equal to reduce(reducer, xs + ys, init).
+    Pairs are in order of keys appearance if nothing is spilled, otherwise order is arbitrary.
+    Keys have to be hashable, keys and accumulators have to be picklable if they are spilled.
+    E.g.
+        dict(groupReduce(len, lambda acc, x: acc & Sum(1), Sum(0), words))
+        dict(groupReduce(itemgetter("user"), lambda acc, x: acc + x["bytes"], 0, log, combine=add))
+    """
+
+    # only callable
+    assert callable(key) and callable(reducer) and (combine is None or callable(combine)), AssertNonCallable()
+    # only positive budget
+    assert isinstance(budget, int) and budget > 0, AssertWrongValue(str(budget), "positive int")
+
+    def step(acc: Any, item: Any) -> Any:
+        return reducer(init if acc is _MISSING else acc, item)
+
+    return _aggregate(((key(i), i) for i in iterable), step, combine or _combine_semigroups, budget, directory)
+
+
+@curry
+def countBy(key: Callable, iterable: Iterable, budget: int = AGGREGATE_BUDGET,
+            directory: Optional[str] = None) -> Union[Iterator[Tuple[Any, int]], NoReturn]:
+    """Count items of every key, it returns iterator of key and number pairs.
+
+    Memory is bounded by budget of keys, see groupReduce.
+    E.g.
+        dict(countBy(len, ["a", "b", "cd"])) == {1: 2, 2: 1}
+    """
+
+    return groupReduce(key, lambda acc, _: acc + 1, 0, iterable, budget, add, directory)
+
+
+def _drain(items: set, yielded: bool) -> Iterator[Tuple[Any, bool]]:
+    # set is emptied while it is iterated, so that its items are not kept twice
+    while items:
+        yield items.pop(), yielded
+
+
+def _distinct(iterable: Iterable, budget: int, directory: Optional[str]) -> Iterator:
+
+    seen = set()
+    iterator = iter(iterable)
+
+    for item in iterator:
+        if item not in seen:
+            seen.add(item)
+            yield item
+
+            if len(seen) > budget:
+                break
+
+    else:
+        return
+
+    # rest of items are aggregated with items which are yielded already
+    marked = chain(_drain(seen, True), ((i, False) for i in iterator))
+
+    def step(acc: Any, yielded: bool) -> bool:
+        return yielded if acc is _MISSING else acc or yielded
+
+    for item, yielded in _aggregate(marked, step, or_, budget, directory):
+        if not yielded:
+            yield item
+
+
+@curry
+def distinct(iterable: Iterable, budget: int = AGGREGATE_BUDGET,
+             directory: Optional[str] = None) -> Union[Iterator, NoReturn]:
+    """Return iterator of unique items.
+
+    Items are yielded lazily, in order of their first appearance, until there
+    are more than budget of unique items, then rest of items are deduplicated
+    with bounded memory, see groupReduce, and they are yielded in arbitrary order.
+    Items have to be hashable and picklable.
+    E.g.
+        list(distinct([1, 2, 1, 3])) == [1, 2, 3]
+    """
+
+    # only positive budget
+    assert isinstance(budget, int) and budget > 0, AssertWrongValue(str(budget), "positive int")
+
+    return _distinct(iterable, budget, directory)
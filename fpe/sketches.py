@@ -0,0 +1,519 @@
+from collections.abc import Mapping
+from decimal import Decimal
+from fractions import Fraction
+from hashlib import blake2b
+from heapq import heapify, heappush, heapreplace, nlargest
+from math import isfinite, log
+from numbers import Complex, Integral, Rational, Real
+from random import Random
+from typing import Any, Callable, Iterable, List, NoReturn, Sequence, Tuple, Union
+
+from fpe.asserts import AssertEmptyValue, AssertNonCallable, AssertWrongArgumentType, AssertWrongValue
+from fpe.functions import curry
+from fpe.semigroup import AbstractSemigroup
+
+
+# number of index bits of HyperLogLog, relative error is about 1.04 / sqrt(2 ** precision)
+HLL_PRECISION = 14
+# number of items per level of QuantileSketch
+QUANTILE_CAPACITY = 200
+# counters per row and number of rows of CountMinSketch
+COUNT_MIN_WIDTH = 2048
+COUNT_MIN_DEPTH = 5
+
+
+def _encode_number(number: Union[Complex, Decimal]) -> bytes:
+    # equal numbers of different types, e.g. True, 1, 1.0 and Fraction(1), have the same encoding
+    if isinstance(number, Complex) and not isinstance(number, Real):
+        if number.imag:
+            return b"c" + _framed(number.real) + _framed(number.imag)
+
+        number = number.real
+
+    if isinstance(number, Integral):
+        return b"i" + str(int(number)).encode()
+
+    if not isfinite(number):
+        return b"x" + repr(float(number)).encode()
+
+    ratio = Fraction(number) if isinstance(number, (float, Decimal, Rational)) else Fraction(float(number))
+
+    if ratio.denominator == 1:
+        return b"i" + str(ratio.numerator).encode()
+
+    return b"q" + "{}/{}".format(ratio.numerator, ratio.denominator).encode()
+
+
+def _framed(item: Any) -> bytes:
+    encoded = _encode(item)
+
+    return len(encoded).to_bytes(8, "little") + encoded
+
+
+def _encode(item: Any) -> bytes:
+    """Return encoding of item, which is the same in every process, unlike salted builtin hash.
+
+    Numbers are encoded by value, str, bytes, None, tuples, lists, sets and mappings by their items,
+    other items by repr, which has to identify item, thus objects with default repr are not accepted,
+    also when it is nested, e.g. in repr of deque.
+    """
+
+    if item is None:
+        return b"n"
+
+    if isinstance(item, str):
+        return b"s" + item.encode("utf-8", "surrogatepass")
+
+    if isinstance(item, (bytes, bytearray)):
+        return b"b" + bytes(item)
+
+    # Decimal is not registered as Real
+    if isinstance(item, (Complex, Decimal)):
+        return _encode_number(item)
+
+    if isinstance(item, (tuple, list)):
+        return (b"t" if isinstance(item, tuple) else b"l") + b"".join(map(_framed, item))
+
+    if isinstance(item, (set, frozenset)):
+        return b"f" + b"".join(sorted(map(_framed, item)))
+
+    # equal mappings are encoded the same regardless of insertion order
+    if isinstance(item, Mapping):
+        return b"d" + b"".join(sorted(_framed(k) + _framed(v) for k, v in item.items()))
+
+    text = repr(item)
+
+    # only repr which does not depend on process, e.g. not <object at 0x...>
+    assert type(item).__repr__ is not object.__repr__ and " at 0x" not in text, AssertWrongArgumentType(
+        "item with repr of its value")
+
+    return b"r" + text.encode("utf-8", "surrogatepass")
+
+
+def _hash(item: Any, size: int = 8) -> bytes:
+    return blake2b(_encode(item), digest_size=size).digest()
+
+
+def _assert_positive(num: int):
+    # only positive int
+    assert isinstance(num, int) and num > 0, AssertWrongValue(str(num), "positive int")
+
+
+class TopK(AbstractSemigroup):
+    """Sketch of n items with the largest keys, kept in heap.
+
+    Items with equal keys are kept in order of their appearance,
+    sketches are merged by `&`, items of the left one appear first.
+    """
+
+    def __init__(self, n: int, key: Callable, iterable: Iterable = ()):
+
+        _assert_positive(n)
+        # only callable
+        assert callable(key), AssertNonCallable()
+
+        self.n = n
+        self.key = key
+        # heap of key, negative position and item, so that the smallest key and the latest item is on top
+        self._heap: List[Tuple[Any, int, Any]] = []
+        self._count = 0
+        self.update(iterable)
+
+    def update(self, iterable: Iterable):
+        """Add items of iterable to sketch in place."""
+
+        heap, n, key = self._heap, self.n, self.key
+
+        for position, item in enumerate(iterable, self._count):
+            entry = (key(item), -position, item)
+
+            if len(heap) < n:
+                heappush(heap, entry)
+
+            elif entry[:2] > heap[0][:2]:
+                heapreplace(heap, entry)
+
+            self._count = position + 1
+
+    @property
+    def items(self) -> List[Any]:
+        """Items from the largest key to the smallest one."""
+
+        return [i[2] for i in sorted(self._heap, key=lambda i: i[:2], reverse=True)]
+
+    def __and__(self, other: "TopK") -> "TopK":
+
+        # only TopK of the same size
+        assert isinstance(other, TopK), AssertWrongArgumentType("TopK")
+        assert other.n == self.n, AssertWrongValue(str(other.n), str(self.n))
+
+        merged = TopK(self.n, self.key)
+        # positions of other follow positions of self
+        shifted = ((k, p - self._count, i) for k, p, i in other._heap)
+        merged._heap = nlargest(self.n, self._heap + list(shifted), key=lambda i: i[:2])
+        heapify(merged._heap)
+        merged._count = self._count + other._count
+
+        return merged
+
+    def __repr__(self):
+        return "{}({}): {!r}".format(self.__class__.__name__, self.n, self.items)
+
+
+@curry
+def topK(n: int, key: Callable, iterable: Iterable) -> Union[TopK, NoReturn]:
+    """Return TopK sketch of n items of iterable with the largest keys.
+
+    It takes O(log n) time per item and keeps n items only.
+    E.g.
+        topK(2, len, ["a", "abc", "ab"]).items == ["abc", "ab"]
+        (topK(10, score, part1) & topK(10, score, part2)).items  # top 10 of both parts
+    """
+
+    return TopK(n, key, iterable)
+
+
+class Reservoir(AbstractSemigroup):
+    """Uniform random sample of k items, every item gets random priority and k smallest ones are kept.
+
+    Sketches of different parts are merged by `&` into uniform sample of all
+    items, thus parts should be sampled with different seeds or without them.
+    """
+
+    def __init__(self, k: int, iterable: Iterable = (), seed: Any = None):
+
+        _assert_positive(k)
+
+        self.k = k
+        self._random = Random(seed)
+        # heap of negative priority, position and item, so that the largest priority is on top
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._count = 0
+        self.update(iterable)
+
+    def update(self, iterable: Iterable):
+        """Add items of iterable to sketch in place."""
+
+        heap, k, random = self._heap, self.k, self._random.random
+
+        for position, item in enumerate(iterable, self._count):
+            priority = -random()
+
+            if len(heap) < k:
+                heappush(heap, (priority, position, item))
+
+            elif priority > heap[0][0]:
+                heapreplace(heap, (priority, position, item))
+
+            self._count = position + 1
+
+    @property
+    def sample(self) -> List[Any]:
+        """Sampled items in order of their appearance."""
+
+        return [i[2] for i in sorted(self._heap, key=lambda i: i[1])]
+
+    def __len__(self) -> int:
+        """Number of seen items."""
+
+        return self._count
+
+    def __and__(self, other: "Reservoir") -> "Reservoir":
+
+        # only Reservoir of the same size
+        assert isinstance(other, Reservoir), AssertWrongArgumentType("Reservoir")
+        assert other.k == self.k, AssertWrongValue(str(other.k), str(self.k))
+
+        merged = Reservoir(self.k)
+        merged._random.setstate(self._random.getstate())
+        shifted = ((p, i + self._count, item) for p, i, item in other._heap)
+        merged._heap = nlargest(self.k, self._heap + list(shifted), key=lambda i: i[0])
+        heapify(merged._heap)
+        merged._count = self._count + other._count
+
+        return merged
+
+    def __repr__(self):
+        return "{}({}): {!r}".format(self.__class__.__name__, self.k, self.sample)
+
+
+@curry
+def reservoirSample(k: int, seed: Any, iterable: Iterable) -> Union[Reservoir, NoReturn]:
+    """Return Reservoir sketch with uniform random sample of k items of iterable.
+
+    Seed may be None for not reproducible sample.
+    E.g.
+        reservoirSample(100, 42, records).sample
+    """
+
+    return Reservoir(k, iterable, seed)
+
+
+class HyperLogLog(AbstractSemigroup):
+    """Sketch of number of distinct items, which keeps 2 ** precision registers of one byte.
+
+    Items are hashed by their encoding, which does not depend on process, so that sketches of different
+    processes are merged by `&`. Equal numbers, e.g. 1, 1.0 and True, are the same item, str, bytes,
+    None, tuples, lists and sets are encoded by value, other items by repr, which has to identify item,
+    objects with default repr are not accepted.
+    """
+
+    def __init__(self, iterable: Iterable = (), precision: int = HLL_PRECISION):
+
+        # only int from 4 to 16
+        assert isinstance(precision, int) and 4 <= precision <= 16, AssertWrongValue(str(precision), "int from 4 to 16")
+
+        self.precision = precision
+        self._registers = bytearray(2 ** precision)
+        self.update(iterable)
+
+    def update(self, iterable: Iterable):
+        """Add items of iterable to sketch in place."""
+
+        registers, precision = self._registers, self.precision
+        bits = 64 - precision
+        mask = (1 << bits) - 1
+
+        for item in iterable:
+            hashed = int.from_bytes(_hash(item), "little")
+            index = hashed >> bits
+            # position of the leftmost 1 bit of the rest of hash
+            rank = bits - (hashed & mask).bit_length() + 1
+
+            if rank > registers[index]:
+                registers[index] = rank
+
+    def estimate(self) -> int:
+        """Return estimated number of distinct items."""
+
+        size = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0 ** -i for i in self._registers)
+        zeros = self._registers.count(0)
+
+        # small range correction
+        if estimate <= 2.5 * size and zeros:
+            estimate = size * log(size / zeros)
+
+        return round(estimate)
+
+    def __and__(self, other: "HyperLogLog") -> "HyperLogLog":
+
+        # only HyperLogLog of the same precision
+        assert isinstance(other, HyperLogLog), AssertWrongArgumentType("HyperLogLog")
+        assert other.precision == self.precision, AssertWrongValue(str(other.precision), str(self.precision))
+
+        merged = HyperLogLog(precision=self.precision)
+        merged._registers = bytearray(map(max, self._registers, other._registers))
+
+        return merged
+
+    def __repr__(self):
+        return "{}: ~{}".format(self.__class__.__name__, self.estimate())
+
+
+@curry
+def approxDistinct(iterable: Iterable, precision: int = HLL_PRECISION) -> Union[HyperLogLog, NoReturn]:
+    """Return HyperLogLog sketch of number of distinct items of iterable.
+
+    It keeps 2 ** precision bytes, relative error is about 1.04 / sqrt(2 ** precision),
+    i.e. 0.8% by default.
+    E.g.
+        approxDistinct(user_ids).estimate()
+        (approxDistinct(part1) & approxDistinct(part2)).estimate()
+    """
+
+    return HyperLogLog(iterable, precision)
+
+
+class QuantileSketch(AbstractSemigroup):
+    """Sketch of quantiles by levels of compactors, KLL-like.
+
+    Items of level h weigh 2 ** h, when level has capacity items, they are sorted
+    and every other of them, from random offset, is moved to the next level.
+    Thus O(capacity * log(n / capacity)) items are kept, rank error is about
+    log2(n / capacity) / capacity. Items have to be comparable.
+    """
+
+    def __init__(self, iterable: Iterable = (), capacity: int = QUANTILE_CAPACITY, seed: Any = None):
+
+        # only capacity which is enough for compaction
+        assert isinstance(capacity, int) and capacity > 1, AssertWrongValue(str(capacity), "int greater than 1")
+
+        self.capacity = capacity
+        self._random = Random(seed)
+        self._levels: List[List[Any]] = [[]]
+        self._count = 0
+        self.update(iterable)
+
+    def update(self, iterable: Iterable):
+        """Add items of iterable to sketch in place."""
+
+        level, capacity = self._levels[0], self.capacity
+
+        for item in iterable:
+            level.append(item)
+            self._count += 1
+
+            if len(level) >= capacity:
+                self._compact(0)
+
+    def _compact(self, height: int):
+        levels = self._levels
+
+        while len(levels[height]) >= self.capacity:
+            level = levels[height]
+            level.sort()
+
+            if len(levels) == height + 1:
+                levels.append([])
+
+            # odd item stays, so that total weight is kept
+            odd = level.pop() if len(level) % 2 else None
+            levels[height + 1].extend(level[self._random.getrandbits(1)::2])
+            # level is cleared in place, since it may be referred by update
+            level.clear()
+
+            if odd is not None:
+                level.append(odd)
+
+            height += 1
+
+    def __len__(self) -> int:
+        """Number of seen items."""
+
+        return self._count
+
+    def quantiles(self, qs: Sequence[float]) -> List[Any]:
+        """Return approximate items of given quantiles, from 0 to 1."""
+
+        # at least one item
+        assert self._count, AssertEmptyValue()
+        # only quantiles from 0 to 1
+        assert all(0 <= q <= 1 for q in qs), AssertWrongValue(str(qs), "quantiles from 0 to 1")
+
+        weighted = sorted((item, 1 << height) for height, level in enumerate(self._levels) for item in level)
+        total = sum(i[1] for i in weighted)
+        results = []
+
+        for q in qs:
+            target = q * total
+            cumulative = 0
+
+            for item, weight in weighted:
+                cumulative += weight
+
+                if cumulative >= target:
+                    break
+
+            results.append(item)
+
+        return results
+
+    def quantile(self, q: float) -> Any:
+        return self.quantiles((q,))[0]
+
+    def __and__(self, other: "QuantileSketch") -> "QuantileSketch":
+
+        # only QuantileSketch of the same capacity
+        assert isinstance(other, QuantileSketch), AssertWrongArgumentType("QuantileSketch")
+        assert other.capacity == self.capacity, AssertWrongValue(str(other.capacity), str(self.capacity))
+
+        merged = QuantileSketch(capacity=self.capacity)
+        merged._random.setstate(self._random.getstate())
+        merged._levels = [[] for _ in range(max(len(self._levels), len(other._levels)))]
+
+        for sketch in (self, other):
+            for height, level in enumerate(sketch._levels):
+                merged._levels[height].extend(level)
+
+        for height in range(len(merged._levels)):
+            merged._compact(height)
+
+        merged._count = self._count + other._count
+
+        return merged
+
+    def __repr__(self):
+        return "{}({}): {} items".format(self.__class__.__name__, self.capacity, self._count)
+
+
+@curry
+def approxQuantiles(iterable: Iterable, capacity: int = QUANTILE_CAPACITY,
+                    seed: Any = None) -> Union[QuantileSketch, NoReturn]:
+    """Return QuantileSketch of items of iterable.
+
+    E.g.
+        approxQuantiles(latencies).quantiles([0.5, 0.9, 0.99])
+        (approxQuantiles(part1) & approxQuantiles(part2)).quantile(0.5)
+    """
+
+    return QuantileSketch(iterable, capacity, seed)
+
+
+class CountMinSketch(AbstractSemigroup):
+    """Sketch of item counts in depth rows of width counters.
+
+    Count of item is never underestimated, it is overestimated by at most
+    e * n / width with probability 1 - exp(-depth), where n is number of items.
+    Items are hashed as HyperLogLog does, so that sketches of different processes are merged by `&`.
+    """
+
+    def __init__(self, iterable: Iterable = (), width: int = COUNT_MIN_WIDTH, depth: int = COUNT_MIN_DEPTH):
+
+        _assert_positive(width)
+        _assert_positive(depth)
+
+        self.width = width
+        self.depth = depth
+        self._rows = [[0] * width for _ in range(depth)]
+        self.update(iterable)
+
+    def _columns(self, item: Any) -> Iterable[int]:
+        # double hashing, row i uses h1 + i * h2
+        hashed = _hash(item, 16)
+        first, second = int.from_bytes(hashed[:8], "little"), int.from_bytes(hashed[8:], "little") | 1
+
+        return ((first + row * second) % self.width for row in range(self.depth))
+
+    def update(self, iterable: Iterable):
+        """Add items of iterable to sketch in place."""
+
+        rows = self._rows
+
+        for item in iterable:
+            for row, column in zip(rows, self._columns(item)):
+                row[column] += 1
+
+    def __getitem__(self, item: Any) -> int:
+        """Return estimated count of item."""
+
+        return min(row[column] for row, column in zip(self._rows, self._columns(item)))
+
+    def __and__(self, other: "CountMinSketch") -> "CountMinSketch":
+
+        # only CountMinSketch of the same shape
+        assert isinstance(other, CountMinSketch), AssertWrongArgumentType("CountMinSketch")
+        assert (other.width, other.depth) == (self.width, self.depth), AssertWrongValue(
+            str((other.width, other.depth)), str((self.width, self.depth)))
+
+        merged = CountMinSketch(width=self.width, depth=self.depth)
+        merged._rows = [list(map(sum, zip(i, j))) for i, j in zip(self._rows, other._rows)]
+
+        return merged
+
+    def __repr__(self):
+        return "{}({}x{})".format(self.__class__.__name__, self.depth, self.width)
+
+
+@curry
+def countMin(iterable: Iterable, width: int = COUNT_MIN_WIDTH,
+             depth: int = COUNT_MIN_DEPTH) -> Union[CountMinSketch, NoReturn]:
+    """Return CountMinSketch of item counts of iterable.
+
+    E.g.
+        counts = countMin(events)
+        counts["login"]  # not less than exact count
+    """
+
+    return CountMinSketch(iterable, width, depth)
@@ -0,0 +1,186 @@
+from heapq import merge
+from itertools import groupby, islice
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NoReturn, Optional, Tuple, Union
+
+from fpe.asserts import AssertNonCallable, AssertWrongValue
+from fpe.functions import curry, enrichFunction
+from fpe.misc.spill import SpillFile
+
+
+# number of items which are sorted in memory by externalSort
+EXTERNAL_SORT_BUDGET = 1000000
+
+
+@curry
+def sortOn(key: Callable, iterable: Iterable) -> Union[List[Any], NoReturn]:
+    """Sort iterable by keys which are computed once per item.
+
+    Sorting is stable, so that items with equal keys keep their order.
+    Literally sorted(iterable, key=key)
+    E.g.
+        sortOn(len, ["abc", "a", "ab"]) == ["a", "ab", "abc"]
+
+    Borrowed from sortOn :: Ord b => (a -> b) -> [a] -> [a]
+    """
+
+    # only callable
+    assert callable(key), AssertNonCallable()
+
+    return sorted(iterable, key=key)
+
+
+def _group_by(eq: Callable[[Any, Any], bool], iterable: Iterable) -> Iterator[List[Any]]:
+
+    group: List[Any] = []
+
+    for item in iterable:
+        if group and not eq(group[0], item):
+            yield group
+            group = [item]
+
+        else:
+            group.append(item)
+
+    if group:
+        yield group
+
+
+@curry
+def groupBy(eq: Callable[[Any, Any], bool], iterable: Iterable) -> Union[Iterator[List[Any]], NoReturn]:
+    """Split iterable to lists of consecutive items which are equal to the first item of list.
+
+    Groups are yielded as soon as they are completed, so that iterable may be infinite.
+    E.g.
+        list(groupBy(eq, [1, 1, 2, 1])) == [[1, 1], [2], [1]]
+
+    Borrowed from groupBy :: (a -> a -> Bool) -> [a] -> [[a]]
+    """
+
+    # only callable
+    assert callable(eq), AssertNonCallable()
+
+    return _group_by(eq, iterable)
+
+
+@curry
+def groupOn(key: Callable, iterable: Iterable) -> Union[Iterator[Tuple[Any, List[Any]]], NoReturn]:
+    """Split iterable to pairs of key and list of consecutive items with this key.
+
+    Groups are yielded as soon as they are completed, key is computed once per item,
+    input which is sorted by key gives a group per key, see groupAllOn for unsorted one.
+    E.g.
+        list(groupOn(len, ["a", "b", "cd"])) == [(1, ["a", "b"]), (2, ["cd"])]
+    """
+
+    # only callable
+    assert callable(key), AssertNonCallable()
+
+    return ((k, list(group)) for k, group in groupby(iterable, key))
+
+
+@curry
+def groupAllOn(key: Callable, iterable: Iterable) -> Union[Dict[Any, List[Any]], NoReturn]:
+    """Group all items of iterable by key in one pass, input does not have to be sorted.
+
+    It returns dict of key and list of items in order of their appearance, keys have to be hashable.
+    E.g.
+        groupAllOn(len, ["a", "cd", "b"]) == {1: ["a", "b"], 2: ["cd"]}
+    """
+
+    # only callable
+    assert callable(key), AssertNonCallable()
+
+    groups: Dict[Any, List[Any]] = {}
+
+    for item in iterable:
+        k = key(item)
+        group = groups.get(k)
+
+        if group is None:
+            groups[k] = [item]
+
+        else:
+            group.append(item)
+
+    return groups
+
+
+@enrichFunction
+def mergeSorted(iterables: Iterable[Iterable]) -> Iterator:
+    """Merge sorted iterables into single sorted iterator.
+
+    Iterables are consumed lazily, only one item of every iterable is kept at the moment.
+    Literally heapq.merge(*iterables)
+    """
+
+    return merge(*iterables)
+
+
+@curry
+def mergeSortedOn(key: Callable, iterables: Iterable[Iterable]) -> Union[Iterator, NoReturn]:
+    """Merge iterables which are sorted by key into single sorted iterator, see mergeSorted.
+
+    Literally heapq.merge(*iterables, key=key)
+    """
+
+    # only callable
+    assert callable(key), AssertNonCallable()
+
+    return merge(*iterables, key=key)
+
+
+def _external_sort(key: Callable, iterable: Iterable, budget: int, directory: Optional[str]) -> Iterator:
+
+    iterator = iter(iterable)
+    runs: List[SpillFile] = []
+
+    try:
+        while True:
+            # items are decorated by keys, so that keys are computed once
+            run = sorted(((key(i), i) for i in islice(iterator, budget)), key=itemgetter(0))
+
+            if len(run) < budget and not runs:
+                # everything fits the budget
+                yield from map(itemgetter(1), run)
+                return
+
+            if run:
+                runs.append(SpillFile(run, directory))
+
+            if len(run) < budget:
+                break
+
+            # previous run is released before the next one is read
+            del run
+
+        # merge is stable for equal keys, items of earlier runs go first
+        yield from map(itemgetter(1), merge(*runs, key=itemgetter(0)))
+
+    finally:
+        for run in runs:
+            run.close()
+
+
+@curry
+def externalSort(key: Callable, iterable: Iterable, budget: int = EXTERNAL_SORT_BUDGET,
+                 directory: Optional[str] = None) -> Union[Iterator, NoReturn]:
+    """Sort iterable by key, where iterable may be larger than memory.
+
+    Items are sorted by runs of budget items, runs are spilled to temporary
+    files, in given directory or in the default one, and they are merged
+    lazily, so that only a run and then small batches of every run are kept
+    in memory.
+    If iterable is not larger than budget, then it is sorted in memory.
+    Sorting is stable, key is computed once per item, items and keys have to be picklable.
+    E.g.
+        for record in externalSort(itemgetter("id"), read_records(), budget=100000):
+            ...
+    """
+
+    # only callable
+    assert callable(key), AssertNonCallable()
+    # only positive budget
+    assert isinstance(budget, int) and budget > 0, AssertWrongValue(str(budget), "positive int")
+
+    return _external_sort(key, iterable, budget, directory)
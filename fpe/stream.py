@@ -0,0 +1,288 @@
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Iterable, Iterator, List, NoReturn, Tuple, Union
+
+from fpe.asserts import AssertNonCallable, AssertWrongValue
+from fpe.builtins import map_
+from fpe.itertools import chunked, collect, drop, dropWhile, take, takeWhile
+
+Stage = Tuple[str, Tuple[Any, ...]]
+
+# stages which are fused into single loop, with number of their arguments
+FUSIBLE = {"map": 1, "filter": 1, "collect": 2, "take": 1, "drop": 1, "takeWhile": 1, "dropWhile": 1}
+
+# curried functions which are recognized by Stream.apply, with stages they are turned into
+VOCABULARY = {map_.func: "map", collect.func: "collect", take.func: "take", drop.func: "drop",
+              takeWhile.func: "takeWhile", dropWhile.func: "dropWhile"}
+
+
+def _fused_source(shape: Tuple[str, ...], fold: bool) -> str:
+    """Return source of function which runs all stages of given shape in single loop.
+
+    Stages are turned into nested if statements, so that an item which is
+    filtered out skips the rest of stages, and take sets stop flag, so that
+    loop is stopped after the last taken item passes the rest of stages.
+    Function is generator, or it folds items if fold is True.
+    """
+
+    params = ["source"]
+    prologue = []
+    body = []
+    indent = 2
+    exit_ = "return acc" if fold else "return"
+
+    for num, kind in enumerate(shape):
+        pad = "    " * indent
+        params.extend("a{}_{}".format(num, i) for i in range(FUSIBLE[kind]))
+        arg, arg2 = "a{}_0".format(num), "a{}_1".format(num)
+
+        if kind == "map":
+            body.append("{}item = {}(item)".format(pad, arg))
+
+        elif kind == "filter":
+            body.append("{}if {}(item):".format(pad, arg))
+            indent += 1
+
+        elif kind == "collect":
+            body.append("{}if {}(item):".format(pad, arg))
+            body.append("{}    item = {}(item)".format(pad, arg2))
+            indent += 1
+
+        elif kind == "take":
+            prologue.extend(("    if {} == 0:".format(arg), "        " + exit_, "    stop = False"))
+            body.append("{}{} -= 1".format(pad, arg))
+            body.append("{}if {} == 0:".format(pad, arg))
+            body.append("{}    stop = True".format(pad))
+
+        elif kind == "drop":
+            body.append("{}if {} > 0:".format(pad, arg))
+            body.append("{}    {} -= 1".format(pad, arg))
+            body.append("{}else:".format(pad))
+            indent += 1
+
+        elif kind == "takeWhile":
+            body.append("{}if not {}(item):".format(pad, arg))
+            body.append("{}    {}".format(pad, exit_))
+
+        elif kind == "dropWhile":
+            prologue.append("    dropping{} = True".format(num))
+            body.append("{}if not (dropping{} and {}(item)):".format(pad, num, arg))
+            body.append("{}    dropping{} = False".format(pad, num))
+            indent += 1
+
+    if fold:
+        params.extend(("func", "acc"))
+        body.append("{}acc = func(acc, item)".format("    " * indent))
+
+    else:
+        body.append("{}yield item".format("    " * indent))
+
+    if "take" in shape:
+        body.extend(("        if stop:", "            " + exit_))
+
+    lines = ["def fused({}):".format(", ".join(params))] + prologue + ["    for item in source:"] + body
+
+    if fold:
+        lines.append("    return acc")
+
+    return "\n".join(lines) + "\n"
+
+
+@lru_cache(maxsize=256)
+def _compile(shape: Tuple[str, ...], fold: bool) -> Callable:
+    # code depends on kinds of stages only, their arguments are passed to function
+    namespace = {}
+    exec(compile(_fused_source(shape, fold), "<fpe.stream {}>".format("/".join(shape)), "exec"), namespace)
+
+    return namespace["fused"]
+
+
+class Stream:
+    """Builder of iteration pipeline which is run as single loop.
+
+    Chain of map, filter, take and similar stages is fused into a generated
+    loop, so that every item passes all stages without generator layers.
+    Stream object is immutable, every method returns new Stream, so that
+    pipeline may be reused with the same or another source.
+    E.g.
+        Stream(records).filter(valid).map(parse).take(100).fold(merge, {})
+        list(Stream(range(10)).apply(takeWhile(lambda x: x < 5)).map(plus(1)))  # [1, 2, 3, 4, 5]
+
+    Stages which can not be fused, e.g. mapChunks or unknown functions of apply,
+    split pipeline to several fused loops, see plan.
+
+    Note.
+        Stream is iterated lazily, source is consumed once per iteration.
+    """
+
+    def __init__(self, source: Iterable, stages: Tuple[Stage, ...] = ()):
+        self._source = source
+        self._stages = stages
+
+    def _stage(self, kind: str, *args: Any) -> "Stream":
+        return Stream(self._source, self._stages + ((kind, args),))
+
+    def _callable_stage(self, kind: str, *funcs: Callable) -> "Stream":
+
+        # only callable
+        assert all(callable(i) for i in funcs), AssertNonCallable()
+
+        return self._stage(kind, *funcs)
+
+    def _number_stage(self, kind: str, num: int) -> "Stream":
+
+        # only not negative int, as islice demands
+        assert isinstance(num, int) and num >= 0, AssertWrongValue(str(num), "not negative int")
+
+        return self._stage(kind, num)
+
+    def map(self, func: Callable) -> "Stream":
+        return self._callable_stage("map", func)
+
+    def filter(self, predicate: Callable[..., bool]) -> "Stream":
+        return self._callable_stage("filter", predicate)
+
+    def collect(self, predicate: Callable[..., bool], func: Callable) -> "Stream":
+        """Combined filter and map, see fpe.itertools.collect."""
+
+        return self._callable_stage("collect", predicate, func)
+
+    def take(self, num: int) -> "Stream":
+        return self._number_stage("take", num)
+
+    def drop(self, num: int) -> "Stream":
+        return self._number_stage("drop", num)
+
+    def takeWhile(self, predicate: Callable[..., bool]) -> "Stream":
+        return self._callable_stage("takeWhile", predicate)
+
+    def dropWhile(self, predicate: Callable[..., bool]) -> "Stream":
+        return self._callable_stage("dropWhile", predicate)
+
+    def mapChunks(self, func: Callable, size: int) -> "Stream":
+        """Apply func to chunks of size items, and continue with items of its results.
+
+        It is intended for vectorized functions, e.g. numpy ones, chunks of
+        sequences are slices, so that chunks of numpy array are views.
+        E.g.
+            Stream(array).mapChunks(numpy.sqrt, 4096).filter(lambda x: x > 1)
+        """
+
+        # only callable
+        assert callable(func), AssertNonCallable()
+        # only positive int
+        assert isinstance(size, int) and size > 0, AssertWrongValue(str(size), "positive int")
+
+        return self._stage("chunks", func, size)
+
+    def apply(self, op: Callable[[Iterable], Iterable]) -> "Stream":
+        """Apply function of iterable, curried functions of fpe.itertools are fused.
+
+        Recognized functions are map_, collect, take, drop, takeWhile and dropWhile,
+        which wait for iterable only, any other function splits loop.
+        E.g.
+            Stream(items).apply(collect(even, plus(1))).apply(take(10))
+        """
+
+        # only callable
+        assert callable(op), AssertNonCallable()
+
+        kind = VOCABULARY.get(getattr(op, "func", None)) if getattr(op, "is_curried", False) else None
+
+        if kind is not None and len(op.args) == FUSIBLE[kind] and not getattr(op, "kwargs", None):
+            return getattr(self, kind)(*op.args)
+
+        return self._stage("apply", op)
+
+    def _segments(self) -> List[Tuple[bool, Tuple[Stage, ...]]]:
+        """Split stages to fused loops and single not fusible stages."""
+
+        segments: List[Tuple[bool, Tuple[Stage, ...]]] = []
+        fused: List[Stage] = []
+
+        for stage in self._stages:
+            if stage[0] in FUSIBLE:
+                fused.append(stage)
+                continue
+
+            if fused:
+                segments.append((True, tuple(fused)))
+                fused = []
+
+            segments.append((False, (stage,)))
+
+        if fused or not segments or not segments[-1][0]:
+            # fold is always run by fused loop
+            segments.append((True, tuple(fused)))
+
+        return segments
+
+    @staticmethod
+    def _run_segment(fused: bool, stages: Tuple[Stage, ...], source: Iterable, *fold: Any) -> Any:
+
+        if fused:
+            func = _compile(tuple(i[0] for i in stages), bool(fold))
+
+            return func(source, *chain.from_iterable(i[1] for i in stages), *fold)
+
+        kind, args = stages[0]
+
+        if kind == "chunks":
+            return chain.from_iterable(map(args[0], chunked(args[1], source)))
+
+        return args[0](source)
+
+    def _run(self, *fold: Any) -> Any:
+        segments = self._segments()
+        result = self._source
+
+        for num, (fused, stages) in enumerate(segments):
+            last = num == len(segments) - 1
+            result = self._run_segment(fused, stages, result, *(fold if last else ()))
+
+        return result
+
+    def __iter__(self) -> Iterator:
+        return iter(self._run())
+
+    def fold(self, func: Callable, init: Any) -> Union[Any, NoReturn]:
+        """Left fold of stream items, it runs in the fused loop as well.
+
+        Thus Stream(xs).fold(f, init) == foldl(f, init, Stream(xs))
+        """
+
+        # only callable
+        assert callable(func), AssertNonCallable()
+
+        return self._run(func, init)
+
+    def plan(self) -> str:
+        """Return description of loops which pipeline is run by, one line per loop.
+
+        E.g.
+            Stream(xs).map(f).take(5).mapChunks(g, 1024).filter(h).plan()
+            fused loop: map(f) -> take(5)
+            chunks of 1024: mapChunks(g)
+            fused loop: filter(h)
+        """
+
+        def describe(stage: Stage) -> str:
+            return "{}({})".format(stage[0], ", ".join(getattr(i, "__name__", repr(i)) for i in stage[1]))
+
+        lines = []
+
+        for fused, stages in self._segments():
+            if fused:
+                lines.append("fused loop: " + (" -> ".join(map(describe, stages)) or "<no stages>"))
+
+            elif stages[0][0] == "chunks":
+                func, size = stages[0][1]
+                lines.append("chunks of {}: mapChunks({})".format(size, getattr(func, "__name__", repr(func))))
+
+            else:
+                lines.append("not fused: " + describe(stages[0]))
+
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return "{}: {} stages".format(self.__class__.__name__, len(self._stages))
@@ -0,0 +1,348 @@
+from operator import and_
+from typing import Any, Callable, Iterable, Iterator, List, NoReturn, Optional, Tuple, Union
+
+from fpe.aitertools import AnyIterable, aiter_
+from fpe.asserts import AssertNonCallable, AssertWrongArgumentType, AssertWrongValue
+from fpe.functions import curry, enrichFunction
+from fpe.monoid import AbstractMonoid
+from fpe.seqtools import Reduced, foldl
+
+Transducer = Callable[[Callable], "Reducer"]
+
+
+def _unreduced(acc: Any) -> Any:
+    return acc.value if acc.__class__ is Reduced else acc
+
+
+def _ensure_reduced(acc: Any) -> Reduced:
+    return acc if acc.__class__ is Reduced else Reduced(acc)
+
+
+def _completed(acc: Any) -> Any:
+    return acc
+
+
+class Reducer:
+    """Reducing function, step(acc, item) returns new accumulator, and its completion.
+
+    Completion complete(acc) is called once after the last step, e.g. to flush
+    buffered items. Step may return seqtools.reduced(acc) to stop reduction.
+    Reducer is callable as its step, so that it may be used as an ordinary reducing function.
+    Reducers of stateful transducers, e.g. ttake, keep state of the current reduction until
+    it is completed, so that such reducer may be reused only after complete is called.
+    E.g.
+        rf = ttake(2)(add)
+        foldl(rf, 0, [1, 2, 3]) == 3
+        rf.complete(3)  # counter is reset
+    """
+
+    __slots__ = ("step", "complete")
+
+    def __init__(self, step: Callable[[Any, Any], Any], complete: Callable[[Any], Any] = _completed):
+
+        # only callable
+        assert callable(step) and callable(complete), AssertNonCallable()
+
+        self.step = step
+        self.complete = complete
+
+    def __call__(self, acc: Any, item: Any) -> Any:
+        return self.step(acc, item)
+
+    def __repr__(self):
+        return "{}: <{}>".format(self.__class__.__name__, getattr(self.step, "__qualname__", self.step))
+
+
+def reducer(func: Union[Callable[[Any, Any], Any], Reducer]) -> Reducer:
+    """Return Reducer of ordinary reducing function, Reducer is returned as is."""
+
+    if isinstance(func, Reducer):
+        return func
+
+    return Reducer(func)
+
+
+@curry
+def tmap(func: Callable, rf: Callable) -> Union[Reducer, NoReturn]:
+    """Transducer which applies func to every item.
+
+    Transducers are composed by `*` in order items are processed, e.g.
+    tmap(f) * tfilter(p) maps items then filters them, as Clojure comp does.
+    E.g.
+        transduce(tmap(plus(1)) * tfilter(even), add, 0, [1, 2, 3])  # 6 == 2 + 4
+    """
+
+    # only callable
+    assert callable(func), AssertNonCallable()
+
+    rf = reducer(rf)
+    step = rf.step
+
+    def mapping(acc: Any, item: Any) -> Any:
+        return step(acc, func(item))
+
+    return Reducer(mapping, rf.complete)
+
+
+@curry
+def tfilter(predicate: Callable[..., bool], rf: Callable) -> Union[Reducer, NoReturn]:
+    """Transducer which passes items which satisfy predicate."""
+
+    # only callable
+    assert callable(predicate), AssertNonCallable()
+
+    rf = reducer(rf)
+    step = rf.step
+
+    def filtering(acc: Any, item: Any) -> Any:
+        return step(acc, item) if predicate(item) else acc
+
+    return Reducer(filtering, rf.complete)
+
+
+@curry
+def ttake(num: int, rf: Callable) -> Union[Reducer, NoReturn]:
+    """Transducer which passes the first num items and stops reduction after them."""
+
+    # only not negative int
+    assert isinstance(num, int) and num >= 0, AssertWrongValue(str(num), "not negative int")
+
+    rf = reducer(rf)
+    step, complete = rf.step, rf.complete
+    # counter is created for every application to rf and it is reset by completion, so that reducer may be reused
+    left = [num]
+
+    def taking(acc: Any, item: Any) -> Any:
+        if left[0] > 0:
+            acc = step(acc, item)
+
+        left[0] -= 1
+
+        return _ensure_reduced(acc) if left[0] <= 0 else acc
+
+    def completing(acc: Any) -> Any:
+        left[0] = num
+
+        return complete(acc)
+
+    return Reducer(taking, completing)
+
+
+@curry
+def tpartition(size: int, rf: Callable) -> Union[Reducer, NoReturn]:
+    """Transducer which passes lists of size items, the last list may be shorter.
+
+    Borrowed from Clojure partition-all.
+    """
+
+    # only positive int
+    assert isinstance(size, int) and size > 0, AssertWrongValue(str(size), "positive int")
+
+    rf = reducer(rf)
+    step, complete = rf.step, rf.complete
+    buffer: List[Any] = []
+
+    def partitioning(acc: Any, item: Any) -> Any:
+        buffer.append(item)
+
+        if len(buffer) < size:
+            return acc
+
+        chunk = buffer[:]
+        buffer.clear()
+
+        return step(acc, chunk)
+
+    def completing(acc: Any) -> Any:
+        if buffer:
+            chunk = buffer[:]
+            buffer.clear()
+            acc = _unreduced(step(acc, chunk))
+
+        return complete(acc)
+
+    return Reducer(partitioning, completing)
+
+
+@enrichFunction
+def tdedupe(rf: Callable) -> Reducer:
+    """Transducer which skips items which are equal to previous ones.
+
+    E.g.
+        into([], tdedupe, [1, 1, 2, 1]) == [1, 2, 1]
+    """
+
+    rf = reducer(rf)
+    step, complete = rf.step, rf.complete
+    previous: List[Any] = []
+
+    def deduping(acc: Any, item: Any) -> Any:
+        if previous and previous[0] == item:
+            return acc
+
+        previous[:] = (item,)
+
+        return step(acc, item)
+
+    def completing(acc: Any) -> Any:
+        previous.clear()
+
+        return complete(acc)
+
+    return Reducer(deduping, completing)
+
+
+@enrichFunction
+def tcat(rf: Callable) -> Reducer:
+    """Transducer which passes items of every item, e.g. flattens lists of tpartition."""
+
+    rf = reducer(rf)
+    step = rf.step
+
+    def catting(acc: Any, item: Iterable) -> Any:
+        for i in item:
+            acc = step(acc, i)
+
+            if acc.__class__ is Reduced:
+                # stays reduced, so that outer reduction stops as well
+                return acc
+
+        return acc
+
+    return Reducer(catting, rf.complete)
+
+
+@curry
+def transduce(xform: Transducer, func: Callable, init: Any, iterable: Iterable) -> Union[Any, NoReturn]:
+    """Reduce iterable in single pass with func transformed by transducer xform.
+
+    Reduction runs through seqtools.foldl, so that it stops when reduced accumulator
+    is returned, and then completion is applied.
+    E.g.
+        transduce(tfilter(odd) * ttake(2), add, 0, count())  # 4 == 1 + 3
+    """
+
+    # only callable
+    assert callable(xform) and callable(func), AssertNonCallable()
+
+    rf = reducer(xform(reducer(func)))
+
+    return rf.complete(foldl(rf.step, init, iterable))
+
+
+def _append(acc: Any, item: Any) -> Any:
+    acc.append(item)
+
+    return acc
+
+
+def _add(acc: Any, item: Any) -> Any:
+    acc.add(item)
+
+    return acc
+
+
+def _write(acc: Any, item: Any) -> Any:
+    acc.write(item)
+
+    return acc
+
+
+def _sink(sink: Any) -> Optional[Tuple[Callable[[Any, Any], Any], Any]]:
+    """Return reducing function and initial accumulator for sink, or None for unknown sink."""
+
+    if isinstance(sink, type) and issubclass(sink, AbstractMonoid):
+        return and_, sink.mempty()
+
+    if isinstance(sink, AbstractMonoid):
+        return and_, sink
+
+    for method, func in (("append", _append), ("add", _add), ("write", _write)):
+        if callable(getattr(sink, method, None)):
+            return func, sink
+
+    return None
+
+
+@curry
+def into(sink: Any, xform: Transducer, iterable: Iterable) -> Union[Any, NoReturn]:
+    """Put items of iterable transformed by transducer xform into sink, and return sink.
+
+    Sink is list-like object with append, set-like one with add, file-like one with write,
+    or monoid, in the latter case Monoid class or value is given and the new value is returned.
+    E.g.
+        into([], tmap(str) * ttake(3), count()) == ["0", "1", "2"]
+        into(Sum, tmap(Sum), [1, 2, 3]) == Sum(6)
+        into(file, tmap("{}\\n".format), records)
+    """
+
+    found = _sink(sink)
+
+    # only known sink
+    assert found is not None, AssertWrongArgumentType("Monoid or object with append, add or write method")
+
+    return transduce(xform, found[0], found[1], iterable)
+
+
+def _eduction(xform: Transducer, iterable: Iterable) -> Iterator:
+
+    buffer: List[Any] = []
+    rf = reducer(xform(Reducer(_append)))
+    step = rf.step
+
+    for item in iterable:
+        acc = step(buffer, item)
+        yield from buffer
+        buffer.clear()
+
+        if acc.__class__ is Reduced:
+            break
+
+    rf.complete(buffer)
+    yield from buffer
+
+
+@curry
+def eduction(xform: Transducer, iterable: Iterable) -> Union[Iterator, NoReturn]:
+    """Lazy iterator of items of iterable transformed by transducer xform.
+
+    Items are processed one by one, so that it may be used with infinite iterables or Stream.apply.
+    E.g.
+        list(eduction(tpartition(2), range(5))) == [[0, 1], [2, 3], [4]]
+
+    Borrowed from Clojure eduction.
+    """
+
+    # only callable
+    assert callable(xform), AssertNonCallable()
+
+    return _eduction(xform, iterable)
+
+
+async def _atransduce(rf: Reducer, init: Any, iterable: AnyIterable) -> Any:
+
+    acc = init
+    step = rf.step
+
+    async for item in aiter_(iterable):
+        acc = step(acc, item)
+
+        if acc.__class__ is Reduced:
+            acc = acc.value
+            break
+
+    return rf.complete(acc)
+
+
+@curry
+def atransduce(xform: Transducer, func: Callable, init: Any, iterable: AnyIterable) -> Union[Any, NoReturn]:
+    """Awaitable transduce of async or ordinary iterable, see transduce.
+
+    E.g.
+        await atransduce(tmap(parse) * tfilter(valid), add, 0, read_lines())
+    """
+
+    # only callable
+    assert callable(xform) and callable(func), AssertNonCallable()
+
+    return _atransduce(reducer(xform(reducer(func))), init, iterable)
@@ -1,3 +1,4 @@
+import asyncio
 import operator
 
 import hypothesis.strategies as st
@@ -84,3 +85,14 @@ def plus_(x, y):
 
 def minus_(x, y):
     return y - x
+
+
+def run(coroutine):
+    """Run coroutine in new event loop, asyncio.run is not available in python 3.6."""
+
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
@@ -0,0 +1,102 @@
+import asyncio
+from itertools import accumulate, dropwhile, filterfalse, islice, takewhile, zip_longest
+from operator import add
+from unittest import TestCase, main
+
+from hypothesis import given, settings
+import hypothesis.strategies as st
+
+from fpe.aitertools import (accumulate_, amap, collect, drop, dropWhile, partition, take, takeWhile, zipPad,
+                            zipWith)
+from fpe.base import odd
+
+from .stuff import plus, run
+
+
+async def to_list(aiterable):
+    return [i async for i in aiterable]
+
+
+async def agen(iterable, log=None):
+    for i in iterable:
+        await asyncio.sleep(0)
+
+        if log is not None:
+            log.append(i)
+
+        yield i
+
+
+async def aodd(x):
+    await asyncio.sleep(0)
+    return odd(x)
+
+
+class TestAIterTools(TestCase):
+
+    @given(st.lists(st.integers()), st.integers(min_value=-1, max_value=10))
+    def test_take_drop(self, s, x):
+
+        log = []
+
+        self.assertSequenceEqual(run(to_list(take(x, agen(s, log)))), list(islice(s, max(x, 0))))
+        self.assertSequenceEqual(log, s[:max(x, 0)])
+        self.assertSequenceEqual(run(to_list(drop(x)(agen(s)))), s[max(x, 0):])
+        self.assertSequenceEqual(run(to_list(take(x, s))), list(islice(s, max(x, 0))))
+
+    @given(st.lists(st.integers()))
+    def test_while(self, s):
+
+        self.assertSequenceEqual(run(to_list(takeWhile(odd, agen(s)))), list(takewhile(odd, s)))
+        self.assertSequenceEqual(run(to_list(takeWhile(aodd)(s))), list(takewhile(odd, s)))
+        self.assertSequenceEqual(run(to_list(dropWhile(odd, agen(s)))), list(dropwhile(odd, s)))
+        self.assertSequenceEqual(run(to_list(dropWhile(aodd)(s))), list(dropwhile(odd, s)))
+
+    @given(st.lists(st.integers()), st.lists(st.integers()))
+    def test_zip(self, s1, s2):
+
+        self.assertSequenceEqual(run(to_list(zipWith(plus, agen(s1), s2))), list(map(plus, s1, s2)))
+        self.assertSequenceEqual(run(to_list(zipPad(0, s1)(agen(s2)))), list(zip_longest(s1, s2, fillvalue=0)))
+
+    @given(st.lists(st.integers()))
+    def test_collect_accumulate(self, s):
+
+        self.assertSequenceEqual(run(to_list(collect(aodd, plus(1), agen(s)))), [i + 1 for i in s if odd(i)])
+        self.assertSequenceEqual(run(to_list(accumulate_(add, agen(s)))), list(accumulate(s, add)))
+
+    @given(st.lists(st.integers()))
+    def test_partition(self, s):
+
+        async def both():
+            trues, falses = partition(aodd, agen(s))
+            return await asyncio.gather(to_list(trues), to_list(falses))
+
+        self.assertSequenceEqual(run(both()), [list(filter(odd, s)), list(filterfalse(odd, s))])
+
+        trues, falses = partition(odd, s)
+        self.assertSequenceEqual(run(to_list(falses)), list(filterfalse(odd, s)))
+        self.assertSequenceEqual(run(to_list(trues)), list(filter(odd, s)))
+
+    @settings(deadline=None)
+    @given(st.lists(st.integers()), st.integers(min_value=1, max_value=5))
+    def test_amap(self, s, x):
+
+        running = []
+
+        async def slow(y):
+            running.append(y)
+            # running calls never exceed limit
+            self.assertLessEqual(len(running), x)
+            await asyncio.sleep(0.001 * (y % 3))
+            running.remove(y)
+            return y + 1
+
+        self.assertSequenceEqual(run(to_list(amap(slow, agen(s), x))), [i + 1 for i in s])
+        self.assertSequenceEqual(sorted(run(to_list(amap(slow, s, limit=x, ordered=False)))),
+                                 sorted(i + 1 for i in s))
+        self.assertSequenceEqual(run(to_list(amap(plus(1), s))), [i + 1 for i in s])
+        self.assertRaises(AssertionError, amap, slow, s, 0)
+
+
+if __name__ == '__main__':
+    main()
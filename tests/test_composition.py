@@ -1,3 +1,4 @@
+import pickle
 from sys import maxsize
 from unittest import TestCase, main
 
@@ -146,6 +147,16 @@ class TestComposition(TestCase):
         self.assertRaises(AssertionError, FunctionComposition, plus, f2)
         self.assertRaises(AssertionError, FunctionComposition, plus_, f2)
 
+    @given(st.integers(), st.integers())
+    def test_composition_pickle(self, x, y):
+
+        composed = plus(x) * to_int / mul(x) / id_
+        restored = pickle.loads(pickle.dumps(composed))
+
+        self.assertIsInstance(restored, FunctionComposition)
+        self.assertEqual(restored(y), composed(y))
+        self.assertEqual(pickle.loads(pickle.dumps(plus))(x)(y), plus(x, y))
+
 
 if __name__ == '__main__':
     main()
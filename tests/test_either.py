@@ -4,9 +4,12 @@ from unittest import TestCase, main
 import hypothesis.strategies as st
 from hypothesis import assume, given
 
-from fpe.either import (Either, Left, Right, either, fromLeft, fromRight,
-                        lefts, rights)
+from fpe.applicative import AbstractApplicative, liftA
+from fpe.either import (Either, LazyRight, Left, Right, either, fromLeft,
+                        fromRight, lefts, rights)
 from fpe.functor import fmap
+from fpe.monad import KleisliComposition
+from fpe.monad import kleisli as kleisli_composition
 from fpe.misc.satisfying_checks import (applicative_simple_satisfy_check,
                                         associative_operation_simple_satisfy_check,
                                         fmap_simple_satisfy_check,
@@ -249,6 +252,75 @@ class TestEither(TestCase):
             self.assertEqual((left_x >> func) % left_x, left_x)
             self.assertEqual((left_y >> func) % left_y, left_y)
 
+    @given(st.integers(), random_lefts)
+    def test_lazy(self, x, left):
+
+        calls = []
+
+        def track(value):
+            calls.append(value)
+            return value
+
+        lazy = Right(x).lazy() | track | neg | abs | to_str
+
+        self.assertIsInstance(lazy, LazyRight)
+        self.assertEqual(calls, [])
+        self.assertEqual(lazy, Right(to_str(abs(neg(x)))))
+        self.assertEqual(Right(to_str(abs(neg(x)))), lazy)
+        self.assertEqual(lazy.force(), Right(to_str(abs(neg(x)))))
+        self.assertEqual(fromRight("", lazy), to_str(abs(neg(x))))
+        self.assertEqual(calls, [x])
+
+        self.assertTrue(fmap_simple_satisfy_check(Right(x).lazy(), abs, neg))
+        self.assertIs(left.lazy(), left)
+        self.assertIs(left.lazy() | neg, left)
+        self.assertRaises(AssertionError, lazy.fmap, x)
+
+    @given(st.integers())
+    def test_kleisli(self, x):
+
+        calls = []
+
+        def positive(value):
+            calls.append(value)
+            return Right(value) if value > 0 else Left("negative")
+
+        composed = kleisli_composition(positive, kleisli_right(neg), kleisli_right(to_str))
+
+        self.assertIsInstance(composed, KleisliComposition)
+        self.assertEqual(len(composed.func), 3)
+        self.assertEqual(composed(x), Right(x) >> positive >> kleisli_right(neg) >> kleisli_right(to_str))
+        self.assertEqual(calls, [x, x])
+        self.assertEqual((kleisli_composition(positive) >> kleisli_right(neg))(x),
+                         Right(x) >> positive >> kleisli_right(neg))
+        self.assertEqual((positive >> kleisli_composition(kleisli_left(neg)) >> positive)(x),
+                         Right(x) >> positive >> kleisli_left(neg) >> positive)
+
+        # laws
+        self.assertEqual(kleisli_composition(Either.pure, positive)(x), positive(x))
+        self.assertEqual(kleisli_composition(positive, Either.pure)(x), positive(x))
+        self.assertEqual(kleisli_composition(kleisli_composition(positive, kleisli_right(neg)), positive)(x),
+                         kleisli_composition(positive, kleisli_composition(kleisli_right(neg), positive))(x))
+
+        self.assertRaises(AssertionError, kleisli_composition)
+        self.assertRaises(AssertionError, kleisli_composition, positive, x)
+
+    @given(st.lists(int_eithers, min_size=1, max_size=8))
+    def test_lift(self, eithers):
+
+        def total(*args):
+            return sum(args)
+
+        expected = AbstractApplicative.liftA.__func__(Either, total, *eithers)
+        lefts_ = [i for i in eithers if isinstance(i, Left)]
+
+        self.assertEqual(liftA(total, *eithers), expected)
+        self.assertEqual(Either.liftA(total, *eithers), expected)
+        self.assertEqual(expected, lefts_[0] if lefts_ else Right(sum(i._value for i in eithers)))
+        self.assertEqual(Either.liftA2(plus, eithers[0], eithers[-1]), (eithers[0] | plus) % eithers[-1])
+        self.assertRaises(AssertionError, liftA, total, eithers[0], 0)
+        self.assertRaises(AssertionError, Either.liftA, total)
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,216 @@
+import asyncio
+from itertools import count
+from unittest import TestCase, main
+
+from hypothesis import given, settings
+import hypothesis.strategies as st
+
+from fpe.either import Left, Right
+from fpe.exceptions import (AsyncSafeFunction, ExceptionSummary, SafeFunction, agatherEither, asafe,
+                            asafeWith, atry_, atryWith, safe, safeWith, stripTraceback, summariseException,
+                            try_, tryMap, tryMapWith, tryWith)
+
+from .stuff import random_types, run
+
+
+def div(x, y):
+    return x // y
+
+
+def raise_fatal(_):
+    raise RuntimeError("fatal")
+
+
+async def adiv(x, y):
+    await asyncio.sleep(0)
+    return x // y
+
+
+class TestExceptions(TestCase):
+
+    @given(st.integers(), st.integers())
+    def test_try(self, x, y):
+
+        if y:
+            self.assertEqual(try_(div, x, y), Right(x // y))
+            self.assertEqual(try_(lambda: div(x, y)), Right(x // y))
+        else:
+            self.assertIsInstance(try_(div, x, y)._value, ZeroDivisionError)
+            self.assertIsNotNone(try_(div, x, y)._value.__traceback__)
+
+        self.assertEqual(try_(x), Right(x))
+        self.assertRaises(AssertionError, try_, x, y)
+        self.assertRaises(RuntimeError, try_, raise_fatal, x)
+
+    @given(st.integers())
+    def test_try_with(self, x):
+
+        stripped = tryWith(stripTraceback, div, x, 0)
+        summary = tryWith(summariseException, div, x, 0)
+
+        self.assertIsInstance(stripped, Left)
+        self.assertIsInstance(stripped._value, ZeroDivisionError)
+        self.assertIsNone(stripped._value.__traceback__)
+
+        self.assertIsInstance(summary, Left)
+        self.assertIsInstance(summary._value, ExceptionSummary)
+        self.assertIs(summary._value.type, ZeroDivisionError)
+        self.assertEqual(summary._value.origin[1:], (div.__code__.co_firstlineno + 1, "div"))
+
+        self.assertEqual(tryWith(stripTraceback, div, x, 1), Right(x))
+        self.assertEqual(tryWith(stripTraceback, x), Right(x))
+        self.assertRaises(AssertionError, tryWith, x, div, x, 1)
+        self.assertRaises(RuntimeError, tryWith, stripTraceback, raise_fatal, x)
+
+    def test_strip_chained(self):
+
+        try:
+            try:
+                div(1, 0)
+            except ZeroDivisionError as exc:
+                raise ValueError("wrong") from exc
+        except ValueError as exc:
+            error = exc
+
+        self.assertIs(stripTraceback(error), error)
+        self.assertIsNone(error.__traceback__)
+        self.assertIsNone(error.__cause__.__traceback__)
+
+    @given(st.integers(), st.integers())
+    def test_safe(self, x, y):
+
+        safe_div = safe(div)
+
+        self.assertIsInstance(safe_div, SafeFunction)
+
+        if y:
+            self.assertEqual(safe_div(x, y), Right(x // y))
+        else:
+            self.assertIsInstance(safe_div(x, y)._value, ZeroDivisionError)
+
+        self.assertEqual(safeWith(summariseException)(div)(x, y),
+                         Right(x // y) if y else Left(summariseException(try_(div, x, y)._value)))
+        self.assertRaises(RuntimeError, safe(raise_fatal), x)
+        self.assertRaises(AssertionError, safe, x)
+
+    @settings(deadline=None)
+    @given(st.lists(st.integers(), max_size=10), st.integers(min_value=-1, max_value=1))
+    def test_try_map(self, s, y):
+
+        expected = [try_(div, i, y) for i in s * 1000]
+
+        result = list(tryMap(lambda i: div(i, y), s * 1000))
+        self.assertEqual([type(i) for i in result], [type(i) for i in expected])
+        self.assertEqual([i for i in result if isinstance(i, Right)], [i for i in expected if isinstance(i, Right)])
+
+        result = list(tryMapWith(summariseException)(lambda i: div(i, y))(iter(s * 1000)))
+        self.assertEqual([type(i) for i in result], [type(i) for i in expected])
+        self.assertTrue(all(isinstance(i._value, ExceptionSummary) for i in result if isinstance(i, Left)))
+
+    def test_try_map_lazy(self):
+
+        calls = []
+
+        def record(i):
+            calls.append(i)
+            return 1 // i
+
+        result = tryMap(record, count())
+
+        # items are processed as they are consumed
+        self.assertIsInstance(next(result)._value, ZeroDivisionError)
+        self.assertEqual(next(result), Right(1))
+        self.assertEqual(calls, [0, 1])
+        # exceptions of consumer are not handled
+        self.assertRaises(ValueError, result.throw, ValueError("consumer"))
+
+    @given(st.lists(random_types))
+    def test_try_map_fatal(self, s):
+
+        if s:
+            self.assertRaises(RuntimeError, list, tryMap(raise_fatal, s))
+        else:
+            self.assertEqual(list(tryMap(raise_fatal, s)), [])
+
+    @given(st.integers(), st.integers())
+    def test_atry(self, x, y):
+
+        if y:
+            self.assertEqual(run(atry_(adiv, x, y)), Right(x // y))
+            self.assertEqual(run(atry_(adiv(x, y))), Right(x // y))
+            self.assertEqual(run(atry_(div, x, y)), Right(x // y))
+            self.assertEqual(run(asafe(adiv)(x, y)), Right(x // y))
+        else:
+            self.assertIsInstance(run(atry_(adiv, x, y))._value, ZeroDivisionError)
+            self.assertIsInstance(run(atry_(adiv(x, y)))._value, ZeroDivisionError)
+            self.assertIsInstance(run(asafe(adiv)(x, y))._value, ZeroDivisionError)
+            self.assertIsNone(run(atryWith(stripTraceback, adiv, x, y))._value.__traceback__)
+            self.assertIsInstance(run(asafeWith(summariseException, adiv)(x, y))._value, ExceptionSummary)
+
+        self.assertEqual(run(atry_(x)), Right(x))
+        self.assertIsInstance(asafe(adiv), AsyncSafeFunction)
+        self.assertRaises(AssertionError, atry_, x, y)
+
+    def test_atry_fatal(self):
+
+        async def cancelled():
+            raise asyncio.CancelledError()
+
+        async def fatal():
+            raise RuntimeError("fatal")
+
+        self.assertRaises(asyncio.CancelledError, run, atry_(cancelled))
+        self.assertRaises(RuntimeError, run, atry_(fatal))
+        self.assertRaises(RuntimeError, run, asafe(fatal)())
+
+    @given(st.lists(st.tuples(st.integers(), st.integers())), st.none() | st.integers(min_value=1, max_value=5))
+    def test_agather_either(self, s, limit):
+
+        active = []
+        peak = []
+
+        async def tracked(x, y):
+            active.append(None)
+            peak.append(len(active))
+            await asyncio.sleep(0)
+            active.pop()
+            return x // y
+
+        result = run(agatherEither((tracked(x, y) for x, y in s), limit))
+
+        self.assertEqual(len(result), len(s))
+        self.assertEqual([i._value if isinstance(i, Right) else None for i in result],
+                         [x // y if y else None for x, y in s])
+        self.assertTrue(all(isinstance(i._value, ZeroDivisionError) for i in result if isinstance(i, Left)))
+
+        if limit is not None:
+            self.assertLessEqual(max(peak, default=0), limit)
+
+        self.assertRaises(AssertionError, run, agatherEither([], 0))
+
+    def test_gather_either_cancel(self):
+
+        cleaned = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            finally:
+                cleaned.append(True)
+
+        async def fatal():
+            await asyncio.sleep(0)
+            raise RuntimeError("fatal")
+
+        async def gather():
+            try:
+                await agatherEither([slow(), fatal()])
+            except RuntimeError:
+                return list(cleaned)
+
+        # fatal exception is propagated after rest of awaitables are cancelled
+        self.assertEqual(run(gather()), [True])
+
+
+if __name__ == '__main__':
+    main()
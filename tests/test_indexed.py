@@ -0,0 +1,101 @@
+from functools import partial
+from operator import eq
+from unittest import TestCase, main
+
+from hypothesis import given
+import hypothesis.strategies as st
+
+from fpe.functions import monotone, staticCurry
+from fpe.indexed import Indexed, SortedView
+from fpe.maybe import Just, Nothing
+from fpe.seqtools import count, elem, first
+
+# hashable and unhashable items
+items = st.one_of(st.integers(-5, 5), st.lists(st.integers(-2, 2), max_size=2))
+
+
+def index_or_none(sequence, item, start=0, stop=None):
+    try:
+        return sequence.index(item, start, len(sequence) if stop is None else stop)
+
+    except ValueError:
+        return None
+
+
+class TestIndexed(TestCase):
+
+    @given(st.lists(items), st.lists(items), items, st.integers(-10, 10), st.integers(-10, 10))
+    def test_queries(self, s, appended, x, start, stop):
+
+        source = list(s)
+        indexed = Indexed(source)
+
+        for _ in range(2):
+            self.assertEqual(elem(x, indexed), x in source)
+            self.assertEqual(count(x, indexed), source.count(x))
+            self.assertEqual(first(partial(eq, x), indexed), Just(x) if x in source else Nothing())
+            self.assertEqual(index_or_none(indexed, x, start, stop), index_or_none(source, x, start, stop))
+            self.assertSequenceEqual(list(indexed), source)
+            # appended items are indexed incrementally
+            source.extend(appended)
+
+        del source[len(source) // 2:]
+
+        self.assertEqual(count(x, indexed), source.count(x))
+        self.assertEqual(first(staticCurry(2)(eq)(x), indexed), Just(x) if x in source else Nothing())
+
+    @given(st.lists(st.integers(-5, 5)), st.integers(-5, 5))
+    def test_iterable(self, s, x):
+
+        indexed = Indexed(iter(s))
+
+        self.assertEqual(count(x, indexed), s.count(x))
+        self.assertEqual(first(lambda i: i > x, indexed), first(lambda i: i > x, s))
+        self.assertSequenceEqual(indexed[1:], s[1:])
+        self.assertRaises(AssertionError, Indexed, {x: x})
+
+    @given(st.lists(st.integers(-5, 5)), st.integers(-6, 6), st.integers(-10, 10), st.integers(-10, 10))
+    def test_sorted_view(self, s, x, start, stop):
+
+        s.sort()
+        view = SortedView(s)
+
+        self.assertEqual(elem(x, view), x in s)
+        self.assertEqual(count(x, view), s.count(x))
+        self.assertEqual(index_or_none(view, x, start, stop), index_or_none(s, x, start, stop))
+        self.assertEqual(first(partial(eq, x), view), first(lambda i: i == x, s))
+        self.assertEqual(first(monotone(lambda i: i >= x), view), first(lambda i: i >= x, s))
+        self.assertRaises(AssertionError, SortedView, iter(s))
+
+    @given(st.text("abc"), st.binary(max_size=5), st.sampled_from("abcd"))
+    def test_first_search(self, text, data, x):
+
+        self.assertEqual(first(partial(eq, x), text), first(lambda i: i == x, text))
+        self.assertEqual(first(partial(eq, ord(x)), data), first(lambda i: i == ord(x), data))
+        self.assertEqual(first(partial(eq, x), list(text)), first(lambda i: i == x, text))
+        # substring is not an item
+        self.assertEqual(first(partial(eq, x * 2), text), Nothing())
+        self.assertEqual(first(monotone(lambda i: i > x), sorted(text)), first(lambda i: i > x, sorted(text)))
+
+    def test_sorted_not_comparable(self):
+
+        view = SortedView([1, 2, 3])
+
+        # items of other types are not found, as in list
+        for x in (None, "a"):
+            self.assertFalse(elem(x, view))
+            self.assertEqual(count(x, view), 0)
+            self.assertEqual(first(partial(eq, x), view), Nothing())
+            self.assertRaises(ValueError, view.index, x)
+
+    def test_first_not_reflexive(self):
+
+        nan = float("nan")
+
+        # result does not depend on container, NaN is not equal to itself
+        for container in (list, tuple, Indexed, iter):
+            self.assertEqual(first(partial(eq, nan), container([1.0, nan])), Nothing())
+
+
+if __name__ == '__main__':
+    main()
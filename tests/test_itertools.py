@@ -1,16 +1,23 @@
+from operator import truediv
 from sys import maxsize
 from unittest import TestCase, main
-from itertools import dropwhile, takewhile, islice, zip_longest
+from itertools import dropwhile, filterfalse, takewhile, islice, zip_longest
 
-from hypothesis import given
+from hypothesis import given, settings
 import hypothesis.strategies as st
 
 from fpe.base import odd
-from fpe.itertools import drop, take, dropWhile, takeWhile, zipWith, zipPad, zipWithPad
+from fpe.either import Left, Right
+from fpe.functions import id_, monotone, staticCurry
+from fpe.itertools import (batchedBy, chunked, drop, dropLast, dropWhile, pairwise, partition, pmap, slidingFold,
+                           slidingMax, slidingMean, slidingMin, slidingSum, take, takeLast, takeWhile, windowed, zipPad,
+                           zipWith, zipWithPad)
+from fpe.monoid import First, Max
 
-from .stuff import plus
+from .stuff import mul, plus
 
 
+div = staticCurry(2)(truediv)
 seq_of_int = st.lists(st.integers()) | st.tuples(st.integers()) | st.dictionaries(st.integers(), st.integers())
 
 
@@ -32,6 +39,23 @@ class TestIterTools(TestCase):
         self.assertSequenceEqual(list(takeWhile(lambda x: odd(x), s)),
                                 list(takewhile(lambda x: odd(x), s)))
 
+    @given(st.lists(st.integers()), st.integers())
+    def test_monotone_while(self, s, x):
+
+        items = sorted(s)
+        calls = []
+
+        def less(y):
+            calls.append(y)
+            return y < x
+
+        self.assertSequenceEqual(takeWhile(monotone(less), items), list(takewhile(lambda y: y < x, items)))
+        self.assertLessEqual(len(calls), max(len(items), 1).bit_length() + 1)
+        self.assertSequenceEqual(dropWhile(monotone(less))(tuple(items)), tuple(dropwhile(less, items)))
+        self.assertSequenceEqual(takeWhile(monotone(lambda y: y >= x), items), list(takewhile(lambda y: y >= x, items)))
+        self.assertSequenceEqual(list(dropWhile(monotone(less), iter(items))), list(dropwhile(less, items)))
+        self.assertEqual(dropWhile(monotone(lambda y: y < 5), range(10)), range(5, 10))
+
     @given(seq_of_int, st.integers().filter(lambda x: 0 <= x <= maxsize))
     def test_take(self, s, x):
 
@@ -42,6 +66,22 @@ class TestIterTools(TestCase):
 
         self.assertSequenceEqual(list(drop(x, s)), list(islice(s, x, None)))
 
+    @given(st.lists(st.integers()), st.binary(), st.integers(min_value=0, max_value=10))
+    def test_take_drop_slices(self, s, b, x):
+
+        self.assertSequenceEqual(list(take(x, s)), s[:x])
+        self.assertSequenceEqual(tuple(drop(x, tuple(s))), tuple(s[x:]))
+        self.assertSequenceEqual(list(drop(x, range(len(s)))), range(len(s))[x:])
+        self.assertEqual(bytes(take(x, b)), b[:x])
+        self.assertEqual(bytes(drop(x, b)), b[x:])
+        self.assertEqual("".join(drop(x, "abc")), "abc"[x:])
+        # iterators are returned for sequences as well
+        self.assertEqual(next(take(2, [1, 2, 3])), 1)
+        self.assertEqual(next(drop(1, [1, 2, 3])), 2)
+        self.assertEqual(next(takeLast(1, [1, 2, 3])), 3)
+        self.assertEqual(next(dropLast(1, [1, 2, 3])), 1)
+        self.assertRaises(ValueError, take, -1, s)
+
     @given(seq_of_int, seq_of_int, seq_of_int)
     def test_zipwith(self, s1, s2, s3):
 
@@ -69,6 +109,115 @@ class TestIterTools(TestCase):
         self.assertSequenceEqual(list(zipWithPad(plus_3, 0, s1, s2, s3)),
                                  list(plus_3(*i) for i in zip_longest(s1, s2, s3, fillvalue=0)))
 
+    @given(seq_of_int)
+    def test_partition(self, s):
+
+        items = list(s)
+        expected = (list(filter(odd, items)), list(filterfalse(odd, items)))
+        calls = []
+
+        def predicate(x):
+            calls.append(x)
+            return odd(x)
+
+        trues, falses = partition(predicate, iter(items))
+        self.assertSequenceEqual((list(falses), list(trues)), expected[::-1])
+        self.assertSequenceEqual(calls, items)
+        self.assertSequenceEqual(tuple(map(list, partition(odd)(s))), expected)
+        self.assertSequenceEqual(partition(odd, iter(items), eager=True), expected)
+
+        pairs = list(zip_longest(*partition(odd, iter(items)), fillvalue=None))
+        self.assertSequenceEqual([i for i, _ in pairs if i is not None], expected[0])
+        self.assertSequenceEqual([i for _, i in pairs if i is not None], expected[1])
+
+        if len(expected[1]) > 2:
+            trues, _ = partition(odd, iter(items), limit=2)
+            self.assertRaises(BufferError, list, trues)
+
+    @given(seq_of_int, st.binary(), st.integers(min_value=1, max_value=10))
+    def test_chunked(self, s, b, x):
+
+        items = list(s)
+        chunks = [items[i:i + x] for i in range(0, len(items), x)]
+
+        self.assertSequenceEqual([list(i) for i in chunked(x, s)], chunks)
+        self.assertSequenceEqual(list(chunked(x)(iter(items))), [tuple(i) for i in chunks])
+        self.assertTrue(all(isinstance(i, memoryview) for i in chunked(x, b)))
+        self.assertSequenceEqual([bytes(i) for i in chunked(x, b)], [b[i:i + x] for i in range(0, len(b), x)])
+        self.assertRaises(AssertionError, chunked, 0, s)
+
+    @given(seq_of_int, st.integers(min_value=1, max_value=5), st.integers(min_value=1, max_value=5))
+    def test_windowed(self, s, x, y):
+
+        items = list(s)
+        windows = [tuple(items[i:i + x]) for i in range(0, len(items) - x + 1, y)]
+
+        self.assertSequenceEqual([tuple(i) for i in windowed(x, y, s)], windows)
+        self.assertSequenceEqual(list(windowed(x, y)(iter(items))), windows)
+        self.assertRaises(AssertionError, windowed, x, 0, s)
+
+    @given(st.lists(st.integers(-20, 20)), st.integers(min_value=1, max_value=5))
+    def test_sliding(self, s, x):
+
+        windows = [s[i:i + x] for i in range(len(s) - x + 1)]
+
+        self.assertSequenceEqual(list(slidingSum(x, iter(s))), list(map(sum, windows)))
+        self.assertSequenceEqual(list(slidingMean(x, s)), [sum(i) / x for i in windows])
+        self.assertSequenceEqual(list(slidingMin(x, s)), list(map(min, windows)))
+        self.assertSequenceEqual(list(slidingMax(x)(iter(s))), list(map(max, windows)))
+        self.assertSequenceEqual(list(slidingFold(Max, x, s)), [Max(max(i)) for i in windows])
+        # order of items is kept by not commutative semigroup
+        self.assertSequenceEqual(list(slidingFold(First, x, s)), [First(i[0]) for i in windows])
+        self.assertRaises(AssertionError, slidingSum, 0, s)
+
+    @given(seq_of_int, st.integers(min_value=0, max_value=10))
+    def test_take_drop_last(self, s, x):
+
+        items = list(s)
+
+        self.assertSequenceEqual(list(takeLast(x, s)), items[len(items) - x:] if x < len(items) else items)
+        self.assertSequenceEqual(list(takeLast(x, iter(s))), list(takeLast(x, items)))
+        self.assertSequenceEqual(list(dropLast(x, s)), items[:max(len(items) - x, 0)])
+        self.assertSequenceEqual(list(dropLast(x)(iter(s))), list(dropLast(x, items)))
+        self.assertRaises(AssertionError, takeLast, -1, s)
+
+    @given(st.lists(st.text()), st.integers(min_value=0, max_value=10))
+    def test_batchedby(self, s, x):
+
+        batches = list(batchedBy(len, x, s))
+
+        self.assertSequenceEqual([i for batch in batches for i in batch], s)
+        self.assertTrue(all(len(batch) == 1 or sum(map(len, batch)) <= x for batch in batches))
+        self.assertTrue(all(sum(map(len, batches[i] + batches[i + 1][:1])) > x for i in range(len(batches) - 1)))
+
+    @given(seq_of_int)
+    def test_pairwise(self, s):
+
+        self.assertSequenceEqual(list(pairwise(s)), list(zip(s, list(s)[1:])))
+        self.assertSequenceEqual(list(pairwise(iter(s))), list(zip(s, list(s)[1:])))
+
+    @settings(max_examples=20, deadline=None)
+    @given(st.lists(st.integers()), st.integers(min_value=1, max_value=4), st.none() | st.integers(1, 8))
+    def test_pmap_threads(self, s, x, y):
+
+        self.assertSequenceEqual(list(pmap(plus(x), s, workers=x, chunksize=y, executor="thread")),
+                                 [plus(x, i) for i in s])
+        self.assertSequenceEqual(sorted(pmap(plus(x), iter(s), chunksize=y, ordered=False, executor="thread")),
+                                 sorted(plus(x, i) for i in s))
+        self.assertSequenceEqual(list(pmap(div(1), s, executor="thread", capture=type)),
+                                 [Left(ZeroDivisionError) if i == 0 else Right(1 / i) for i in s])
+        self.assertRaises(AssertionError, pmap, plus(x), s, chunksize=0)
+
+    def test_pmap_processes(self):
+
+        s = list(range(-50, 50))
+
+        self.assertSequenceEqual(list(pmap(plus(1) * mul(2) / id_, s, workers=2)), [i * 2 + 1 for i in s])
+        self.assertSequenceEqual(sorted(pmap(mul(3), iter(s), workers=2, chunksize=7, ordered=False)),
+                                 [i * 3 for i in s])
+        self.assertSequenceEqual(list(take(3, pmap(plus(1), iter(range(10 ** 9)), workers=2))), [1, 2, 3])
+        self.assertRaises(ZeroDivisionError, list, pmap(div(1), s, workers=2))
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,100 @@
+import weakref
+from itertools import count
+from operator import neg
+from unittest import TestCase, main
+
+from hypothesis import given
+import hypothesis.strategies as st
+
+from fpe.lazylist import LazyList, cons, iterate_
+from fpe.maybe import Just
+from fpe.misc.satisfying_checks import (applicative_simple_satisfy_check,
+                                        associative_operation_simple_satisfy_check,
+                                        fmap_simple_satisfy_check,
+                                        monad_simple_satisfy_check)
+from fpe.seqtools import count as count_, first, foldl, foldr
+
+from .stuff import plus
+
+
+def counted(iterable, log):
+    for i in iterable:
+        log.append(i)
+        yield i
+
+
+class TestLazyList(TestCase):
+
+    @given(st.lists(st.integers()), st.lists(st.integers()), st.lists(st.integers()), st.integers())
+    def test_laws(self, x, y, z, v):
+
+        lazylist = LazyList(x)
+
+        self.assertTrue(associative_operation_simple_satisfy_check(lazylist, LazyList(y), LazyList(z)))
+        self.assertTrue(fmap_simple_satisfy_check(lazylist, abs, neg))
+        self.assertTrue(applicative_simple_satisfy_check(lazylist, LazyList([neg, abs]), LazyList([abs]), neg, v))
+        self.assertTrue(monad_simple_satisfy_check(
+            lazylist, lambda i: LazyList([i, -i]), lambda i: LazyList([abs(i)] * 2), v))
+
+    @given(st.lists(st.integers()), st.integers(min_value=-20, max_value=20), st.integers(min_value=-20, max_value=20))
+    def test_sequence(self, s, x, y):
+
+        log = []
+        lazylist = LazyList(counted(s, log))
+
+        self.assertEqual(bool(lazylist), bool(s))
+        self.assertSequenceEqual(list(lazylist[:max(x, 0)]), s[:max(x, 0)])
+        self.assertSequenceEqual(list(lazylist[x:y]), s[x:y])
+        self.assertSequenceEqual(list(lazylist[x::2]), s[x::2])
+        self.assertSequenceEqual(list(lazylist), s)
+        self.assertSequenceEqual(list(reversed(lazylist)), s[::-1])
+        self.assertEqual(len(lazylist), len(s))
+        self.assertEqual(lazylist.forced, len(s))
+        # source is iterated once
+        self.assertSequenceEqual(log, s)
+
+        if -len(s) <= x < len(s):
+            self.assertEqual(lazylist[x], s[x])
+
+        else:
+            self.assertRaises(IndexError, lambda: lazylist[x])
+
+        self.assertEqual(cons(x, lazylist), LazyList([x] + s))
+        self.assertIs(cons(x, lazylist).tail, lazylist)
+
+    @given(st.lists(st.integers()))
+    def test_folds(self, s):
+
+        lazylist = LazyList(iter(s))
+
+        self.assertEqual(foldl(plus, 0, lazylist), sum(s))
+        self.assertEqual(foldr(plus, 0, lazylist), sum(s))
+        self.assertEqual(count_(0, lazylist), s.count(0))
+
+    def test_infinite(self):
+
+        log = []
+        naturals = LazyList(counted(count(), log))
+        evens = naturals | (lambda x: x * 2)
+
+        self.assertEqual(evens[10], 20)
+        self.assertSequenceEqual(list(naturals[:5]), [0, 1, 2, 3, 4])
+        self.assertSequenceEqual(log, list(range(11)))
+        self.assertEqual(first(lambda x: x > 100, naturals >> (lambda x: [x, x])), Just(101))
+        self.assertEqual(iterate_(plus(2), 1)[5], 11)
+        self.assertEqual(naturals.head, 0)
+        self.assertRaises(IndexError, lambda: LazyList().head)
+
+    def test_garbage_collection(self):
+
+        lazylist = LazyList(count())
+        head = weakref.ref(lazylist)
+        iterator = iter(lazylist)
+
+        del lazylist
+        self.assertEqual([next(iterator) for _ in range(3)], [0, 1, 2])
+        self.assertIsNone(head())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+from unittest import TestCase, main
+
+import hypothesis.strategies as st
+from hypothesis import given
+
+from fpe.applicative import AbstractApplicative, liftA
+from fpe.maybe import Just, Maybe, Nothing
+
+from .stuff import plus
+
+
+int_maybes = st.one_of(st.builds(Just, st.integers()), st.builds(Nothing))
+
+
+class TestMaybe(TestCase):
+
+    @given(st.lists(int_maybes, min_size=1, max_size=8))
+    def test_lift(self, maybes):
+
+        def total(*args):
+            return sum(args)
+
+        expected = AbstractApplicative.liftA.__func__(Maybe, total, *maybes)
+        nothings = [i for i in maybes if isinstance(i, Nothing)]
+
+        self.assertEqual(liftA(total, *maybes), expected)
+        self.assertEqual(Maybe.liftA(total, *maybes), expected)
+        self.assertEqual(expected, nothings[0] if nothings else Just(sum(i._value for i in maybes)))
+        self.assertEqual(Maybe.liftA2(plus, maybes[0], maybes[-1]), (maybes[0] | plus) % maybes[-1])
+        self.assertRaises(AssertionError, liftA, total, maybes[0], 0)
+        self.assertRaises(AssertionError, Maybe.liftA, total)
+
+
+if __name__ == '__main__':
+    main()
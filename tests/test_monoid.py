@@ -0,0 +1,83 @@
+from functools import reduce
+from operator import and_
+from unittest import TestCase, main
+
+from hypothesis import given
+import hypothesis.strategies as st
+
+from fpe.maybe import Just, Nothing
+from fpe.misc.satisfying_checks import monoid_simple_satisfy_check
+from fpe.monoid import (BOTTOM, TOP, DictMerge, First, Last, ListConcat, Max, Min, Product, StrConcat, Sum,
+                        mconcat)
+
+from .stuff import non_seq
+
+
+ints = st.integers()
+maybe_ints = st.builds(Just, ints) | st.builds(Nothing)
+
+monoids = (
+    (Sum, ints),
+    (Product, ints),
+    (Min, ints),
+    (Max, ints),
+    (Min, st.text()),
+    (Max, st.text()),
+    (First, maybe_ints),
+    (Last, maybe_ints),
+    (StrConcat, st.text()),
+    (ListConcat, st.lists(non_seq)),
+    (DictMerge, st.dictionaries(st.text(), ints)),
+)
+
+
+class TestMonoid(TestCase):
+
+    @given(st.data())
+    def test_laws(self, data):
+
+        for cls, values in monoids:
+            x, y, z = (cls(data.draw(values)) for _ in range(3))
+
+            self.assertTrue(monoid_simple_satisfy_check(x, y, z))
+
+    @given(st.data())
+    def test_mconcat(self, data):
+
+        for cls, values in monoids:
+            items = [cls(i) for i in data.draw(st.lists(values))]
+
+            self.assertEqual(mconcat(cls, items), reduce(and_, items, cls.mempty()))
+            self.assertEqual(mconcat(cls)(iter(items)), cls.mconcat(items))
+
+        self.assertRaises(AssertionError, mconcat, int, [])
+
+    @given(st.lists(st.floats(allow_nan=False, allow_infinity=False, min_value=-1e10, max_value=1e10)))
+    def test_sum_floats(self, s):
+
+        items = [Sum(i) for i in s]
+
+        # bulk sum is the same as fold with `&`
+        self.assertEqual(Sum.mconcat(items), reduce(and_, items, Sum.mempty()))
+
+    @given(st.lists(st.text()))
+    def test_bounds(self, s):
+
+        self.assertEqual(Min.mconcat(Min(i) for i in s), Min(min(s)) if s else Min.mempty())
+        self.assertEqual(Max.mconcat(Max(i) for i in s), Max(max(s)) if s else Max.mempty())
+        self.assertEqual(Min.mempty() & Min("a"), Min("a"))
+        self.assertEqual(Max("a") & Max.mempty(), Max("a"))
+        self.assertTrue(BOTTOM < "a" < TOP and BOTTOM < TOP and not TOP < TOP)
+
+    @given(st.lists(ints), st.lists(ints))
+    def test_first_last(self, x, y):
+
+        items = [First(Nothing())] + [First(i) for i in x]
+
+        self.assertEqual(First.mconcat(items), First(x[0]) if x else First.mempty())
+        self.assertEqual(Last.mconcat(Last(i) for i in y), Last(y[-1]) if y else Last.mempty())
+        self.assertEqual(First(1), First(Just(1)))
+
+
+if __name__ == '__main__':
+    main()
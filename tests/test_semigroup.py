@@ -0,0 +1,45 @@
+from functools import reduce
+from operator import and_
+from unittest import TestCase, main
+
+from hypothesis import given, settings
+import hypothesis.strategies as st
+
+from fpe.either import Left, Right
+from fpe.maybe import Just, Nothing
+from fpe.semigroup import sconcat
+
+from .stuff import random_types
+
+
+random_eithers = st.builds(Left, random_types) | st.builds(Right, random_types)
+random_justs = st.builds(Just, random_eithers)
+
+
+class TestSemigroup(TestCase):
+
+    @given(st.lists(random_eithers, min_size=1), st.lists(random_justs, min_size=1))
+    def test_sconcat(self, eithers, justs):
+
+        self.assertEqual(sconcat(eithers), reduce(and_, eithers))
+        self.assertEqual(sconcat(iter([Nothing()] + justs)), reduce(and_, [Nothing()] + justs))
+        self.assertRaises(AssertionError, sconcat, [])
+
+    @settings(max_examples=20, deadline=None)
+    @given(st.lists(random_eithers, min_size=1), st.integers(min_value=1, max_value=4),
+           st.integers(min_value=1, max_value=8))
+    def test_sconcat_threads(self, eithers, workers, chunksize):
+
+        self.assertEqual(sconcat(eithers, workers=workers, chunksize=chunksize), reduce(and_, eithers))
+        self.assertRaises(AssertionError, sconcat, [], workers=workers)
+
+    def test_sconcat_processes(self):
+
+        eithers = [Left(i) for i in range(100)] + [Right(100), Left(101), Right(102)]
+
+        self.assertEqual(sconcat(eithers, workers=2, executor="process", chunksize=7), Right(100))
+        self.assertRaises(AssertionError, sconcat, eithers, workers=2, executor="fiber")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,254 @@
+from array import array
+from collections import Counter
+from functools import partial, reduce
+from itertools import accumulate, chain, count as counter, takewhile
+from math import fsum, gcd
+from operator import add, and_, eq, mul, sub
+from unittest import TestCase, main, skipUnless
+
+from hypothesis import given, settings
+import hypothesis.strategies as st
+
+from fpe.itertools import accumulate_
+from fpe.misc.dispatch import FOLDS, UFUNCS, register
+from fpe.base import even
+from fpe.maybe import Just, Nothing
+from fpe.monoid import Sum
+from fpe.seqtools import (count, countBy, distinct, first, foldl, foldl_, foldlWhile, foldr,
+                          foldr_, foldrLazy, groupReduce, pall, pany, pfirst, reduced, scanl, scanl_)
+
+try:
+    import numpy
+
+except ImportError:
+    numpy = None
+
+
+class TestSeqTools(TestCase):
+
+    @settings(deadline=None)
+    @given(st.lists(st.integers(-50, 50)), st.integers(1, 8))
+    def test_group_reduce(self, s, x):
+
+        expected = {k: reduce(add, (i for i in s if i % 7 == k), 0) for k in dict.fromkeys(i % 7 for i in s)}
+
+        self.assertEqual(dict(groupReduce(lambda i: i % 7, add, 0, s, budget=x, combine=add)), expected)
+        self.assertEqual(dict(groupReduce(lambda i: i % 7, lambda acc, i: acc & Sum(i), Sum(0))(iter(s), budget=x)),
+                         {k: Sum(v) for k, v in expected.items()})
+        # keys are in order of appearance if state fits budget
+        self.assertSequenceEqual([k for k, _ in groupReduce(lambda i: i % 7, add, 0, s)], list(expected))
+        self.assertRaises(AssertionError, groupReduce, abs, add, 0, s, budget=0)
+
+    def test_group_reduce_combine(self):
+
+        s = [i % 5 for i in range(100)]
+
+        # ints are not semigroups, spilled partial sums can not be combined by `&`
+        self.assertRaises(AssertionError, list, groupReduce(lambda i: i, add, 0, s, budget=2))
+        self.assertEqual(dict(groupReduce(lambda i: i, add, 0, s, budget=2, combine=add)),
+                         {i: 20 * i for i in range(5)})
+
+    @settings(deadline=None)
+    @given(st.lists(st.integers(-50, 50)), st.integers(1, 8))
+    def test_count_by(self, s, x):
+
+        self.assertEqual(dict(countBy(abs, s, budget=x)), Counter(map(abs, s)))
+        self.assertEqual(dict(countBy(abs)(iter(s))), Counter(map(abs, s)))
+
+    @settings(deadline=None)
+    @given(st.lists(st.integers(-50, 50)), st.integers(1, 8))
+    def test_distinct(self, s, x):
+
+        unique = list(dict.fromkeys(s))
+        result = list(distinct(iter(s), budget=x))
+
+        self.assertSequenceEqual(sorted(result), sorted(unique))
+        self.assertSequenceEqual(result[:x + 1], unique[:x + 1])
+        self.assertSequenceEqual(list(distinct(s)), unique)
+
+    @given(st.lists(st.integers(-50, 50)), st.integers(-50, 50))
+    def test_dispatch(self, s, x):
+
+        for func in (add, mul, max, min, and_, sub):
+            for sequence in (s, tuple(s), array("q", s), iter(s)):
+                self.assertEqual(foldl(func, x, sequence), reduce(func, s, x))
+
+            self.assertEqual(foldr(func, x, array("q", s)), reduce(func, reversed(s), x))
+
+            if s:
+                self.assertEqual(foldl_(func, array("q", s)), reduce(func, s))
+                self.assertEqual(foldr_(func, s), reduce(func, reversed(s)))
+
+            else:
+                self.assertRaises(TypeError, foldl_, func, s)
+
+        self.assertEqual(foldl(add, "", map(str, s)), "".join(map(str, s)))
+        self.assertEqual(foldr(add, [], [[i] for i in s]), s[::-1])
+        # float sums are rounded correctly
+        floats = [i / 10 for i in s]
+
+        self.assertAlmostEqual(foldl(add, x, floats), reduce(add, floats, x))
+        self.assertEqual(foldl(add, float(x), floats), fsum([x] + floats))
+        self.assertEqual(foldl(add, 0.1, iter(s)), fsum([0.1] + s))
+
+    def test_register(self):
+
+        def fold_gcd(init, iterable):
+            fold_gcd.calls += 1
+            return reduce(gcd, iterable, init)
+
+        fold_gcd.calls = 0
+        register(gcd, fold=fold_gcd, ufunc="gcd")
+
+        try:
+            self.assertEqual(foldl(gcd, 0, [12, 18, 30]), 6)
+            self.assertEqual(foldl_(gcd, [12, 18, 30]), 6)
+            self.assertEqual(fold_gcd.calls, 2)
+
+        finally:
+            del FOLDS[gcd], UFUNCS[gcd]
+
+        self.assertRaises(AssertionError, register, gcd, fold=1)
+
+    @given(st.lists(st.integers(0, 50)), st.integers(0, 100))
+    def test_reduced(self, s, x):
+
+        def step(acc, i):
+            return reduced(acc) if acc + i > x else acc + i
+
+        expected = ([0] + list(takewhile(lambda acc: acc <= x, accumulate(s))))[-1]
+
+        self.assertEqual(foldl(step, 0, s), expected)
+        self.assertEqual(foldl(step, 0)(chain(s, [x + 1], counter())), foldl(step, 0, s + [x + 1]))
+        self.assertEqual(foldlWhile(lambda acc: acc <= x, add, 0, s), expected)
+        self.assertEqual(foldr(step, 0, s), foldl(step, 0, s[::-1]))
+        scanned = list(takewhile(lambda acc: acc <= x, accumulate([0] + s)))
+        # reduced accumulator is yielded as the last one
+        self.assertEqual(list(scanl(step, 0, s)), scanned + scanned[-1:] * (len(scanned) <= len(s)))
+        self.assertEqual(list(scanl_(add, s)), list(accumulate(s)))
+        self.assertEqual(list(scanl(add, x, [])), [x])
+
+    def test_reduced_lazy(self):
+
+        source = counter()
+
+        self.assertEqual(foldl_(lambda acc, i: reduced(acc) if i > 3 else acc + i, source), 6)
+        self.assertEqual(next(source), 5)
+        self.assertEqual(foldlWhile(lambda acc: acc <= 10, add, 0, source), 6)
+        self.assertEqual(next(source), 8)
+        self.assertEqual(list(scanl(lambda acc, i: reduced(i) if i > 2 else i, 0, counter())), [0, 0, 1, 2, 3])
+        self.assertRaises(TypeError, foldl_, add, [])
+
+    @given(st.lists(st.integers(-50, 50), max_size=300), st.integers(-50, 50))
+    def test_foldr_lazy(self, s, x):
+
+        self.assertEqual(foldrLazy(lambda i, acc: i - acc(), x, s), reduce(lambda acc, i: i - acc, reversed(s), x))
+        self.assertEqual(foldrLazy(lambda i, acc: [i] + acc(), [])(iter(s)), s)
+        # thunk evaluates the rest once
+        self.assertEqual(foldrLazy(lambda i, acc: acc() + acc(), x, s), x * 2 ** len(s))
+
+    def test_foldr_lazy_short_circuit(self):
+
+        source = counter()
+
+        self.assertTrue(foldrLazy(lambda i, acc: i > 3 or acc(), False, source))
+        self.assertEqual(next(source), 5)
+        # fold which is deeper than stack is found as well
+        self.assertEqual(foldrLazy(lambda i, acc: i if i > 50000 else acc(), None, counter()), 50001)
+        self.assertEqual(foldrLazy(lambda i, acc: i + acc(), 0, range(50000)), sum(range(50000)))
+
+    def test_foldr_lazy_escaped_thunk(self):
+
+        # thunks are called after fold has returned, as lazy structure is walked
+        node = foldrLazy(lambda i, acc: (i, acc), None, range(1000))
+        walked = []
+
+        while node is not None:
+            walked.append(node[0])
+            node = node[1]()
+
+        self.assertSequenceEqual(walked, range(1000))
+
+        # escaped thunk which forces the rest of fold strictly
+        node = foldrLazy(lambda i, acc: (i, acc), None, counter())
+        rest = foldrLazy(lambda i, acc: acc if i == 10 else acc(), None, range(10000))
+
+        self.assertEqual(node[1]()[1]()[0], 2)
+        self.assertEqual(rest(), None)
+
+    def test_foldr_lazy_calls(self):
+
+        calls = Counter()
+
+        def plus(i, acc):
+            calls[i] += 1
+
+            return i + acc()
+
+        # func is called once for every item, also for folds deeper than stack
+        self.assertEqual(foldrLazy(plus, 0, range(20000)), sum(range(20000)))
+        self.assertEqual(calls, Counter(range(20000)))
+
+    @settings(deadline=None, max_examples=20)
+    @given(st.lists(st.integers(-50, 50)), st.integers(-50, 50), st.sampled_from([None, 1, 3]))
+    def test_pfirst(self, s, x, chunksize):
+
+        def predicate(i):
+            return i > x
+
+        self.assertEqual(pfirst(predicate, s, workers=4, chunksize=chunksize, executor="thread"), first(predicate, s))
+        found = [Just(i) for i in s if i > x] or [Nothing()]
+
+        self.assertIn(pfirst(predicate, s, ordered=False, executor="thread"), found)
+        self.assertEqual(pany(predicate, iter(s), chunksize=chunksize, executor="thread"), any(map(predicate, s)))
+        self.assertEqual(pall(predicate, s, chunksize=chunksize, executor="thread"), all(map(predicate, s)))
+
+    def test_pfirst_cancel(self):
+
+        # remaining work of infinite iterable is cancelled
+        self.assertEqual(pfirst(lambda i: i > 1000, counter(), workers=2, executor="thread"), Just(1001))
+        self.assertTrue(pany(even, counter(1), workers=2, executor="thread"))
+        self.assertFalse(pall(even, counter(), workers=2, executor="thread"))
+        # process pool demands picklable predicate
+        self.assertEqual(pfirst(even, range(1, 100), workers=2), first(even, range(1, 100)))
+
+    @skipUnless(numpy, "numpy is not installed")
+    # int64 products do not overflow for short arrays
+    @given(st.lists(st.integers(-50, 50), min_size=1, max_size=10), st.integers(-50, 50))
+    def test_dispatch_numpy(self, s, x):
+
+        ndarray = numpy.array(s)
+
+        for func in (add, mul, max, min, and_):
+            self.assertEqual(foldl(func, x, ndarray), reduce(func, s, x))
+            self.assertEqual(foldr_(func, ndarray), reduce(func, reversed(s)))
+            self.assertSequenceEqual(list(accumulate_(func, ndarray)), list(accumulate(s, func)))
+
+        self.assertEqual(count(s[0], ndarray), s.count(s[0]))
+        self.assertSequenceEqual(list(foldl(add, x, ndarray.reshape(len(s), 1))), [sum(s, x)])
+
+        # floats are summed pairwise
+        floats = numpy.array(s) / 10
+
+        self.assertEqual(foldl(add, x, floats), x + numpy.add.reduce(floats))
+        self.assertAlmostEqual(foldl(add, x, floats), reduce(add, floats, x))
+        self.assertEqual(foldl(add, 0.1, ndarray), fsum([0.1] + s))
+        # scalar items are compared elementwise only
+        self.assertRaises(ValueError, first, partial(eq, s + s), ndarray)
+        self.assertRaises(ValueError, count, s + s, ndarray)
+
+        # ufuncs are not used where their results differ from left folds
+        nans = numpy.array([1.0, numpy.nan] + s)
+        bools = numpy.array(s) > x
+        small = numpy.array(s, dtype=numpy.int8) * 3
+
+        self.assertEqual(foldl(max, x, nans), reduce(max, nans, x))
+        self.assertEqual(foldl_(min, nans), reduce(min, nans))
+        self.assertEqual(foldl(add, 0, small), reduce(add, small, 0))
+        self.assertEqual(foldl(mul, 1, small), reduce(mul, small, 1))
+        self.assertSequenceEqual(list(accumulate_(add, bools)), list(accumulate(bools, add)))
+        self.assertSequenceEqual(list(accumulate_(max, bools)), list(accumulate(bools, max)))
+
+
+if __name__ == '__main__':
+    main()
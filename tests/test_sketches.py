@@ -0,0 +1,139 @@
+from collections import Counter, deque
+from decimal import Decimal
+from fractions import Fraction
+from unittest import TestCase, main
+
+from hypothesis import given
+import hypothesis.strategies as st
+
+from fpe.functions import id_
+from fpe.sketches import approxDistinct, approxQuantiles, countMin, reservoirSample, topK
+
+
+def halves(s):
+    return s[:len(s) // 2], s[len(s) // 2:]
+
+
+class TestSketches(TestCase):
+
+    @given(st.lists(st.integers(-20, 20)), st.integers(1, 5))
+    def test_top_k(self, s, n):
+
+        expected = sorted(s, key=abs, reverse=True)[:n]
+        left, right = halves(s)
+
+        self.assertSequenceEqual(topK(n, abs, s).items, expected)
+        # merged sketches keep order of appearance of equal keys
+        self.assertSequenceEqual((topK(n, abs, left) & topK(n, abs, right)).items, expected)
+        self.assertRaises(AssertionError, topK, 0, abs, s)
+
+    @given(st.lists(st.integers(), unique=True), st.integers(1, 5), st.integers(0, 3))
+    def test_reservoir_sample(self, s, k, seed):
+
+        sample = reservoirSample(k, seed, s)
+        left, right = halves(s)
+        merged = reservoirSample(k, seed, left) & reservoirSample(k, seed + 1, right)
+
+        for sketch in (sample, merged):
+            self.assertEqual(len(sketch), len(s))
+            self.assertEqual(len(sketch.sample), min(k, len(s)))
+            # items are taken in order of appearance
+            self.assertSequenceEqual(sketch.sample, [i for i in s if i in sketch.sample])
+
+        self.assertSequenceEqual(reservoirSample(k, seed, s).sample, sample.sample)
+
+    def test_reservoir_uniform(self):
+
+        counts = Counter(i for seed in range(2000) for i in reservoirSample(2, seed, range(10)).sample)
+
+        self.assertSetEqual(set(counts), set(range(10)))
+        self.assertLess(max(counts.values()) - min(counts.values()), 150)
+
+    @given(st.lists(st.integers(0, 3000)))
+    def test_approx_distinct(self, s):
+
+        left, right = halves(s)
+        expected = len(set(s))
+        estimate = approxDistinct(s).estimate()
+
+        self.assertLessEqual(abs(estimate - expected), 0.05 * expected + 1)
+        # merge is exact, it is the same as sketch of all items
+        self.assertEqual((approxDistinct(left) & approxDistinct(right)).estimate(), estimate)
+        self.assertRaises(AssertionError, approxDistinct, s, 3)
+
+    def test_encoding(self):
+
+        # equal items are the same item, as in set
+        same = [1, 1.0, True, Fraction(1), Decimal(1), 1 + 0j]
+        values = [None, "1", b"1", 0.5, Fraction(1, 3), -1, 2 ** 70, (1,), [1], frozenset([1, 2]), {2, 1}, (1, "a")]
+
+        self.assertEqual(approxDistinct(same).estimate(), 1)
+        # frozenset and set of the same items are equal
+        self.assertEqual(approxDistinct(same + values).estimate(), len(values))
+        self.assertEqual(countMin(same)[True], len(same))
+        self.assertEqual(countMin([0.5, Fraction(1, 2), Decimal("0.5")])[0.5], 3)
+        # default repr depends on process
+        self.assertRaises(AssertionError, approxDistinct, [object()])
+        self.assertRaises(AssertionError, countMin, [(1, object())])
+        self.assertRaises(AssertionError, countMin, [{1: object()}])
+        self.assertRaises(AssertionError, countMin, [deque([object()])])
+        # mappings are encoded by items, regardless of their order
+        self.assertEqual(approxDistinct([{1: "a", 2: "b"}, {2: "b", 1: "a"}, {1: "a"}]).estimate(), 2)
+        self.assertEqual(countMin([{1: 1.0}, {True: 1}])[{1: 1}], 2)
+
+    @given(st.lists(st.integers(-50, 50), min_size=1), st.lists(st.integers(-50, 50)))
+    def test_update(self, s, appended):
+
+        merged = [approxDistinct(s), approxQuantiles(s, 50, 0), countMin(s, 64, 4), topK(3, abs, s)]
+
+        for sketch in merged:
+            sketch.update(appended)
+
+        whole = s + appended
+
+        self.assertEqual(merged[0].estimate(), approxDistinct(whole).estimate())
+        self.assertEqual(len(merged[1]), len(whole))
+        self.assertSequenceEqual(merged[1].quantiles([0, 1]), approxQuantiles(whole, 50, 0).quantiles([0, 1]))
+        self.assertEqual(merged[2][0], countMin(whole, 64, 4)[0])
+        self.assertSequenceEqual(merged[3].items, topK(3, abs, whole).items)
+
+        sample = reservoirSample(3, 0, s)
+        sample.update(appended)
+
+        self.assertEqual(len(sample), len(whole))
+        self.assertSequenceEqual(sample.sample, reservoirSample(3, 0, whole).sample)
+
+    @given(st.lists(st.integers(-1000, 1000), min_size=1, max_size=3000), st.floats(0, 1))
+    def test_approx_quantiles(self, s, q):
+
+        ordered = sorted(s)
+        left, right = halves(s)
+
+        for sketch in (approxQuantiles(s, 50, 0), approxQuantiles(left, 50, 0) & approxQuantiles(right, 50, 1)):
+            found = sketch.quantile(q)
+            # rank of found item is close to q
+            low, high = sum(i < found for i in ordered), sum(i <= found for i in ordered)
+
+            self.assertEqual(len(sketch), len(s))
+            self.assertIn(found, s)
+            self.assertLessEqual(max(0, low - q * len(s), q * len(s) - high), 0.1 * len(s) + 1)
+
+        self.assertSequenceEqual(approxQuantiles(ordered, 10 ** 4).quantiles([0, 1]), [ordered[0], ordered[-1]])
+        self.assertRaises(AssertionError, approxQuantiles([]).quantile, 0.5)
+
+    @given(st.lists(st.text("ab", max_size=3)), st.text("ab", max_size=3))
+    def test_count_min(self, s, x):
+
+        left, right = halves(s)
+        expected = s.count(x)
+
+        for sketch in (countMin(s, 64, 4), countMin(left, 64, 4) & countMin(right, 64, 4)):
+            self.assertGreaterEqual(sketch[x], expected)
+            self.assertLessEqual(sketch[x], expected + len(s) * 0.1 + 1)
+
+        self.assertEqual(countMin(map(id_, s))[x], expected)
+        self.assertRaises(AssertionError, lambda: countMin(s, 64, 4) & countMin(s, 32, 4))
+
+
+if __name__ == '__main__':
+    main()
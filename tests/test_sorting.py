@@ -0,0 +1,79 @@
+from itertools import groupby
+from operator import eq, itemgetter
+from unittest import TestCase, main
+
+from hypothesis import given, settings
+import hypothesis.strategies as st
+
+from fpe.misc.spill import SpillFile
+from fpe.sorting import externalSort, groupAllOn, groupBy, groupOn, mergeSorted, mergeSortedOn, sortOn
+
+
+pairs = st.lists(st.tuples(st.integers(-5, 5), st.integers()))
+
+
+class TestSorting(TestCase):
+
+    @given(pairs)
+    def test_sort_on(self, s):
+
+        calls = []
+
+        def key(x):
+            calls.append(x)
+            return x[0]
+
+        self.assertSequenceEqual(sortOn(key, s), sorted(s, key=itemgetter(0)))
+        self.assertEqual(len(calls), len(s))
+
+    @given(pairs)
+    def test_group(self, s):
+
+        keys = [i[0] for i in s]
+
+        self.assertSequenceEqual([[i[0] for i in group] for group in groupBy(lambda x, y: x[0] == y[0], s)],
+                                 [list(group) for _, group in groupby(keys)])
+        self.assertSequenceEqual(list(groupBy(eq)(iter(keys))), [list(group) for _, group in groupby(keys)])
+        self.assertSequenceEqual(list(groupOn(itemgetter(0), s)),
+                                 [(k, list(group)) for k, group in groupby(s, itemgetter(0))])
+
+        groups = groupAllOn(itemgetter(0), s)
+
+        self.assertSequenceEqual(list(groups), list(dict.fromkeys(keys)))
+        self.assertTrue(all(groups[k] == [i for i in s if i[0] == k] for k in groups))
+
+    @given(st.lists(st.lists(st.integers())))
+    def test_merge(self, s):
+
+        self.assertSequenceEqual(list(mergeSorted(map(sorted, s))), sorted(sum(s, [])))
+        self.assertSequenceEqual(list(mergeSortedOn(abs, [sorted(i, key=abs) for i in s])),
+                                 sorted(sum(s, []), key=abs))
+
+    @settings(deadline=None)
+    @given(pairs, st.integers(1, 8))
+    def test_external_sort(self, s, x):
+
+        calls = []
+
+        def key(y):
+            calls.append(y)
+            return y[0]
+
+        self.assertSequenceEqual(list(externalSort(key, iter(s), budget=x)), sorted(s, key=itemgetter(0)))
+        self.assertEqual(len(calls), len(s))
+        self.assertSequenceEqual(list(externalSort(itemgetter(0))(s)), sorted(s, key=itemgetter(0)))
+        self.assertRaises(AssertionError, externalSort, key, s, budget=0)
+
+    @given(st.lists(st.integers()))
+    def test_spill_file(self, s):
+
+        with SpillFile(s) as spill:
+            first, second = iter(spill), iter(spill)
+
+            self.assertEqual(len(spill), len(s))
+            self.assertSequenceEqual([i for pair in zip(first, second) for i in pair],
+                                     [i for i in s for _ in range(2)])
+
+
+if __name__ == '__main__':
+    main()
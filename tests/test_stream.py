@@ -0,0 +1,86 @@
+from functools import reduce
+from itertools import count
+from operator import add
+from unittest import TestCase, main
+
+from hypothesis import given
+import hypothesis.strategies as st
+
+from fpe.base import even, odd
+from fpe.builtins import map_
+from fpe.itertools import chunked, collect, drop, dropWhile, take, takeWhile
+from fpe.stream import Stream
+
+from .stuff import plus
+
+
+def sums(chunk):
+    # vectorized-like function which returns items for the whole chunk
+    return [sum(chunk)]
+
+
+# stages as pairs of Stream method name and curried fpe.itertools function
+stages = st.one_of(
+    st.integers(-5, 5).map(lambda x: ("map", (plus(x),), map_(plus(x)))),
+    st.sampled_from([even, odd]).map(lambda p: ("filter", (p,), lambda xs: filter(p, xs))),
+    st.integers(0, 10).map(lambda x: ("take", (x,), take(x))),
+    st.integers(0, 10).map(lambda x: ("drop", (x,), drop(x))),
+    st.integers(-10, 10).map(lambda x: ("takeWhile", (lambda y: y < x,), takeWhile(lambda y: y < x))),
+    st.integers(-10, 10).map(lambda x: ("dropWhile", (lambda y: y < x,), dropWhile(lambda y: y < x))),
+    st.just(("collect", (even, plus(1)), collect(even, plus(1)))),
+    st.integers(1, 4).map(lambda x: ("mapChunks", (sums, x), lambda xs: map(sum, chunked(x, xs)))),
+)
+
+
+def reference(source, pipeline):
+    return reduce(lambda acc, stage: stage[2](acc), pipeline, iter(source))
+
+
+def build(source, pipeline):
+    return reduce(lambda stream, stage: getattr(stream, stage[0])(*stage[1]), pipeline, Stream(source))
+
+
+class TestStream(TestCase):
+
+    @given(st.lists(st.integers(-20, 20)), st.lists(stages, max_size=6))
+    def test_stream(self, s, pipeline):
+
+        stream = build(s, pipeline)
+
+        self.assertSequenceEqual(list(stream), list(reference(s, pipeline)))
+        # stream may be reused
+        self.assertSequenceEqual(list(stream), list(reference(s, pipeline)))
+        self.assertEqual(stream.fold(add, 0), sum(reference(s, pipeline)))
+
+    @given(st.lists(st.integers(-20, 20)), st.lists(stages, max_size=6))
+    def test_apply(self, s, pipeline):
+
+        stream = reduce(lambda acc, stage: acc.apply(stage[2]), pipeline, Stream(s))
+
+        self.assertSequenceEqual(list(stream), list(reference(s, pipeline)))
+
+    def test_lazy(self):
+
+        source = count()
+
+        self.assertSequenceEqual(list(Stream(source).filter(even).take(3)), [0, 2, 4])
+        # not any extra item is consumed after the last taken one
+        self.assertEqual(next(source), 5)
+        self.assertEqual(Stream(count()).takeWhile(lambda x: x < 100).fold(add, 0), sum(range(100)))
+
+    def test_plan(self):
+
+        stream = Stream([]).apply(collect(even, plus(1))).take(5).mapChunks(sums, 10).apply(chunked(2)).filter(odd)
+
+        self.assertEqual(stream.plan(), "\n".join((
+            "fused loop: collect(even, Wrapped: <plus>) -> take(5)",
+            "chunks of 10: mapChunks(sums)",
+            "not fused: apply(Wrapped: <chunked>)",
+            "fused loop: filter(odd)")))
+        self.assertEqual(Stream([]).plan(), "fused loop: <no stages>")
+        self.assertRaises(AssertionError, Stream([]).mapChunks, sum, 0)
+        self.assertRaises(AssertionError, Stream([]).take, -1)
+
+
+if __name__ == '__main__':
+    main()
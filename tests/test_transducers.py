@@ -0,0 +1,88 @@
+from functools import reduce
+from io import StringIO
+from itertools import count, groupby, islice
+from operator import add
+from unittest import TestCase, main
+
+from hypothesis import given
+import hypothesis.strategies as st
+
+from fpe.base import even, odd
+from fpe.itertools import chunked
+from fpe.monoid import Sum
+from fpe.seqtools import foldl
+from fpe.stream import Stream
+from fpe.transducers import atransduce, eduction, into, tcat, tdedupe, tfilter, tmap, tpartition, transduce, ttake
+
+from .stuff import plus, run
+
+
+# transducers with equal functions of iterable
+xforms = st.one_of(
+    st.integers(-5, 5).map(lambda x: (tmap(plus(x)), lambda xs: map(plus(x), xs))),
+    st.sampled_from([even, odd]).map(lambda p: (tfilter(p), lambda xs: filter(p, xs))),
+    st.integers(0, 10).map(lambda x: (ttake(x), lambda xs: islice(xs, x))),
+    st.just((tdedupe, lambda xs: (k for k, _ in groupby(xs)))),
+    st.integers(1, 4).map(lambda x: (tpartition(x) * tmap(sum), lambda xs: map(sum, chunked(x, xs)))),
+    st.integers(1, 4).map(lambda x: (tpartition(x) * tcat, lambda xs: xs)),
+)
+
+
+def compose(pipeline):
+    xform = reduce(lambda acc, x: acc * x[0], pipeline[1:], pipeline[0][0])
+
+    return xform, lambda xs: reduce(lambda acc, x: x[1](acc), pipeline, iter(xs))
+
+
+class TestTransducers(TestCase):
+
+    @given(st.lists(st.integers(-20, 20)), st.lists(xforms, min_size=1, max_size=5))
+    def test_transduce(self, s, pipeline):
+
+        xform, reference = compose(pipeline)
+        expected = list(reference(s))
+
+        self.assertEqual(transduce(xform, add, 0, s), sum(expected))
+        self.assertSequenceEqual(into([], xform, s), expected)
+        self.assertSequenceEqual(list(eduction(xform, iter(s))), expected)
+        # the same transducer runs over stream and async source
+        self.assertSequenceEqual(list(Stream(s).apply(eduction(xform))), expected)
+        self.assertEqual(run(atransduce(xform, add, 0, s)), sum(expected))
+
+    @given(st.lists(st.integers(-20, 20)))
+    def test_sinks(self, s):
+
+        self.assertEqual(into(set(), tmap(abs), s), set(map(abs, s)))
+        self.assertEqual(into(Sum, tmap(Sum), s), Sum(sum(s)))
+        self.assertEqual(into(Sum(1), tmap(Sum), s), Sum(sum(s) + 1))
+        self.assertEqual(into(StringIO(), tmap("{} ".format), s).getvalue(), "".join(map("{} ".format, s)))
+        self.assertRaises(AssertionError, into, 1, tmap(abs), s)
+
+    def test_early_termination(self):
+
+        source = count()
+
+        self.assertSequenceEqual(into([], tfilter(even) * ttake(3), source), [0, 2, 4])
+        self.assertEqual(next(source), 5)
+        self.assertSequenceEqual(into([], tpartition(2) * tcat * ttake(3), count()), [0, 1, 2])
+        # partial partition is flushed after reduction is stopped
+        self.assertSequenceEqual(into([], ttake(3) * tpartition(2), count()), [[0, 1], [2]])
+        self.assertSequenceEqual(list(islice(eduction(tmap(plus(1)), count()), 3)), [1, 2, 3])
+        self.assertRaises(AssertionError, ttake, -1, add)
+        self.assertRaises(AssertionError, tpartition, 0, add)
+
+    def test_reducer_reuse(self):
+
+        taking = ttake(2)(add)
+        deduping = tdedupe(add)
+        partitioning = tpartition(2)(lambda acc, item: acc + [item])
+
+        # reducer is reused after completion
+        for _ in range(2):
+            self.assertEqual(taking.complete(foldl(taking, 0, range(1, 5))), 3)
+            self.assertEqual(deduping.complete(foldl(deduping, 0, [1, 1, 2, 1])), 4)
+            self.assertSequenceEqual(partitioning.complete(foldl(partitioning, [], range(3))), [[0, 1], [2]])
+
+
+if __name__ == '__main__':
+    main()